@@ -188,8 +188,8 @@ def demo_visualization() -> None:
 
     if report.circular_dependencies:
         print("\n⚠️  发现循环依赖:")
-        for dep1, dep2 in report.circular_dependencies:
-            print(f"  - {dep1} <-> {dep2}")
+        for cycle in report.circular_dependencies:
+            print(f"  - {' <-> '.join(str(dep) for dep in cycle)}")
 
     if report.unresolvable_services:
         print("\n⚠️  无法解析的服务:")
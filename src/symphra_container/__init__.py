@@ -31,55 +31,138 @@
 完整文档见: https://getaix.github.io/symphra-container
 """
 
-from .circular import CircularDependencyDetector, Lazy, LazyProxy
-from .container import Container, Scope, ServiceRegistration
-from .decorators import (
-    ServiceMetadata,
-    auto_register,
-    factory,
-    get_service_metadata,
-    injectable,
-    is_injectable,
-    scoped,
-    singleton,
-    transient,
-)
-from .exceptions import (
-    CircularDependencyError,
-    ContainerException,
-    FactoryError,
-    InterceptorError,
-    InvalidConfigurationError,
-    OptionalDependencyError,
-    RegistrationError,
-    ResolutionError,
-    ScopeNotActiveError,
-    ServiceNotFoundError,
-    TypeMismatchError,
-)
-from .generics import GenericKey, is_generic_type, register_generic, resolve_generic
-from .injector import ConstructorInjector, DependencyInfo
-from .lifetime_manager import LifetimeManager, ScopedStore, SingletonStore
-from .performance import (
-    PerformanceMetrics,
-    ResolutionTimer,
-    ServiceKeyIndex,
-)
-from .types import (
-    AsyncDisposable,
-    Disposable,
-    Injected,
-    InjectionMarker,
-    Lifetime,
-    ServiceKey,
-)
-from .visualization import (
-    ContainerDiagnostic,
-    debug_resolution,
-    diagnose_container,
-    print_dependency_graph,
-    visualize_container,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .container import Container, Scope
+from .types import Injected, Lifetime
+
+if TYPE_CHECKING:
+    from .circular import CircularDependencyDetector, Lazy, LazyProxy
+    from .container import ServiceRegistration, clear_all_caches
+    from .decorators import (
+        ServiceMetadata,
+        auto_register,
+        factory,
+        get_service_metadata,
+        injectable,
+        is_injectable,
+        scoped,
+        singleton,
+        transient,
+    )
+    from .exceptions import (
+        CircularDependencyError,
+        ContainerException,
+        FactoryError,
+        InterceptorError,
+        InvalidConfigurationError,
+        OptionalDependencyError,
+        RegistrationError,
+        ResolutionError,
+        ScopeNotActiveError,
+        ServiceNotFoundError,
+        TypeMismatchError,
+    )
+    from .generics import GenericKey, is_generic_type, register_generic, resolve_generic
+    from .injector import ConstructorInjector, DependencyInfo
+    from .lifetime_manager import LifetimeManager, ScopedStore, SingletonStore
+    from .performance import (
+        PerformanceMetrics,
+        ResolutionTimer,
+        ServiceKeyIndex,
+    )
+    from .types import (
+        AsyncDisposable,
+        Disposable,
+        InjectionMarker,
+        ServiceKey,
+    )
+    from .visualization import (
+        ContainerDiagnostic,
+        debug_resolution,
+        diagnose_container,
+        print_dependency_graph,
+        visualize_container,
+    )
+
+# 延迟导出: 名称 -> 所在子模块, 首次访问时才导入(PEP 562)
+# 只使用 Container / Lifetime 的应用无需加载可视化,泛型等模块
+_LAZY_EXPORTS: dict[str, str] = {
+    "CircularDependencyDetector": ".circular",
+    "Lazy": ".circular",
+    "LazyProxy": ".circular",
+    "ServiceRegistration": ".container",
+    "clear_all_caches": ".container",
+    "ServiceMetadata": ".decorators",
+    "auto_register": ".decorators",
+    "factory": ".decorators",
+    "get_service_metadata": ".decorators",
+    "injectable": ".decorators",
+    "is_injectable": ".decorators",
+    "scoped": ".decorators",
+    "singleton": ".decorators",
+    "transient": ".decorators",
+    "CircularDependencyError": ".exceptions",
+    "ContainerException": ".exceptions",
+    "FactoryError": ".exceptions",
+    "InterceptorError": ".exceptions",
+    "InvalidConfigurationError": ".exceptions",
+    "OptionalDependencyError": ".exceptions",
+    "RegistrationError": ".exceptions",
+    "ResolutionError": ".exceptions",
+    "ScopeNotActiveError": ".exceptions",
+    "ServiceNotFoundError": ".exceptions",
+    "TypeMismatchError": ".exceptions",
+    "GenericKey": ".generics",
+    "is_generic_type": ".generics",
+    "register_generic": ".generics",
+    "resolve_generic": ".generics",
+    "ConstructorInjector": ".injector",
+    "DependencyInfo": ".injector",
+    "LifetimeManager": ".lifetime_manager",
+    "ScopedStore": ".lifetime_manager",
+    "SingletonStore": ".lifetime_manager",
+    "PerformanceMetrics": ".performance",
+    "ResolutionTimer": ".performance",
+    "ServiceKeyIndex": ".performance",
+    "AsyncDisposable": ".types",
+    "Disposable": ".types",
+    "InjectionMarker": ".types",
+    "ServiceKey": ".types",
+    "ContainerDiagnostic": ".visualization",
+    "debug_resolution": ".visualization",
+    "diagnose_container": ".visualization",
+    "print_dependency_graph": ".visualization",
+    "visualize_container": ".visualization",
+}
+
+# 可通过属性访问的延迟子模块, 例如 symphra_container.visualization
+_LAZY_SUBMODULES = frozenset({"generics", "visualization"})
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入延迟导出的名称(PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    # 缓存到模块命名空间, 之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """列出模块属性, 包含尚未导入的延迟导出."""
+    return sorted(set(globals()) | set(__all__))
+
 
 # 为了向后兼容, AsyncContainer 作为 Container 的别名
 # ⚠️ DEPRECATED: 请直接使用 Container, 它现在同时支持同步和异步
@@ -134,6 +217,7 @@ __all__ = [
     "SingletonStore",
     "TypeMismatchError",
     "auto_register",
+    "clear_all_caches",
     # Visualization & Debugging
     "debug_resolution",
     "diagnose_container",
@@ -0,0 +1,87 @@
+"""依赖图强连通分量的 numba 加速内核.
+
+⚠️ 可选功能: 需要安装 pip install symphra-container[accel]
+
+仅由 _scc 模块在依赖图足够大且 numba 可用时导入,
+内核只使用整数数组与 while 循环, 以便被 numba 编译为原生代码.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def tarjan_scc_kernel(succ_flat: np.ndarray, succ_off: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    """迭代式 Tarjan 强连通分量算法(CSR 邻接表).
+
+    Args:
+        succ_flat: 扁平化的后继节点数组(int32)
+        succ_off: 节点 i 的后继位于 succ_flat[succ_off[i]:succ_off[i + 1]](int32, 长度 n + 1)
+
+    Returns:
+        (每个节点所属分量编号, 每个节点的发现序号, 分量数量)
+    """
+    n = succ_off.shape[0] - 1
+    indices = np.full(n, -1, np.int32)
+    lowlinks = np.zeros(n, np.int32)
+    on_stack = np.zeros(n, np.uint8)
+    stack = np.empty(n, np.int32)
+    call_node = np.empty(n, np.int32)
+    call_pos = np.empty(n, np.int32)
+    component_of = np.full(n, -1, np.int32)
+    stack_top = 0
+    component_count = 0
+    index = 0
+
+    for root in range(n):
+        if indices[root] != -1:
+            continue
+
+        indices[root] = index
+        lowlinks[root] = index
+        index += 1
+        stack[stack_top] = root
+        stack_top += 1
+        on_stack[root] = 1
+        call_node[0] = root
+        call_pos[0] = succ_off[root]
+        call_top = 1
+
+        while call_top > 0:
+            node = call_node[call_top - 1]
+            pos = call_pos[call_top - 1]
+
+            if pos < succ_off[node + 1]:
+                call_pos[call_top - 1] = pos + 1
+                succ = succ_flat[pos]
+                if indices[succ] == -1:
+                    indices[succ] = index
+                    lowlinks[succ] = index
+                    index += 1
+                    stack[stack_top] = succ
+                    stack_top += 1
+                    on_stack[succ] = 1
+                    call_node[call_top] = succ
+                    call_pos[call_top] = succ_off[succ]
+                    call_top += 1
+                elif on_stack[succ] == 1 and indices[succ] < lowlinks[node]:
+                    lowlinks[node] = indices[succ]
+                continue
+
+            call_top -= 1
+            if call_top > 0:
+                parent = call_node[call_top - 1]
+                if lowlinks[node] < lowlinks[parent]:
+                    lowlinks[parent] = lowlinks[node]
+
+            if lowlinks[node] == indices[node]:
+                while True:
+                    stack_top -= 1
+                    member = stack[stack_top]
+                    on_stack[member] = 0
+                    component_of[member] = component_count
+                    if member == node:
+                        break
+                component_count += 1
+
+    return component_of, indices, component_count
@@ -0,0 +1,192 @@
+"""依赖图强连通分量计算.
+
+container.freeze() 与 visualization 的循环依赖诊断共用的内部实现:
+把服务依赖关系转换为整数编号的 CSR 邻接表, 再用迭代式 Tarjan 算法求强连通分量.
+本模块不导入 visualization, 冻结容器时不会加载诊断工具.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+
+def build_dependency_graph(
+    keys: list[Hashable], dependencies_of: Callable[[Any], Iterable[Hashable]]
+) -> tuple[list[int], list[range]]:
+    """将服务依赖关系转换为以整数编号的 CSR 邻接表.
+
+    不在 keys 中的依赖(未注册的服务)被忽略.
+
+    Args:
+        keys: 服务键列表, 节点编号即其下标
+        dependencies_of: 返回服务键依赖的函数
+
+    Returns:
+        (扁平化的后继节点数组, 每个节点在后继数组中的区间)
+    """
+    key_ids = {key: i for i, key in enumerate(keys)}
+
+    all_succs: list[int] = []
+    succ_ranges: list[range] = []
+    for key in keys:
+        start = len(all_succs)
+        for dep in dependencies_of(key):
+            dep_id = key_ids.get(dep)
+            if dep_id is not None:
+                all_succs.append(dep_id)
+        succ_ranges.append(range(start, len(all_succs)))
+
+    return all_succs, succ_ranges
+
+
+def cyclic_components(all_succs: list[int], succ_ranges: list[range]) -> Iterator[list[int]]:
+    """依次产出包含循环的强连通分量.
+
+    两个及以上节点的分量, 或存在自依赖的单个节点, 视为循环.
+
+    Args:
+        all_succs: 扁平化的后继节点数组
+        succ_ranges: 每个节点在 all_succs 中的区间
+
+    Yields:
+        循环分量中的节点编号(按发现顺序)
+    """
+    for component in tarjan_scc(all_succs, succ_ranges):
+        node = component[0]
+        succs = succ_ranges[node]
+        if len(component) > 1 or node in all_succs[succs.start : succs.stop]:
+            yield component
+
+
+class _Frame(NamedTuple):
+    """Tarjan 迭代遍历中的调用帧."""
+
+    node: int
+    succ_pos: int
+    succ_end: int
+
+
+# 依赖图节点数达到该阈值时才使用 numba 内核(JIT 编译开销只在大图上划算)
+NUMBA_SCC_THRESHOLD = 2048
+
+# numba 编译的 SCC 内核: None 表示尚未加载, False 表示不可用
+_numba_scc_kernel: Any = None
+
+
+def load_numba_scc_kernel() -> Any:
+    """加载 numba 编译的 SCC 内核, 不可用时只警告一次并返回 None."""
+    global _numba_scc_kernel  # noqa: PLW0603
+
+    if _numba_scc_kernel is None:
+        try:
+            from numba import njit
+
+            from ._numba_scc import tarjan_scc_kernel
+
+            # cache=True: 编译结果按源码与字节码缓存到磁盘, 模块重载后可直接复用
+            _numba_scc_kernel = njit(cache=True)(tarjan_scc_kernel)
+        except Exception as e:  # noqa: BLE001
+            warnings.warn(
+                f"numba is unavailable ({e}), falling back to the pure-Python SCC pass. "
+                "Install it with: pip install symphra-container[accel]",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+            _numba_scc_kernel = False
+
+    return _numba_scc_kernel or None
+
+
+def tarjan_scc_numba(kernel: Any, all_succs: list[int], succ_ranges: list[range]) -> list[list[int]]:
+    """使用 numba 内核计算强连通分量, 返回格式与纯 Python 实现一致."""
+    import numpy as np
+
+    succ_flat = np.asarray(all_succs, dtype=np.int32)
+    succ_off = np.fromiter((r.start for r in succ_ranges), dtype=np.int32, count=len(succ_ranges))
+    succ_off = np.append(succ_off, np.int32(len(all_succs)))
+
+    component_of, indices, component_count = kernel(succ_flat, succ_off)
+
+    components: list[list[int]] = [[] for _ in range(component_count)]
+    for node in np.argsort(indices, kind="stable").tolist():
+        components[component_of[node]].append(node)
+    return components
+
+
+def tarjan_scc(all_succs: list[int], succ_ranges: list[range]) -> list[list[int]]:
+    """迭代式 Tarjan 强连通分量算法, 时间复杂度 O(V+E).
+
+    大图在安装了 numba 时交由编译后的内核处理, 否则使用纯 Python 实现.
+
+    Args:
+        all_succs: 扁平化的后继节点数组
+        succ_ranges: 每个节点在 all_succs 中的区间
+
+    Returns:
+        强连通分量列表(按发现顺序排列节点)
+    """
+    n = len(succ_ranges)
+    if n >= NUMBA_SCC_THRESHOLD:
+        kernel = load_numba_scc_kernel()
+        if kernel is not None:
+            return tarjan_scc_numba(kernel, all_succs, succ_ranges)
+
+    indices = [-1] * n
+    lowlinks = [0] * n
+    on_stack = bytearray(n)
+    stack: list[int] = []
+    components: list[list[int]] = []
+    index = 0
+
+    for root in range(n):
+        if indices[root] != -1:
+            continue
+
+        indices[root] = lowlinks[root] = index
+        index += 1
+        stack.append(root)
+        on_stack[root] = 1
+        succs = succ_ranges[root]
+        call_stack = [_Frame(root, succs.start, succs.stop)]
+
+        while call_stack:
+            node, succ_pos, succ_end = call_stack[-1]
+
+            if succ_pos < succ_end:
+                call_stack[-1] = _Frame(node, succ_pos + 1, succ_end)
+                succ = all_succs[succ_pos]
+                if indices[succ] == -1:
+                    # 未访问: 下探
+                    indices[succ] = lowlinks[succ] = index
+                    index += 1
+                    stack.append(succ)
+                    on_stack[succ] = 1
+                    succs = succ_ranges[succ]
+                    call_stack.append(_Frame(succ, succs.start, succs.stop))
+                elif on_stack[succ] and indices[succ] < lowlinks[node]:
+                    lowlinks[node] = indices[succ]
+                continue
+
+            # 当前节点的后继已全部处理完毕: 回溯
+            call_stack.pop()
+            if call_stack:
+                parent = call_stack[-1].node
+                if lowlinks[node] < lowlinks[parent]:
+                    lowlinks[parent] = lowlinks[node]
+
+            if lowlinks[node] == indices[node]:
+                component: list[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component.append(member)
+                    if member == node:
+                        break
+                component.reverse()
+                components.append(component)
+
+    return components
@@ -9,11 +9,12 @@
 
 from __future__ import annotations
 
+import operator
 import uuid
-from typing import TYPE_CHECKING, Any
-
-if TYPE_CHECKING:
-    from collections.abc import Callable
+import weakref
+from array import array
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from .exceptions import CircularDependencyError
 
@@ -25,50 +26,105 @@ class CircularDependencyDetector:
 
     Attributes:
         _resolution_stack: 当前解析的服务栈
-        _visited: 已访问的服务集合
+        _visited: 当前解析栈中的服务集合(用于 O(1) 循环检测)
+        _visited_bits: 位图模式下的访问标记(仅 use_bitmap=True 时使用)
         _recursion_limit: 最大递归深度(防止无限循环)
+        _depth: 当前解析深度
     """
 
-    def __init__(self, max_depth: int = 1000) -> None:
+    __slots__ = (
+        "_chain_cache",
+        "_depth",
+        "_recursion_limit",
+        "_resolution_stack",
+        "_visited",
+        "_visited_bits",
+    )
+
+    def __init__(self, max_depth: int = 1000, use_bitmap: bool = False, capacity: int = 1024) -> None:
         """初始化循环依赖检测器.
 
         Args:
             max_depth: 最大递归深度,默认 1000
+            use_bitmap: 是否使用位图模式. 启用后服务键必须是 [0, capacity) 范围内的整数 ID,
+                访问标记使用 bytearray 位图, 不再进行哈希
+            capacity: 位图模式下整数 ID 的上限, 默认 1024
         """
-        self._resolution_stack: list[Any] = []
+        self._resolution_stack: list[Any] | array[int]
         self._visited: set[Any] = set()
+        self._visited_bits: bytearray | None
+        if use_bitmap:
+            # 性能优化: 稠密整数 ID 用预分配的位图和定长栈跟踪, 入栈/出栈无哈希和扩容
+            self._visited_bits = bytearray(capacity)
+            self._resolution_stack = array("i", bytes(capacity * array("i").itemsize))
+            max_depth = min(max_depth, capacity)
+        else:
+            self._visited_bits = None
+            self._resolution_stack = []
         self._recursion_limit = max_depth
+        # 当前解析深度, 与解析栈长度保持一致
+        self._depth = 0
+        # 依赖链快照缓存, 解析栈变化时失效
+        self._chain_cache: tuple[Any, ...] | None = None
 
     # 保留先前实现的 push/pop 接口
     def push(self, key: Any) -> None:
         """压入解析栈并检测循环.
 
         Args:
-            key: 当前正在解析的服务键
+            key: 当前正在解析的服务键(位图模式下为整数 ID)
 
         Raises:
             CircularDependencyError: 检测到循环依赖
+            ValueError: 位图模式下服务键不是 [0, capacity) 范围内的整数
         """
         # 防止无限递归
-        if len(self._resolution_stack) >= self._recursion_limit:
-            raise CircularDependencyError(key, self._resolution_stack.copy())
-
-        # 如果重复解析同一个键,说明存在循环依赖
-        if key in self._resolution_stack:
-            raise CircularDependencyError(key, self._resolution_stack.copy())
-
-        self._resolution_stack.append(key)
-        self._visited.add(key)
+        if self._depth >= self._recursion_limit:
+            raise CircularDependencyError(key, self.chain)
+
+        bits = self._visited_bits
+        if bits is not None:
+            # 负数会从尾部别名到其他 ID, 越界会抛出裸 IndexError, 入栈前统一校验
+            if not isinstance(key, int) or not 0 <= key < len(bits):
+                msg = f"Bitmap mode requires integer keys in [0, {len(bits)}), got {key!r}"
+                raise ValueError(msg)
+            if bits[key]:
+                raise CircularDependencyError(key, self.chain)
+            bits[key] = 1
+            self._resolution_stack[self._depth] = key
+        else:
+            # 如果重复解析同一个键,说明存在循环依赖
+            # 性能优化: 使用集合做 O(1) 成员检测,避免每次线性扫描解析栈
+            if key in self._visited:
+                raise CircularDependencyError(key, self.chain)
+            self._resolution_stack.append(key)
+            self._visited.add(key)
+
+        self._depth += 1
+        self._chain_cache = None
 
     def pop(self) -> None:
         """弹出解析栈顶元素."""
-        if self._resolution_stack:
-            self._resolution_stack.pop()
+        if self._depth > 0:
+            self._depth -= 1
+            bits = self._visited_bits
+            if bits is not None:
+                bits[self._resolution_stack[self._depth]] = 0
+            else:
+                self._visited.discard(self._resolution_stack.pop())
+            self._chain_cache = None
 
     def clear(self) -> None:
         """清空解析状态."""
-        self._resolution_stack.clear()
-        self._visited.clear()
+        bits = self._visited_bits
+        if bits is not None:
+            for key in self._resolution_stack[: self._depth]:
+                bits[key] = 0
+        else:
+            self._resolution_stack.clear()
+            self._visited.clear()
+        self._depth = 0
+        self._chain_cache = None
 
     def reset(self) -> None:
         """重置检测器状态(与 clear 相同,用于测试兼容性)."""
@@ -77,12 +133,20 @@ class CircularDependencyDetector:
     @property
     def current_depth(self) -> int:
         """返回当前解析深度."""
-        return len(self._resolution_stack)
+        return self._depth
 
     @property
-    def chain(self) -> list[Any]:
-        """返回当前依赖链的副本."""
-        return self._resolution_stack.copy()
+    def chain(self) -> tuple[Any, ...]:
+        """返回当前依赖链的只读快照.
+
+        快照在解析栈未变化期间被复用, 只在 push/pop 后重新生成.
+        """
+        if self._chain_cache is None:
+            if self._visited_bits is not None:
+                self._chain_cache = tuple(self._resolution_stack[: self._depth])
+            else:
+                self._chain_cache = tuple(self._resolution_stack)
+        return self._chain_cache
 
     # 与容器的接口保持兼容
     def enter_resolution(self, key: Any) -> None:
@@ -104,15 +168,14 @@ class LazyTypeMarker:
         inner_type: 被延迟解析的真实服务类型
     """
 
+    __slots__ = ("inner_type",)
+
     def __init__(self, inner_type: Any) -> None:
         self.inner_type = inner_type
 
     def __repr__(self) -> str:
-        try:
-            name = getattr(self.inner_type, "__name__", repr(self.inner_type))
-        except Exception:  # noqa: BLE001
-            name = repr(self.inner_type)
-        return f"Lazy[{name}]"
+        name = getattr(self.inner_type, "__name__", None)
+        return f"Lazy[{name if name else repr(self.inner_type)}]"
 
 
 class LazyProxy:
@@ -144,13 +207,19 @@ class LazyProxy:
     Attributes:
         _factory: 创建真实对象的工厂函数
         _cached_instance: 缓存的真实对象
-        _proxy_id: 代理 ID
+        _proxy_id: 代理 ID(首次 repr 时才生成)
     """
 
+    __slots__ = ("_cached_instance", "_factory", "_proxy_id")
+
+    # 代理自身的属性名, 设置时不委托给真实对象
+    _RESERVED: ClassVar[frozenset[str]] = frozenset({"_factory", "_cached_instance", "_proxy_id"})
+
     def __init__(self, factory: Callable[[], Any]) -> None:
         self._factory = factory
         self._cached_instance: Any | None = None
-        self._proxy_id = uuid.uuid4()
+        # 性能优化: uuid4 需要读取系统熵, 推迟到 __repr__ 真正需要时再生成
+        self._proxy_id: uuid.UUID | None = None
 
     @classmethod
     def __class_getitem__(cls, item: Any) -> LazyTypeMarker:  # type: ignore[override]
@@ -162,30 +231,42 @@ class LazyProxy:
         return LazyTypeMarker(item)
 
     def _get_real_instance(self) -> Any:
-        """获取真实对象(带缓存)."""
+        """获取真实对象(带缓存).
+
+        首次解析后将代理切换为针对真实类型的已解析代理类,
+        之后的访问直接委托给缓存实例, 不再经过空值检查.
+        """
         if self._cached_instance is None:
-            self._cached_instance = self._factory()
+            real = self._factory()
+            self._cached_instance = real
+            object.__setattr__(self, "__class__", _resolved_proxy_class(type(real)))
         return self._cached_instance
 
     def __call__(self) -> Any:
         """调用代理以获取真实对象."""
-        return self._get_real_instance()
+        return LazyProxy._get_real_instance(self)
+
+    def __getattribute__(self, name: str) -> Any:
+        """代理属性访问到真实对象.
 
-    def __getattr__(self, name: str) -> Any:
-        """代理属性访问到真实对象."""
-        real = self._get_real_instance()
-        return getattr(real, name)
+        除代理自身的属性外, 所有访问直接委托给真实对象,
+        不再先在代理上查找失败后才回退到 __getattr__.
+        """
+        if name in _PROXY_OWN_ATTRIBUTES:
+            return object.__getattribute__(self, name)
+        return getattr(LazyProxy._get_real_instance(self), name)
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in {"_factory", "_cached_instance", "_proxy_id"}:
+        if name in LazyProxy._RESERVED:
             object.__setattr__(self, name, value)
             return
-        real = self._get_real_instance()
-        setattr(real, name, value)
+        setattr(LazyProxy._get_real_instance(self), name, value)
 
     def __repr__(self) -> str:
         """返回字符串表示."""
-        return f"LazyProxy({object.__getattribute__(self, '_proxy_id')})"
+        if self._proxy_id is None:
+            self._proxy_id = uuid.uuid4()
+        return f"LazyProxy({self._proxy_id})"
 
     def __str__(self) -> str:
         """返回字符串表示."""
@@ -193,24 +274,123 @@ class LazyProxy:
 
     def __getitem__(self, key: Any) -> Any:
         """代理下标访问到真实对象."""
-        real = self._get_real_instance()
+        real = LazyProxy._get_real_instance(self)
         return real[key]
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """代理下标设置到真实对象."""
-        real = self._get_real_instance()
+        real = LazyProxy._get_real_instance(self)
         real[key] = value
 
     def __len__(self) -> int:
         """代理长度计算到真实对象."""
-        real = self._get_real_instance()
+        real = LazyProxy._get_real_instance(self)
         return len(real)
 
     def __contains__(self, item: Any) -> bool:
         """代理包含检查到真实对象."""
-        real = self._get_real_instance()
+        real = LazyProxy._get_real_instance(self)
         return item in real
 
+    def __delitem__(self, key: Any) -> None:
+        """代理下标删除到真实对象."""
+        real = LazyProxy._get_real_instance(self)
+        del real[key]
+
+    def __bool__(self) -> bool:
+        """代理真值测试到真实对象, 真实对象没有 __len__ 时同样适用."""
+        real = LazyProxy._get_real_instance(self)
+        return bool(real)
+
+    def __iter__(self) -> Any:
+        """代理迭代到真实对象."""
+        real = LazyProxy._get_real_instance(self)
+        return iter(real)
+
+
+# LazyProxy 自身的属性, 已解析代理不会将其委托给真实对象
+_PROXY_OWN_ATTRIBUTES = frozenset(
+    {"_factory", "_cached_instance", "_proxy_id", "_get_real_instance", "__class__"},
+)
+
+# 直接读取 _cached_instance 槽位, 比 object.__getattribute__ 少一次按名称查找
+_cached_instance_of = LazyProxy._cached_instance.__get__  # type: ignore[attr-defined]
+
+# 已解析代理类缓存: 真实类型 -> 代理子类
+# 弱引用键, 动态创建的类型被回收后对应的代理类随之释放, 缓存不会无界增长
+_RESOLVED_PROXY_CLASSES: weakref.WeakKeyDictionary[type, type[LazyProxy]] = weakref.WeakKeyDictionary()
+
+
+def _resolved_getattribute(self: LazyProxy, name: str) -> Any:
+    if name in _PROXY_OWN_ATTRIBUTES:
+        return object.__getattribute__(self, name)
+    return getattr(_cached_instance_of(self), name)
+
+
+def _resolved_setattr(self: LazyProxy, name: str, value: Any) -> None:
+    if name in _PROXY_OWN_ATTRIBUTES:
+        object.__setattr__(self, name, value)
+        return
+    setattr(_cached_instance_of(self), name, value)
+
+
+def _resolved_real_instance(self: LazyProxy) -> Any:
+    return _cached_instance_of(self)
+
+
+def _delegate_to_instance(operation: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """生成将特殊方法直接转发给缓存实例的函数."""
+
+    def method(self: LazyProxy, *args: Any) -> Any:
+        return operation(_cached_instance_of(self), *args)
+
+    method.__name__ = method.__qualname__ = name
+    return method
+
+
+# 已解析代理的特殊方法委托表, 模块加载时一次性生成, 所有已解析代理类共享
+# 这些方法通过类型槽位调用, 直接转发给 operator/内置函数, 不经过 getattr
+_DELEGATED_DUNDERS: dict[str, Callable[..., Any]] = {
+    name: _delegate_to_instance(operation, name)
+    for name, operation in (
+        ("__bool__", bool),
+        ("__len__", len),
+        ("__iter__", iter),
+        ("__contains__", operator.contains),
+        ("__getitem__", operator.getitem),
+        ("__setitem__", operator.setitem),
+        ("__delitem__", operator.delitem),
+    )
+}
+
+
+def _resolved_proxy_class(real_type: type) -> type[LazyProxy]:
+    """获取(并缓存)针对真实类型的已解析代理类.
+
+    Args:
+        real_type: 真实对象的类型
+
+    Returns:
+        LazyProxy 的子类, 所有访问直接委托给缓存实例
+    """
+    proxy_cls = _RESOLVED_PROXY_CLASSES.get(real_type)
+    if proxy_cls is None:
+        proxy_cls = type(
+            f"_ResolvedProxy_{real_type.__name__}",
+            (LazyProxy,),
+            {
+                # 与 LazyProxy 保持相同的内存布局, 以便切换 __class__
+                "__slots__": (),
+                "__getattribute__": _resolved_getattribute,
+                "__setattr__": _resolved_setattr,
+                "_get_real_instance": _resolved_real_instance,
+                "__call__": _resolved_real_instance,
+                **_DELEGATED_DUNDERS,
+            },
+        )
+        _RESOLVED_PROXY_CLASSES[real_type] = proxy_cls
+    return proxy_cls
+
 
 # 类型别名:可以在类型注解中使用 Lazy[T] 来表示懒加载的依赖
 Lazy = LazyProxy
@@ -16,11 +16,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import importlib
+import importlib.machinery
+import importlib.util
 import inspect
+import itertools
 import pkgutil
-import uuid
+import sys
+import weakref
 from pathlib import Path
+from time import perf_counter
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,9 +39,11 @@ from typing import (
     get_args,
 )
 
+from ._scc import build_dependency_graph, cyclic_components
 from .circular import CircularDependencyDetector
-from .circular import LazyProxy, LazyTypeMarker, Lazy
+from .circular import LazyProxy, LazyTypeMarker, Lazy, _RESOLVED_PROXY_CLASSES
 from .exceptions import (
+    CircularDependencyError,
     ContainerException,
     InvalidConfigurationError,
     RegistrationError,
@@ -42,17 +52,209 @@ from .exceptions import (
     ServiceNotFoundError,
 )
 from .injector import ConstructorInjector, DependencyInfo
-from .lifetime_manager import LifetimeManager
-from .performance import PerformanceMetrics, ResolutionTimer
+from .lifetime_manager import LifetimeManager, SingletonStore
+from .performance import PerformanceMetrics
 from .types import Lifetime, ServiceKey, InjectionMarker
 from .decorators import get_service_metadata
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
 T = TypeVar("T")
 S = TypeVar("S")
 
+# 注册版本号生成器, 每个 ServiceRegistration 获得全局唯一且递增的版本号
+_registration_versions = itertools.count(1)
+
+# 作用域 ID 生成器: 作用域 ID 只需在进程内唯一, 用递增计数代替 uuid4, 进入作用域时无需读取系统熵
+_scope_ids = itertools.count(1)
+
+# 性能优化: 缓存常用生命周期枚举值, 避免热路径上的枚举属性查找
+_SINGLETON = Lifetime.SINGLETON
+_SCOPED = Lifetime.SCOPED
+
+# 缓存未命中标记, 用于区分"未缓存"与"缓存了 None"
+_MISSING: Any = object()
+
+# 工厂函数依赖分析缓存: 工厂 -> 依赖信息元组, 工厂被回收时条目自动失效
+_FACTORY_DEPENDENCY_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], tuple[DependencyInfo, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# 支持的拦截器类型, 对应容器上的 _<类型>_interceptors 属性
+_INTERCEPTOR_TYPES: frozenset[str] = frozenset({"before", "after", "error"})
+
+# 解析计划中的依赖步骤类型
+_DEP_SERVICE = 0  # 常规依赖, 递归解析
+_DEP_LAZY = 1  # Lazy[T] 依赖, 注入同步解析的 LazyProxy
+_DEP_LAZY_ASYNC = 2  # Lazy[T] 依赖, 内部服务为异步工厂
+_DEP_MISSING = 3  # 必需依赖未注册, 解析时抛出 ServiceNotFoundError
+_DEP_SINGLETON = 4  # 单例常规依赖, 已缓存时直接读取单例存储, 否则递归解析
+
+
+def clear_all_caches() -> None:
+    """清空模块级的反射与类型缓存.
+
+    包括构造函数依赖分析、类型提示、工厂依赖分析、已解析代理类、泛型键以及可视化依赖缓存.
+    测试或热重载替换类定义后调用, 避免旧类对象被缓存引用而继续占用内存.
+    尚未导入的泛型与可视化模块不会因此被加载.
+
+    Examples:
+        >>> from symphra_container import clear_all_caches
+        >>> clear_all_caches()
+    """
+    ConstructorInjector.clear_cache()
+    _FACTORY_DEPENDENCY_CACHE.clear()
+    _RESOLVED_PROXY_CLASSES.clear()
+
+    generics = sys.modules.get(f"{__package__}.generics")
+    if generics is not None:
+        generics._cached_generic_key.cache_clear()
+        generics._KEY_CACHE.clear()
+
+    visualization = sys.modules.get(f"{__package__}.visualization")
+    if visualization is not None:
+        visualization._DEPENDENCY_CACHE.clear()
+
+
+def _load_module_from_path(name: str, path: Path) -> Any:
+    """从文件路径加载模块.
+
+    模块在执行前登记到 sys.modules, 使装饰器能把可注入对象记录到该模块,
+    执行失败时移除登记. __init__.py 作为包加载, 其中的相对导入可以找到同目录模块.
+
+    Args:
+        name: 模块名
+        path: .py 文件路径
+
+    Returns:
+        加载后的模块, 无法创建模块规格时返回 None
+    """
+    search_locations = [str(path.parent)] if path.name == "__init__.py" else None
+    spec = importlib.util.spec_from_file_location(name, str(path), submodule_search_locations=search_locations)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
+    return module
+
+
+# 路径扫描使用的顶层模块名序号, 每次扫描使用独立的模块名, 互不覆盖
+_scan_ids = itertools.count()
+
+
+def _positional_dependency_keys(
+    factory: Callable[..., Any] | None, plan: tuple[tuple[str, int, Any, bool], ...]
+) -> tuple[ServiceKey, ...] | None:
+    """计算可按位置传参的依赖服务键序列.
+
+    仅当解析计划全部为必需的常规依赖, 且参数名恰好对应工厂签名中
+    开头的若干个位置参数时才返回服务键序列, 否则返回 None.
+
+    Args:
+        factory: 工厂函数或类
+        plan: 预编译的解析计划
+
+    Returns:
+        按位置排列的服务键元组, 不满足条件时返回 None
+    """
+    if factory is None:
+        return None
+    for _, kind, _, is_optional in plan:
+        if (kind != _DEP_SERVICE and kind != _DEP_SINGLETON) or is_optional:
+            return None
+
+    try:
+        parameters = list(inspect.signature(factory).parameters.values())
+    except (TypeError, ValueError):
+        return None
+
+    if len(parameters) < len(plan):
+        return None
+    positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    for param, (parameter_name, _, _, _) in zip(parameters, plan, strict=False):
+        if param.name != parameter_name or param.kind not in positional_kinds:
+            return None
+    return tuple(service_key for _, _, service_key, _ in plan)
+
+
+def _generate_resolver(
+    registration: ServiceRegistration, plan: tuple[tuple[str, int, Any, bool], ...]
+) -> Callable[[Container], Any] | None:
+    """为注册项生成专用的实例创建函数.
+
+    将解析计划展开为 Python 源码并编译, 依赖解析与工厂调用写成直线代码,
+    省去通用解析循环中的步骤分派和 kwargs 字典构造. 服务键、工厂等对象
+    通过命名空间注入, 不会写入源码文本.
+
+    包含可选依赖或缺失依赖的计划需要运行时判断, 不生成专用函数.
+
+    Args:
+        registration: 服务注册信息
+        plan: 预编译的解析计划
+
+    Returns:
+        接受容器实例并返回新实例的函数, 无法生成时返回 None
+    """
+    factory = registration.factory
+    if factory is None or registration.is_async:
+        return None
+
+    namespace: dict[str, Any] = {
+        "_factory": factory,
+        "_key": registration.key,
+        "_LazyProxy": LazyProxy,
+        "_ResolutionError": ResolutionError,
+    }
+    lines = ["def _resolve(container):"]
+    if plan:
+        lines.append("    _r = container.resolve")
+    if any(kind == _DEP_LAZY or kind == _DEP_LAZY_ASYNC for _, kind, _, _ in plan):
+        lines.append("    _lf = container._lazy_factory")
+    if any(kind == _DEP_SINGLETON for _, kind, _, _ in plan):
+        namespace["_M"] = _MISSING
+        lines.append("    _s = container._singleton_shortcut")
+
+    arguments: list[str] = []
+    positional = registration._positional_deps is not None
+    for index, (parameter_name, kind, service_key, is_optional) in enumerate(plan):
+        if is_optional or kind == _DEP_MISSING:
+            return None
+        namespace[f"_k{index}"] = service_key
+        if kind == _DEP_SINGLETON:
+            lines.append(f"    _a{index} = _M if _s is None else _s.get(_k{index}, _M)")
+            lines.append(f"    if _a{index} is _M:")
+            lines.append(f"        _a{index} = _r(_k{index})")
+        else:
+            if kind == _DEP_SERVICE:
+                value = f"_r(_k{index})"
+            elif kind == _DEP_LAZY:
+                value = f"_LazyProxy(_lf(_k{index}, False))"
+            else:
+                value = f"_LazyProxy(_lf(_k{index}, True))"
+            lines.append(f"    _a{index} = {value}")
+        arguments.append(f"_a{index}" if positional else f"{parameter_name}=_a{index}")
+
+    lines.extend(
+        [
+            "    try:",
+            f"        return _factory({', '.join(arguments)})",
+            "    except _ResolutionError:",
+            "        raise",
+            "    except Exception as e:",
+            "        raise _ResolutionError(_key, e) from e",
+        ]
+    )
+
+    name = getattr(registration.service_type, "__name__", None) or str(registration.key)
+    exec(compile("\n".join(lines), f"<di:{name}>", "exec"), namespace)  # noqa: S102
+    return namespace["_resolve"]
+
 
 class ServiceRegistration:
     """服务注册信息.
@@ -66,8 +268,24 @@ class ServiceRegistration:
         lifetime: 生命周期
         override: 是否覆盖已存在的服务
         is_async: 标记factory是否为异步函数
+        version: 注册版本号, 每次注册(包括覆盖注册)都会生成新的版本号
     """
 
+    __slots__ = (
+        "_compiled_resolver",
+        "_no_deps",
+        "_plan_version",
+        "_positional_deps",
+        "_resolution_plan",
+        "factory",
+        "is_async",
+        "key",
+        "lifetime",
+        "override",
+        "service_type",
+        "version",
+    )
+
     def __init__(
         self,
         key: ServiceKey,
@@ -91,7 +309,20 @@ class ServiceRegistration:
         self.lifetime = lifetime
         self.override = override
         # 自动检测factory是否为异步
-        self.is_async = asyncio.iscoroutinefunction(factory) if factory else False
+        # 性能优化: register() 以类本身作为工厂, 类不可能是协程函数, 直接跳过检测
+        self.is_async = (
+            factory is not None and not isinstance(factory, type) and inspect.iscoroutinefunction(factory)
+        )
+        self.version = next(_registration_versions)
+        # 预编译的依赖解析计划, 以及生成该计划时容器注册表的版本
+        self._resolution_plan: tuple[tuple[str, int, Any, bool], ...] | None = None
+        self._plan_version = -1
+        # 工厂没有任何可注入参数时为 True, 创建实例时直接调用工厂
+        self._no_deps = False
+        # 全部依赖都是必需且按位置排列时的服务键序列, 创建实例时按位置传参
+        self._positional_deps: tuple[ServiceKey, ...] | None = None
+        # Container.compile() 为该服务生成的专用创建函数, 解析计划重新编译时失效
+        self._compiled_resolver: Callable[[Container], Any] | None = None
 
     @property
     def is_async_factory(self) -> bool:
@@ -126,7 +357,10 @@ class Container:
     Attributes:
         _registrations: 服务注册字典
         _lifetime_manager: 生命周期管理器
-        _interceptors: 拦截器字典
+        _before_interceptors: 前置拦截器元组, 元素为 (拦截器, 是否为协程函数)
+        _after_interceptors: 后置拦截器元组, 元素为 (拦截器, 是否为协程函数)
+        _error_interceptors: 错误拦截器元组, 元素为 (拦截器, 是否为协程函数)
+        _async_interceptor_types: 包含协程函数拦截器的拦截器类型集合
         _circular_detector: 循环依赖检测器
         _performance_metrics: 性能指标收集器
         _enable_performance_tracking: 是否启用性能跟踪
@@ -157,11 +391,14 @@ class Container:
 
         self._registrations: dict[ServiceKey, ServiceRegistration] = {}
         self._lifetime_manager = LifetimeManager()
-        self._interceptors: dict[str, list[Any]] = {
-            "before": [],
-            "after": [],
-            "error": [],
-        }
+        # 性能优化: 三类拦截器分别存放, 解析时空列表检查即可跳过
+        # 性能优化: 拦截器很少添加, 以元组保存, 添加时整体重建, 解析时迭代开销更小
+        # 是否为协程函数在添加时一次判定, 异步解析时不再逐次调用 inspect
+        self._before_interceptors: tuple[tuple[Any, bool], ...] = ()
+        self._after_interceptors: tuple[tuple[Any, bool], ...] = ()
+        self._error_interceptors: tuple[tuple[Any, bool], ...] = ()
+        # 性能优化: 某类拦截器全部为同步函数时, 异步解析直接内联执行, 不创建协程
+        self._async_interceptor_types: frozenset[str] = frozenset()
         self._circular_detector = CircularDependencyDetector()
         self._performance_metrics = PerformanceMetrics()
         self._enable_performance_tracking = enable_performance_tracking
@@ -169,6 +406,96 @@ class Container:
         self.strict_mode = strict_mode
         # 别名映射: 别名 -> 实际键
         self._aliases: dict[str, ServiceKey] = {}
+        # 统一查找表: 服务键和有效别名 -> 注册信息(同一对象), 解析时一次查找即可命中
+        self._lookup: dict[ServiceKey, ServiceRegistration] = {}
+        # 别名反向索引: 服务键 -> 指向它的别名列表, 用于注册变化时同步别名条目
+        self._alias_reverse: dict[ServiceKey, list[str]] = {}
+        # 注册表版本号, 注册/注销/别名变化时递增, 用于使预编译的解析计划失效
+        self._registry_version = 0
+        # 类型名索引: 类名 -> 以该名称注册的类型键(按注册顺序), 用于解析字符串形式的依赖
+        self._type_name_index: dict[str, list[type]] = {}
+        # 通过 freeze() 循环检测时的注册表版本, 版本一致时解析跳过逐次循环检测
+        self._frozen_version = -1
+        # Lazy[T] 依赖的解析工厂缓存: 服务键 -> 绑定了服务键的 resolve/resolve_async
+        self._lazy_sync_factories: dict[ServiceKey, Callable[[], Any]] = {}
+        self._lazy_async_factories: dict[ServiceKey, Callable[[], Any]] = {}
+        # 正在异步创建的单例/作用域实例: (所属存储, 服务键) -> 创建结果, 并发解析同一服务时只创建一次
+        self._pending_creations: dict[tuple[Any, ServiceKey], asyncio.Future[Any]] = {}
+        # 解析依赖时可直接读取的单例存储, 随拦截器变化更新
+        self._update_singleton_shortcut()
+
+        # 性能优化: 创建容器时选定解析实现, 未启用追踪时解析路径上没有任何计时开销
+        if enable_performance_tracking:
+            self.resolve = self._resolve_traced  # type: ignore[method-assign]
+            self.resolve_async = self._resolve_async_traced  # type: ignore[method-assign]
+        # container[key] 使用的绑定方法, 下标访问时不必每次重新绑定 resolve
+        self._resolve = self.resolve
+
+    def _store_registration(self, key: ServiceKey, registration: ServiceRegistration) -> None:
+        """保存注册信息并更新类型名索引.
+
+        Args:
+            key: 服务键
+            registration: 服务注册信息
+        """
+        if isinstance(key, type) and key not in self._registrations:
+            for name in {key.__name__, key.__qualname__.split(".")[-1]}:
+                self._type_name_index.setdefault(name, []).append(key)
+        self._registrations[key] = registration
+        # 与别名同名的直接注册不覆盖别名条目: 别名优先, 与先展开别名再查找的规则一致
+        if key not in self._aliases:
+            self._lookup[key] = registration
+        if key in self._alias_reverse:
+            self._link_aliases(key)
+        self._registry_version += 1
+
+    def _link_aliases(self, key: ServiceKey) -> None:
+        """同步指向服务键的别名在统一查找表中的条目.
+
+        服务已注册时别名指向当前注册信息, 已注销时移除别名条目.
+        与已注册服务键同名的别名会遮蔽该服务(别名优先).
+
+        Args:
+            key: 服务键
+        """
+        registration = self._registrations.get(key)
+        for alias in self._alias_reverse.get(key, ()):
+            if registration is None:
+                self._lookup.pop(alias, None)
+            else:
+                self._lookup[alias] = registration
+
+    def _lookup_type_by_name(self, name: str) -> type | None:
+        """按类名查找已注册的类型键.
+
+        Args:
+            name: 类名(__name__ 或 __qualname__ 的最后一段)
+
+        Returns:
+            最先注册的同名类型, 不存在时返回 None
+        """
+        candidates = self._type_name_index.get(name)
+        return candidates[0] if candidates else None
+
+    def _lookup_key_by_name(self, name: str) -> ServiceKey | None:
+        """把字符串形式的依赖名规范化为服务键.
+
+        依次匹配: 已注册的字符串键或别名(与 resolve 的查找规则一致)、已注册类型的类名、
+        目标尚未注册的别名. 每一步都是一次字典查找, 与注册数量无关.
+
+        Args:
+            name: 依赖名
+
+        Returns:
+            对应的服务键, 无法匹配时返回 None
+        """
+        registration = self._lookup.get(name)
+        if registration is not None:
+            return registration.key
+        registered_type = self._lookup_type_by_name(name)
+        if registered_type is not None:
+            return registered_type
+        return self._aliases.get(name)
 
     # ===================== 注册方法 =====================
 
@@ -229,7 +556,7 @@ class Container:
             lifetime=lifetime,
             override=override or decorated_override,
         )
-        self._registrations[key] = registration
+        self._store_registration(key, registration)
 
         return self
 
@@ -277,7 +604,9 @@ class Container:
             lifetime=Lifetime.SINGLETON,
             override=override,
         )
-        self._registrations[key] = registration
+        # 实例工厂没有参数, 无需依赖分析
+        registration._no_deps = True
+        self._store_registration(key, registration)
 
         # 直接存储到单例存储
         self._lifetime_manager.set_instance(key, instance, Lifetime.SINGLETON)
@@ -327,6 +656,10 @@ class Container:
                 "Service already registered. Use override=True to replace it.",
             )
 
+        # 注册时一次性校验可调用性, 创建实例时不再重复检查
+        if not callable(factory):
+            raise RegistrationError(key, "Factory is not callable")
+
         service_type = service_type or type(None)
 
         registration = ServiceRegistration(
@@ -336,7 +669,7 @@ class Container:
             lifetime=lifetime,
             override=override,
         )
-        self._registrations[key] = registration
+        self._store_registration(key, registration)
 
         return self
 
@@ -379,7 +712,7 @@ class Container:
         self,
         key: ServiceKey,
         registration: ServiceRegistration,
-    ) -> tuple[Any | None, bool]:
+    ) -> tuple[Any, bool]:
         """检查缓存的实例.
 
         性能优化: 单例访问是最频繁的操作,优化此路径.
@@ -389,30 +722,31 @@ class Container:
             registration: 服务注册信息
 
         Returns:
-            (实例, 是否命中缓存) 元组
+            (实例, 是否命中缓存) 元组, 未命中时实例为 _MISSING
         """
         # 性能优化: 单例是最常见的情况,直接访问字典避免函数调用开销
-        if registration.lifetime == Lifetime.SINGLETON:
+        lifetime = registration.lifetime
+        lifetime_manager = self._lifetime_manager
+        if lifetime is _SINGLETON:
             # 直接从单例存储中获取,避免 get_instance 的额外开销
-            cached = self._lifetime_manager._singleton_store.get(key)
-            if cached is not None:
+            cached = lifetime_manager._singleton_store.get(key, _MISSING)
+            if cached is not _MISSING:
                 return cached, True
 
-        elif registration.lifetime == Lifetime.SCOPED:
-            if self._lifetime_manager.has_active_scope():
-                scope = self._lifetime_manager.current_scope
-                if scope is not None:
-                    cached = scope.get(key)
-                    if cached is not None:
-                        return cached, True
+        elif lifetime is _SCOPED:
+            scope = lifetime_manager.current_scope
+            if scope is not None:
+                cached = scope.get(key, _MISSING)
+                if cached is not _MISSING:
+                    return cached, True
 
-        return None, False
+        return _MISSING, False
 
     async def _check_cached_instance_async(
         self,
         key: ServiceKey,
         registration: ServiceRegistration,
-    ) -> tuple[Any | None, bool]:
+    ) -> tuple[Any, bool]:
         """异步检查缓存的实例.
 
         Args:
@@ -420,24 +754,26 @@ class Container:
             registration: 服务注册信息
 
         Returns:
-            (实例, 是否命中缓存) 元组
+            (实例, 是否命中缓存) 元组, 未命中时实例为 _MISSING
         """
-        if registration.lifetime == Lifetime.SINGLETON:
+        lifetime = registration.lifetime
+        lifetime_manager = self._lifetime_manager
+        if lifetime is _SINGLETON:
             # 检查是否已有缓存
-            cached = self._lifetime_manager._singleton_store.get(key)
-            if cached is not None:
+            cached = lifetime_manager._singleton_store.get(key, _MISSING)
+            if cached is not _MISSING:
                 return cached, True
-            # 没有缓存,返回 None,由调用者创建并缓存
-            return None, False
+            # 没有缓存,由调用者创建并缓存
+            return _MISSING, False
 
-        if registration.lifetime == Lifetime.SCOPED and self._lifetime_manager.has_active_scope():
-            scope = self._lifetime_manager.current_scope
+        if lifetime is _SCOPED:
+            scope = lifetime_manager.current_scope
             if scope is not None:
-                cached = scope.get(key)
-                if cached is not None:
+                cached = scope.get(key, _MISSING)
+                if cached is not _MISSING:
                     return cached, True
 
-        return None, False
+        return _MISSING, False
 
     def _run_before_interceptors(self, key: ServiceKey, registration: ServiceRegistration) -> None:
         """运行前置拦截器.
@@ -449,7 +785,7 @@ class Container:
         Raises:
             ResolutionError: 拦截器拒绝解析时
         """
-        for interceptor in self._interceptors["before"]:
+        for interceptor, _ in self._before_interceptors:
             if not interceptor(key, registration):
                 raise ResolutionError(key, Exception("前置拦截器拒绝了解析"))
 
@@ -463,12 +799,11 @@ class Container:
         Returns:
             处理后的实例
         """
-        result_instance = instance
-        for interceptor in self._interceptors["after"]:
-            result = interceptor(key, result_instance)
+        for interceptor, _ in self._after_interceptors:
+            result = interceptor(key, instance)
             if result is not None:
-                result_instance = result
-        return result_instance
+                instance = result
+        return instance
 
     def _run_error_interceptors(self, key: ServiceKey, error: Exception) -> None:
         """运行错误拦截器.
@@ -477,7 +812,7 @@ class Container:
             key: 服务键
             error: 异常对象
         """
-        for interceptor in self._interceptors["error"]:
+        for interceptor, _ in self._error_interceptors:
             interceptor(key, error)
 
     @overload
@@ -495,7 +830,7 @@ class Container:
         工作流程:
         1. 验证服务已注册
         2. 执行前置拦截器(可能拒绝解析)
-        3. 初始化性能追踪(如果启用)
+        3. 性能追踪(启用时由 _resolve_traced 包装)
         4. 循环依赖检测
         5. 检查缓存实例(Singleton/Scoped)
         6. 创建新实例(递归解析依赖)
@@ -518,24 +853,24 @@ class Container:
             >>> service = container.resolve(UserService)
             >>> assert isinstance(service, UserService)
         """
-        # 步骤 0: 检查是否为别名, 如果是则转换为实际键
-        if key in self._aliases:
-            key = self._aliases[key]
-
-        # Handle Lazy types
-        origin = get_origin(key)
-        if origin == LazyTypeMarker:
-            args = get_args(key)
-            if args:
-                inner_key = args[0]
-                return Lazy(inner_key, _resolver=self.resolve)
-            else:
-                raise ResolutionError(key, Exception("Lazy type must have arguments"))
-        if key not in self._registrations:
-            available_services = list(self._registrations.keys())
-            raise ServiceNotFoundError(key, available_services)
-
-        registration = self._registrations[key]
+        # 性能优化: 热路径上多次使用的属性提前读入局部变量
+        circular_detector = self._circular_detector
+
+        # 步骤 0/1: 服务键和别名共用一张查找表, 一次查找即可; 只有未命中时才检查 Lazy 类型
+        registration = self._lookup.get(key)
+        if registration is None:
+            # Handle Lazy types
+            origin = get_origin(key)
+            if origin == LazyTypeMarker:
+                args = get_args(key)
+                if args:
+                    inner_key = args[0]
+                    return Lazy(inner_key, _resolver=self.resolve)
+                else:
+                    raise ResolutionError(key, Exception("Lazy type must have arguments"))
+            raise ServiceNotFoundError(key, list(self._registrations.keys()))
+        # 通过别名命中时, 缓存和循环检测都以真实服务键为准
+        key = registration.key
 
         # 检查是否尝试同步解析异步服务
         if registration.is_async:
@@ -544,24 +879,28 @@ class Container:
                 Exception(f"Service {key} has async factory, use resolve_async() instead of resolve()"),
             )
 
+        # 性能优化: 已创建的单例直接返回, 跳过循环检测
+        # (缓存命中时本就不执行后置拦截器, 只有前置拦截器需要走完整流程)
+        if registration.lifetime is _SINGLETON and not self._before_interceptors:
+            cached = self._lifetime_manager._singleton_store.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
         # 步骤 2: 执行前置拦截器(可能拒绝解析)
-        self._run_before_interceptors(key, registration)
+        if self._before_interceptors:
+            self._run_before_interceptors(key, registration)
 
-        # 步骤 3: 初始化性能追踪(如果启用)
-        timer = ResolutionTimer() if self._enable_performance_tracking else None
-        cache_hit = False
+        # 性能优化: 没有依赖的叶子服务不可能构成循环, 已冻结的依赖图也已整体检测过, 跳过循环检测
+        track_cycle = not registration._no_deps and self._frozen_version != self._registry_version
 
         try:
-            # 开始计时
-            if timer:
-                timer.__enter__()
-
             # 步骤 4: 循环依赖检测 - 进入解析堆栈
-            self._circular_detector.enter_resolution(key)
+            if track_cycle:
+                circular_detector.push(key)
 
             # 步骤 5: 检查是否有缓存实例(Singleton/Scoped)
-            cached, cache_hit = self._check_cached_instance(key, registration)
-            if cached is not None:
+            cached, _ = self._check_cached_instance(key, registration)
+            if cached is not _MISSING:
                 return cached
 
             # 步骤 6: 创建新实例(递归解析依赖)
@@ -571,27 +910,22 @@ class Container:
             self._lifetime_manager.set_instance(key, instance, registration.lifetime)
 
             # 步骤 8: 执行后置拦截器并返回最终实例
-            return self._run_after_interceptors(key, instance)
+            if self._after_interceptors:
+                return self._run_after_interceptors(key, instance)
+            return instance
 
         except ContainerException:
             # 容器异常直接重新抛出
             raise
         except Exception as e:
             # 其他异常: 通知错误拦截器并包装为 ResolutionError
-            self._run_error_interceptors(key, e)
+            if self._error_interceptors:
+                self._run_error_interceptors(key, e)
             raise ResolutionError(key, e) from e
         finally:
             # 清理工作: 从循环检测堆栈中移除
-            self._circular_detector.exit_resolution(key)
-
-            # 记录性能指标(如果启用追踪)
-            if timer:
-                timer.__exit__(None, None, None)
-                self._performance_metrics.record_resolution(
-                    key,
-                    timer.elapsed_time,
-                    cache_hit=cache_hit,
-                )
+            if track_cycle:
+                circular_detector.pop()
 
     @overload
     async def resolve_async(self, key: type[T]) -> T: ...
@@ -608,7 +942,7 @@ class Container:
         工作流程:
         1. 验证服务已注册
         2. 执行前置拦截器
-        3. 初始化性能追踪
+        3. 性能追踪(启用时由 _resolve_async_traced 包装)
         4. 循环依赖检测
         5. 检查缓存实例
         6. 创建新实例(支持异步factory和依赖)
@@ -631,79 +965,193 @@ class Container:
             >>> service = await container.resolve_async(AsyncService)
             >>> assert isinstance(service, AsyncService)
         """
-        # 步骤 0: 检查是否为别名
-        if key in self._aliases:
-            key = self._aliases[key]
-
-        # Handle Lazy types
-        origin = get_origin(key)
-        if origin == LazyTypeMarker:
-            args = get_args(key)
-            if args:
-                inner_key = args[0]
-                return Lazy(inner_key, _resolver=self.resolve_async)
-            else:
-                raise ResolutionError(key, Exception("Lazy type must have arguments"))
-
-        # 步骤 1: 验证服务已注册
-        if key not in self._registrations:
-            available_services = list(self._registrations.keys())
-            raise ServiceNotFoundError(key, available_services)
+        # 性能优化: 热路径上多次使用的属性提前读入局部变量
+        circular_detector = self._circular_detector
+
+        # 步骤 0/1: 服务键和别名共用一张查找表, 一次查找即可; 只有未命中时才检查 Lazy 类型
+        registration = self._lookup.get(key)
+        if registration is None:
+            # Handle Lazy types
+            origin = get_origin(key)
+            if origin == LazyTypeMarker:
+                args = get_args(key)
+                if args:
+                    inner_key = args[0]
+                    return Lazy(inner_key, _resolver=self.resolve_async)
+                else:
+                    raise ResolutionError(key, Exception("Lazy type must have arguments"))
+            raise ServiceNotFoundError(key, list(self._registrations.keys()))
+        # 通过别名命中时, 缓存和循环检测都以真实服务键为准
+        key = registration.key
 
-        registration = self._registrations[key]
+        # 性能优化: 已创建的单例直接返回, 跳过循环检测
+        if registration.lifetime is _SINGLETON and not self._before_interceptors:
+            cached = self._lifetime_manager._singleton_store.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
 
         # 步骤 2: 执行前置拦截器
-        await self._run_before_interceptors_async(key, registration)
+        if self._before_interceptors:
+            if "before" in self._async_interceptor_types:
+                await self._run_before_interceptors_async(key, registration)
+            else:
+                for interceptor, _ in self._before_interceptors:
+                    interceptor(key, registration)
 
-        # 步骤 3: 初始化性能追踪
-        timer = ResolutionTimer() if self._enable_performance_tracking else None
-        cache_hit = False
+        # 性能优化: 没有依赖的叶子服务不可能构成循环, 已冻结的依赖图也已整体检测过, 跳过循环检测
+        track_cycle = not registration._no_deps and self._frozen_version != self._registry_version
 
         try:
-            if timer:
-                timer.__enter__()
-
             # 步骤 4: 循环依赖检测
-            self._circular_detector.enter_resolution(key)
+            if track_cycle:
+                circular_detector.push(key)
 
             # 步骤 5: 检查缓存实例(异步版本)
-            cached, cache_hit = await self._check_cached_instance_async(key, registration)
-            if cached is not None:
+            cached, _ = await self._check_cached_instance_async(key, registration)
+            if cached is not _MISSING:
                 return cached
 
-            # 步骤 6: 创建新实例(异步)
-            instance = await self._create_instance_async(registration)
-
-            # 步骤 7: 存储实例
-            self._lifetime_manager.set_instance(key, instance, registration.lifetime)
+            # 步骤 6/7: 创建并存储新实例(异步); 其他协程正在创建同一实例时等待其结果, 与命中缓存一样返回
+            instance, created = await self._create_cached_instance_async(key, registration)
+            if not created:
+                return instance
 
             # 步骤 8: 执行后置拦截器
-            return await self._run_after_interceptors_async(key, instance)
+            if self._after_interceptors:
+                if "after" in self._async_interceptor_types:
+                    return await self._run_after_interceptors_async(key, instance)
+                for interceptor, _ in self._after_interceptors:
+                    instance = interceptor(key, instance) or instance
+            return instance
 
         except ContainerException:
             raise
         except Exception as e:
-            await self._run_error_interceptors_async(key, e)
+            if self._error_interceptors:
+                if "error" in self._async_interceptor_types:
+                    await self._run_error_interceptors_async(key, e)
+                else:
+                    for interceptor, _ in self._error_interceptors:
+                        interceptor(key, e)
             raise ResolutionError(key, e) from e
         finally:
-            self._circular_detector.exit_resolution(key)
+            if track_cycle:
+                circular_detector.pop()
+
+    async def _create_cached_instance_async(
+        self,
+        key: ServiceKey,
+        registration: ServiceRegistration,
+    ) -> tuple[Any, bool]:
+        """异步创建实例并按生命周期存储.
+
+        冻结后并发解析的兄弟依赖可能共享同一个尚未创建的单例或作用域依赖,
+        先到的协程负责创建, 后到的协程等待它的结果, 保证实例只创建一次.
+
+        Args:
+            key: 服务键
+            registration: 服务注册信息
+
+        Returns:
+            (实例, 是否由本次调用创建) 元组
+        """
+        lifetime = registration.lifetime
+        lifetime_manager = self._lifetime_manager
+        if lifetime is _SINGLETON:
+            owner: Any = lifetime_manager._singleton_store
+        elif lifetime is _SCOPED:
+            owner = lifetime_manager.current_scope
+        else:
+            owner = None
+        if owner is None:
+            # 不缓存的实例每次都新建, 无需去重
+            return await self._create_instance_async(registration), True
+
+        pending_creations = self._pending_creations
+        pending_key = (owner, key)
+        loop = asyncio.get_running_loop()
+        pending = pending_creations.get(pending_key)
+        if pending is not None and pending.get_loop() is loop:
+            # shield: 等待方被取消时不应取消创建方的结果
+            return await asyncio.shield(pending), False
+
+        future = loop.create_future()
+        pending_creations[pending_key] = future
+        try:
+            instance = await self._create_instance_async(registration)
+            lifetime_manager.set_instance(key, instance, lifetime)
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有等待方时不报告 "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(instance)
+        finally:
+            if pending_creations.get(pending_key) is future:
+                del pending_creations[pending_key]
+        return instance, True
+
+    def _is_cached(self, key: ServiceKey) -> bool:
+        """检查服务当前是否已有缓存实例(用于性能追踪统计缓存命中).
+
+        Args:
+            key: 服务键或别名
+
+        Returns:
+            是否命中缓存
+        """
+        registration = self._lookup.get(key)
+        if registration is None:
+            return False
+        lifetime = registration.lifetime
+        if lifetime is _SINGLETON:
+            return self._lifetime_manager._singleton_store.has(registration.key)
+        if lifetime is _SCOPED:
+            scope = self._lifetime_manager.current_scope
+            return scope is not None and scope.has(registration.key)
+        return False
+
+    def _resolve_traced(self, key: ServiceKey) -> Any:
+        """带性能追踪的 resolve, 仅在启用性能跟踪时替换 resolve.
+
+        Args:
+            key: 服务键
+
+        Returns:
+            解析得到的服务实例
+        """
+        cache_hit = self._is_cached(key)
+        start = perf_counter()
+        try:
+            return type(self).resolve(self, key)
+        finally:
+            self._performance_metrics.record_resolution(key, perf_counter() - start, cache_hit=cache_hit)
+
+    async def _resolve_async_traced(self, key: ServiceKey) -> Any:
+        """带性能追踪的 resolve_async, 仅在启用性能跟踪时替换 resolve_async.
+
+        Args:
+            key: 服务键
 
-            if timer:
-                timer.__exit__(None, None, None)
-                self._performance_metrics.record_resolution(
-                    key,
-                    timer.elapsed_time,
-                    cache_hit=cache_hit,
-                )
+        Returns:
+            解析得到的服务实例
+        """
+        cache_hit = self._is_cached(key)
+        start = perf_counter()
+        try:
+            return await type(self).resolve_async(self, key)
+        finally:
+            self._performance_metrics.record_resolution(key, perf_counter() - start, cache_hit=cache_hit)
 
-    def _analyze_service_dependencies(self, registration: ServiceRegistration) -> list[DependencyInfo]:
+    def _analyze_service_dependencies(self, registration: ServiceRegistration) -> tuple[DependencyInfo, ...]:
         """分析服务依赖.
 
         Args:
             registration: 服务注册信息
 
         Returns:
-            依赖信息列表
+            依赖信息元组
 
         Raises:
             ResolutionError: 分析失败时
@@ -719,11 +1167,21 @@ class Container:
         except Exception as e:
             raise ResolutionError(registration.key, e) from e
 
-    def _analyze_function_dependencies(self, func: Callable[..., Any]) -> list[DependencyInfo]:
+    def _analyze_function_dependencies(self, func: Callable[..., Any]) -> tuple[DependencyInfo, ...]:
         """分析工厂函数参数依赖.
 
         支持类型注解、Optional、默认值以及 Injected 标记。
+
+        性能优化: 分析结果按工厂缓存, 签名和类型提示只反射一次.
         """
+        try:
+            cached = _FACTORY_DEPENDENCY_CACHE.get(func)
+        except TypeError:
+            # 不支持弱引用的可调用对象不缓存
+            cached = None
+        if cached is not None:
+            return cached
+
         dependencies: list[DependencyInfo] = []
         try:
             signature = inspect.signature(func)
@@ -765,18 +1223,95 @@ class Container:
                             is_injected=is_injected,
                         )
                     )
-
-            return dependencies
         except Exception as e:  # noqa: BLE001
             raise ResolutionError(func, Exception(f"Failed to analyze factory dependencies: {e!s}")) from e
 
-    def _resolve_dependencies(self, dependencies: list[DependencyInfo]) -> dict[str, Any]:
-        """解析依赖参数.
+        result = tuple(dependencies)
+        with contextlib.suppress(TypeError):
+            _FACTORY_DEPENDENCY_CACHE[func] = result
+        return result
+
+    def _compile_dependencies(self, dependencies: tuple[DependencyInfo, ...]) -> tuple[tuple[str, int, Any, bool], ...]:
+        """将依赖信息预编译为解析计划.
+
+        字符串键规范化、字符串形式 Lazy[T] 的内部类型查找和注册检查都在编译时一次完成,
+        解析时只需按计划逐项执行, 不再重复反射和扫描注册表.
+
+        Args:
+            dependencies: 依赖信息元组
+
+        Returns:
+            由 (参数名, 步骤类型, 服务键, 是否可选) 组成的解析计划
+        """
+        plan: list[tuple[str, int, Any, bool]] = []
+        registrations = self._registrations
+
+        for dep in dependencies:
+            # 处理 Lazy[T] 依赖: 注入 LazyProxy, 延迟解析真实类型
+            # 标记形式的内部类型已在依赖分析时确定, 只有字符串形式需要按注册表查找
+            if dep.is_lazy:
+                inner_key = dep.lazy_inner_type
+                if inner_key is None:
+                    inner_key = self._lookup_key_by_name(dep.lazy_inner_name)
+
+                if inner_key is not None:
+                    # 非可选依赖需要确保真实类型已注册; 可选依赖且未注册: 跳过注入
+                    if inner_key not in registrations:
+                        if not dep.is_optional:
+                            plan.append((dep.parameter_name, _DEP_MISSING, inner_key, False))
+                        continue
+
+                    # 如果内部服务是异步的,使用异步解析工厂; 否则使用同步解析
+                    kind = _DEP_LAZY_ASYNC if registrations[inner_key].is_async else _DEP_LAZY
+                    plan.append((dep.parameter_name, kind, inner_key, dep.is_optional))
+                    continue
+
+            # 规范化可能的字符串服务键到已注册类型(支持局部类/未来注解)
+            service_key = dep.service_key
+            if isinstance(service_key, str):
+                normalized_key = self._lookup_key_by_name(service_key)
+                if normalized_key is not None:
+                    service_key = normalized_key
+
+            # 常规依赖解析路径
+            if service_key not in registrations:
+                if not dep.is_optional:
+                    plan.append((dep.parameter_name, _DEP_MISSING, service_key, False))
+                continue
+
+            kind = _DEP_SINGLETON if registrations[service_key].lifetime is _SINGLETON else _DEP_SERVICE
+            plan.append((dep.parameter_name, kind, service_key, dep.is_optional))
+
+        return tuple(plan)
+
+    def _get_resolution_plan(self, registration: ServiceRegistration) -> tuple[tuple[str, int, Any, bool], ...]:
+        """获取注册项的解析计划(按注册表版本缓存).
+
+        性能优化: 依赖分析和规范化只在首次创建实例或注册表变化后执行一次.
+
+        Args:
+            registration: 服务注册信息
 
-        性能优化: 减少异常处理开销,大部分情况下依赖都能正常解析.
+        Returns:
+            解析计划
+        """
+        plan = registration._resolution_plan
+        if plan is None or registration._plan_version != self._registry_version:
+            dependencies = self._analyze_service_dependencies(registration)
+            # 依赖分析结果与注册表无关, 无依赖的工厂之后不必再检查计划版本
+            registration._no_deps = not dependencies
+            plan = self._compile_dependencies(dependencies)
+            registration._positional_deps = _positional_dependency_keys(registration.factory, plan)
+            registration._compiled_resolver = None
+            registration._resolution_plan = plan
+            registration._plan_version = self._registry_version
+        return plan
+
+    def _resolve_plan(self, plan: tuple[tuple[str, int, Any, bool], ...]) -> dict[str, Any]:
+        """按解析计划解析依赖参数.
 
         Args:
-            dependencies: 依赖信息列表
+            plan: 预编译的解析计划
 
         Returns:
             参数名到实例的映射
@@ -784,107 +1319,104 @@ class Container:
         Raises:
             ServiceNotFoundError: 必需依赖未注册时
         """
-        # 性能优化: 预分配字典大小
         kwargs: dict[str, Any] = {}
+        singletons = self._singleton_shortcut
+        for parameter_name, kind, service_key, is_optional in plan:
+            if kind == _DEP_SINGLETON and singletons is not None:
+                instance = singletons.get(service_key, _MISSING)
+                if instance is not _MISSING:
+                    kwargs[parameter_name] = instance
+                    continue
+            if kind == _DEP_SERVICE or kind == _DEP_SINGLETON:
+                try:
+                    kwargs[parameter_name] = self.resolve(service_key)
+                except Exception:
+                    if not is_optional:
+                        raise
+            elif kind == _DEP_LAZY:
+                # 使用默认参数捕获服务键,避免闭包问题
+                kwargs[parameter_name] = LazyProxy(self._lazy_factory(service_key, False))
+            elif kind == _DEP_LAZY_ASYNC:
+                kwargs[parameter_name] = LazyProxy(self._lazy_factory(service_key, True))
+            else:
+                raise ServiceNotFoundError(service_key)
+        return kwargs
 
-        # 性能优化: 快速路径 - 大部分服务没有依赖或依赖很少
-        if not dependencies:
-            return kwargs
+    def _lazy_factory(self, key: ServiceKey, is_async: bool) -> Callable[[], Any]:
+        """获取 Lazy[T] 依赖的解析工厂.
 
-        # 获取注册表引用,避免重复属性查找
-        registrations = self._registrations
+        性能优化: 工厂按服务键缓存复用, 每次注入 LazyProxy 时不再创建新的闭包.
 
-        for dep in dependencies:
-            # 先规范化可能的字符串服务键到已注册类型(支持局部类/未来注解)
-            if isinstance(dep.service_key, str):
-                name = dep.service_key
-                # 尝试别名匹配
-                if name in self._aliases:
-                    dep.service_key = self._aliases[name]
-                    if isinstance(dep.service_key, type):
-                        dep.service_type = dep.service_key
-                else:
-                    for registered_type in registrations.keys():
-                        if isinstance(registered_type, type):
-                            if (
-                                registered_type.__name__ == name
-                                or registered_type.__qualname__.split(".")[-1] == name
-                            ):
-                                dep.service_key = registered_type
-                                dep.service_type = registered_type
-                                break
+        Args:
+            key: 内部服务键
+            is_async: 内部服务是否为异步工厂
 
-            # 处理 Lazy[T] 依赖: 注入 LazyProxy, 延迟解析真实类型
-            is_lazy = False
-            inner_key = None
-            
-            # 检查 LazyTypeMarker 实例
-            is_lazy_marker = (hasattr(dep.service_key, "inner_type") or
-                             (hasattr(dep.service_key, "__class__") and
-                              dep.service_key.__class__.__name__ == "LazyTypeMarker") or
-                             hasattr(dep.service_type, "inner_type") or
-                             (hasattr(dep.service_type, "__class__") and
-                              dep.service_type.__class__.__name__ == "LazyTypeMarker"))
-            
-            if is_lazy_marker:
-                is_lazy = True
-                marker = dep.service_key if (hasattr(dep.service_key, "inner_type") or
-                                            (hasattr(dep.service_key, "__class__") and
-                                             dep.service_key.__class__.__name__ == "LazyTypeMarker")) else dep.service_type
-                inner_key = marker.inner_type
-            # 检查字符串形式的 Lazy[T]
-            elif (isinstance(dep.service_key, str) and
-                  dep.service_key.startswith("Lazy[") and
-                  dep.service_key.endswith("]")):
-                is_lazy = True
-                inner_name = dep.service_key[5:-1]
-                # 查找匹配的类型
-                for registered_type in registrations:
-                    if isinstance(registered_type, type) and (
-                        registered_type.__name__ == inner_name or
-                        registered_type.__qualname__.split(".")[-1] == inner_name
-                    ):
-                        inner_key = registered_type
-                        break
-                if inner_key is None and inner_name in self._aliases:
-                    inner_key = self._aliases[inner_name]
-            
-            if is_lazy and inner_key is not None:                # 非可选依赖需要确保真实类型已注册
-                if inner_key not in registrations:
-                    if not dep.is_optional:
-                        raise ServiceNotFoundError(inner_key)
-                    # 可选依赖且未注册: 跳过注入
+        Returns:
+            调用时解析内部服务的工厂
+        """
+        factories = self._lazy_async_factories if is_async else self._lazy_sync_factories
+        factory = factories.get(key)
+        if factory is None:
+            factory = functools.partial(self.resolve_async if is_async else self.resolve, key)
+            factories[key] = factory
+        return factory
+
+    def _update_singleton_shortcut(self) -> None:
+        """重新计算解析依赖时可直接读取的单例存储.
+
+        性能优化: 已缓存的单例依赖直接从单例存储读取, 不再经过 resolve.
+        存在前置拦截器或启用性能跟踪时, 每次解析都必须经过 resolve, 此时为 None.
+        只在拦截器或容器状态变化时调用, 解析时只需读取一个属性.
+        """
+        if self._before_interceptors or self._enable_performance_tracking:
+            self._singleton_shortcut: SingletonStore | None = None
+        else:
+            self._singleton_shortcut = self._lifetime_manager._singleton_store
+
+    def _resolve_positional(self, plan: tuple[tuple[str, int, Any, bool], ...]) -> list[Any]:
+        """按解析计划解析位置参数(计划中全部为必需的常规依赖).
+
+        Args:
+            plan: 预编译的解析计划
+
+        Returns:
+            按位置排列的依赖实例列表
+        """
+        resolve = self.resolve
+        singletons = self._singleton_shortcut
+        args: list[Any] = []
+        for _, kind, service_key, _ in plan:
+            if kind == _DEP_SINGLETON and singletons is not None:
+                instance = singletons.get(service_key, _MISSING)
+                if instance is not _MISSING:
+                    args.append(instance)
                     continue
+            args.append(resolve(service_key))
+        return args
 
-                # 如果内部服务是异步的,使用异步解析工厂; 否则使用同步解析
-                inner_reg = registrations.get(inner_key)
-                if inner_reg is not None and inner_reg.is_async:
-                    # 使用默认参数捕获 inner_key,避免闭包问题
-                    kwargs[dep.parameter_name] = LazyProxy(lambda k=inner_key: self.resolve_async(k))
-                else:
-                    # 使用默认参数捕获 inner_key,避免闭包问题
-                    kwargs[dep.parameter_name] = LazyProxy(lambda k=inner_key: self.resolve(k))
-                continue
+    def _resolve_dependencies(self, dependencies: tuple[DependencyInfo, ...]) -> dict[str, Any]:
+        """解析依赖参数.
 
-            # 常规依赖解析路径
-            if dep.service_key not in registrations:
-                if not dep.is_optional:
-                    raise ServiceNotFoundError(dep.service_key)
-                continue
+        Args:
+            dependencies: 依赖信息元组
 
-            try:
-                kwargs[dep.parameter_name] = self.resolve(dep.service_key)
-            except Exception:
-                if not dep.is_optional:
-                    raise
-        return kwargs
+        Returns:
+            参数名到实例的映射
+
+        Raises:
+            ServiceNotFoundError: 必需依赖未注册时
+        """
+        return self._resolve_plan(self._compile_dependencies(dependencies))
 
-    def _invoke_factory(self, registration: ServiceRegistration, kwargs: dict[str, Any]) -> Any:
+    def _invoke_factory(
+        self, registration: ServiceRegistration, kwargs: dict[str, Any], args: list[Any] | tuple[Any, ...] = ()
+    ) -> Any:
         """调用工厂创建实例.
 
         Args:
             registration: 服务注册信息
             kwargs: 构造参数
+            args: 按位置传入的构造参数
 
         Returns:
             创建的实例
@@ -897,9 +1429,7 @@ class Container:
             raise ResolutionError(registration.key, Exception("No factory defined"))
 
         try:
-            if callable(factory):
-                return factory(**kwargs)
-            raise ResolutionError(registration.key, Exception("Factory is not callable"))
+            return factory(*args, **kwargs)
         except ResolutionError:
             raise
         except Exception as e:
@@ -919,20 +1449,32 @@ class Container:
         Raises:
             ResolutionError: 创建失败时
         """
-        # 分析依赖
-        dependencies = self._analyze_service_dependencies(registration)
+        # 性能优化: 无依赖的工厂直接调用, 跳过依赖分析和解析计划
+        if registration._no_deps:
+            return self._invoke_factory(registration, {})
+
+        plan = self._get_resolution_plan(registration)
+
+        # 性能优化: 已通过 compile() 生成专用创建函数时直接调用
+        compiled = registration._compiled_resolver
+        if compiled is not None:
+            return compiled(self)
 
-        # 解析依赖
-        kwargs = self._resolve_dependencies(dependencies)
+        # 性能优化: 依赖全部为必需的位置参数时按位置传参, 不构造 kwargs 字典
+        if registration._positional_deps is not None:
+            return self._invoke_factory(registration, {}, self._resolve_positional(plan))
+
+        # 按预编译的解析计划解析依赖
+        kwargs = self._resolve_plan(plan)
 
         # 调用工厂创建实例
         return self._invoke_factory(registration, kwargs)
 
-    async def _resolve_dependencies_async(self, dependencies: list[DependencyInfo]) -> dict[str, Any]:
-        """异步解析依赖参数.
+    async def _resolve_plan_async(self, plan: tuple[tuple[str, int, Any, bool], ...]) -> dict[str, Any]:
+        """按解析计划异步解析依赖参数.
 
         Args:
-            dependencies: 依赖信息列表
+            plan: 预编译的解析计划
 
         Returns:
             参数名到实例的映射
@@ -941,100 +1483,118 @@ class Container:
             ServiceNotFoundError: 必需依赖未注册时
         """
         kwargs: dict[str, Any] = {}
-        registrations = self._registrations
-        for dep in dependencies:
-            # 先规范化可能的字符串服务键到已注册类型(支持局部类/未来注解)
-            if isinstance(dep.service_key, str):
-                name = dep.service_key
-                if name in self._aliases:
-                    dep.service_key = self._aliases[name]
-                    if isinstance(dep.service_key, type):
-                        dep.service_type = dep.service_key
-                else:
-                    for registered_type in registrations.keys():
-                        if isinstance(registered_type, type):
-                            if (
-                                registered_type.__name__ == name
-                                or registered_type.__qualname__.split(".")[-1] == name
-                            ):
-                                dep.service_key = registered_type
-                                dep.service_type = registered_type
-                                break
-
-            # 处理 Lazy[T] 依赖: 在异步上下文中注入 LazyProxy
-            is_lazy = False
-            inner_key = None
-            
-            # 检查 LazyTypeMarker 实例
-            is_lazy_marker = (hasattr(dep.service_key, "inner_type") or
-                             (hasattr(dep.service_key, "__class__") and
-                              dep.service_key.__class__.__name__ == "LazyTypeMarker") or
-                             hasattr(dep.service_type, "inner_type") or
-                             (hasattr(dep.service_type, "__class__") and
-                              dep.service_type.__class__.__name__ == "LazyTypeMarker"))
-            
-            if is_lazy_marker:
-                is_lazy = True
-                marker = dep.service_key if (hasattr(dep.service_key, "inner_type") or
-                                            (hasattr(dep.service_key, "__class__") and
-                                             dep.service_key.__class__.__name__ == "LazyTypeMarker")) else dep.service_type
-                inner_key = marker.inner_type
-            # 检查字符串形式的 Lazy[T]
-            elif (isinstance(dep.service_key, str) and
-                  dep.service_key.startswith("Lazy[") and
-                  dep.service_key.endswith("]")):
-                is_lazy = True
-                inner_name = dep.service_key[5:-1]
-                # 查找匹配的类型
-                for registered_type in registrations:
-                    if isinstance(registered_type, type) and (
-                        registered_type.__name__ == inner_name or
-                        registered_type.__qualname__.split(".")[-1] == inner_name
-                    ):
-                        inner_key = registered_type
-                        break
-                if inner_key is None and inner_name in self._aliases:
-                    inner_key = self._aliases[inner_name]
-            
-            if is_lazy and inner_key is not None:
-
-                # 非可选依赖需要确保真实类型已注册
-                if inner_key not in registrations:
-                    if not dep.is_optional:
-                        raise ServiceNotFoundError(inner_key)
-                    # 可选依赖且未注册: 跳过注入
+        singletons = self._singleton_shortcut
+        # 需要异步解析的常规依赖: (参数名, 服务键, 是否可选)
+        pending: list[tuple[str, Any, bool]] = []
+        for parameter_name, kind, service_key, is_optional in plan:
+            if kind == _DEP_SINGLETON and singletons is not None:
+                instance = singletons.get(service_key, _MISSING)
+                if instance is not _MISSING:
+                    kwargs[parameter_name] = instance
                     continue
+            if kind == _DEP_SERVICE or kind == _DEP_SINGLETON:
+                pending.append((parameter_name, service_key, is_optional))
+            elif kind == _DEP_LAZY:
+                kwargs[parameter_name] = LazyProxy(self._lazy_factory(service_key, False))
+            elif kind == _DEP_LAZY_ASYNC:
+                kwargs[parameter_name] = LazyProxy(self._lazy_factory(service_key, True))
+            else:
+                raise ServiceNotFoundError(service_key)
+
+        if len(pending) > 1 and self._frozen_version == self._registry_version:
+            # 性能优化: 依赖图已冻结时并发解析相互独立的依赖, 延迟取决于最慢的依赖而非总和
+            results = await self._gather_dependencies([service_key for _, service_key, _ in pending])
+            for (parameter_name, _, is_optional), result in zip(pending, results, strict=True):
+                if isinstance(result, BaseException):
+                    if not is_optional or not isinstance(result, Exception):
+                        raise result
+                    continue
+                kwargs[parameter_name] = result
+            return kwargs
 
-                # 如果内部服务是异步的,使用异步解析工厂; 否则使用同步解析
-                inner_reg = registrations.get(inner_key)
-                if inner_reg is not None and inner_reg.is_async:
-                    # 使用默认参数捕获 inner_key,避免闭包问题
-                    kwargs[dep.parameter_name] = LazyProxy(lambda k=inner_key: self.resolve_async(k))
-                else:
-                    # 使用默认参数捕获 inner_key,避免闭包问题
-                    kwargs[dep.parameter_name] = LazyProxy(lambda k=inner_key: self.resolve(k))
-                continue
-
-            # 常规依赖解析路径
-            if dep.service_key not in registrations:
-                if not dep.is_optional:
-                    raise ServiceNotFoundError(dep.service_key)
-                continue
-
+        for parameter_name, service_key, is_optional in pending:
             try:
                 # 在异步上下文中,总是使用异步解析
-                kwargs[dep.parameter_name] = await self.resolve_async(dep.service_key)
+                kwargs[parameter_name] = await self.resolve_async(service_key)
             except Exception:
-                if not dep.is_optional:
+                if not is_optional:
                     raise
         return kwargs
 
-    async def _invoke_factory_async(self, registration: ServiceRegistration, kwargs: dict[str, Any]) -> Any:
+    async def _gather_dependencies(self, keys: list[ServiceKey]) -> list[Any]:
+        """并发解析多个依赖.
+
+        仅在依赖图已通过 freeze() 检测且解析时不再使用共享的循环检测栈时调用,
+        各分支并发执行不会互相干扰检测状态.
+
+        Args:
+            keys: 服务键列表
+
+        Returns:
+            与服务键一一对应的解析结果, 解析失败的位置为异常对象
+        """
+        resolve_async = self.resolve_async
+        return await asyncio.gather(*(resolve_async(key) for key in keys), return_exceptions=True)
+
+    async def _resolve_positional_async(self, plan: tuple[tuple[str, int, Any, bool], ...]) -> list[Any]:
+        """按解析计划异步解析位置参数(计划中全部为必需的常规依赖).
+
+        Args:
+            plan: 预编译的解析计划
+
+        Returns:
+            按位置排列的依赖实例列表
+        """
+        singletons = self._singleton_shortcut
+        args: list[Any] = []
+        # 尚未解析的参数位置
+        pending: list[int] = []
+        for index, (_, kind, service_key, _) in enumerate(plan):
+            if kind == _DEP_SINGLETON and singletons is not None:
+                instance = singletons.get(service_key, _MISSING)
+                if instance is not _MISSING:
+                    args.append(instance)
+                    continue
+            args.append(service_key)
+            pending.append(index)
+
+        if len(pending) > 1 and self._frozen_version == self._registry_version:
+            # 性能优化: 依赖图已冻结时并发解析相互独立的依赖
+            results = await self._gather_dependencies([args[index] for index in pending])
+            for index, result in zip(pending, results, strict=True):
+                if isinstance(result, BaseException):
+                    raise result
+                args[index] = result
+            return args
+
+        resolve_async = self.resolve_async
+        for index in pending:
+            args[index] = await resolve_async(args[index])
+        return args
+
+    async def _resolve_dependencies_async(self, dependencies: tuple[DependencyInfo, ...]) -> dict[str, Any]:
+        """异步解析依赖参数.
+
+        Args:
+            dependencies: 依赖信息元组
+
+        Returns:
+            参数名到实例的映射
+
+        Raises:
+            ServiceNotFoundError: 必需依赖未注册时
+        """
+        return await self._resolve_plan_async(self._compile_dependencies(dependencies))
+
+    async def _invoke_factory_async(
+        self, registration: ServiceRegistration, kwargs: dict[str, Any], args: list[Any] | tuple[Any, ...] = ()
+    ) -> Any:
         """异步调用工厂创建实例.
 
         Args:
             registration: 服务注册信息
             kwargs: 构造参数
+            args: 按位置传入的构造参数
 
         Returns:
             创建的实例
@@ -1047,13 +1607,11 @@ class Container:
             raise ResolutionError(registration.key, Exception("No factory defined"))
 
         try:
-            if callable(factory):
-                if registration.is_async:
-                    # 异步工厂
-                    return await factory(**kwargs)
-                # 同步工厂也可以在异步中调用
-                return factory(**kwargs)
-            raise ResolutionError(registration.key, Exception("Factory is not callable"))
+            if registration.is_async:
+                # 异步工厂
+                return await factory(*args, **kwargs)
+            # 同步工厂也可以在异步中调用
+            return factory(*args, **kwargs)
         except ResolutionError:
             raise
         except Exception as e:
@@ -1073,37 +1631,44 @@ class Container:
         Raises:
             ResolutionError: 创建失败时
         """
-        # 分析依赖
-        dependencies = self._analyze_service_dependencies(registration)
+        # 性能优化: 无依赖的工厂直接调用, 跳过依赖分析和解析计划
+        if registration._no_deps:
+            return await self._invoke_factory_async(registration, {})
+
+        plan = self._get_resolution_plan(registration)
+
+        # 性能优化: 依赖全部为必需的位置参数时按位置传参, 不构造 kwargs 字典
+        if registration._positional_deps is not None:
+            args = await self._resolve_positional_async(plan)
+            return await self._invoke_factory_async(registration, {}, args)
 
-        # 异步解析依赖
-        kwargs = await self._resolve_dependencies_async(dependencies)
+        # 按预编译的解析计划异步解析依赖
+        kwargs = await self._resolve_plan_async(plan)
 
         # 异步调用工厂创建实例
         return await self._invoke_factory_async(registration, kwargs)
 
     async def _run_before_interceptors_async(self, key: ServiceKey, registration: ServiceRegistration) -> None:
         """异步执行前置拦截器."""
-        for interceptor in self._interceptors["before"]:
-            if inspect.iscoroutinefunction(interceptor):
+        for interceptor, is_coroutine in self._before_interceptors:
+            if is_coroutine:
                 await interceptor(key, registration)
             else:
                 interceptor(key, registration)
 
     async def _run_after_interceptors_async(self, key: ServiceKey, instance: Any) -> Any:
         """异步执行后置拦截器."""
-        result = instance
-        for interceptor in self._interceptors["after"]:
-            if inspect.iscoroutinefunction(interceptor):
-                result = await interceptor(key, result) or result
+        for interceptor, is_coroutine in self._after_interceptors:
+            if is_coroutine:
+                instance = await interceptor(key, instance) or instance
             else:
-                result = interceptor(key, result) or result
-        return result
+                instance = interceptor(key, instance) or instance
+        return instance
 
     async def _run_error_interceptors_async(self, key: ServiceKey, error: Exception) -> None:
         """异步执行错误拦截器."""
-        for interceptor in self._interceptors["error"]:
-            if inspect.iscoroutinefunction(interceptor):
+        for interceptor, is_coroutine in self._error_interceptors:
+            if is_coroutine:
                 await interceptor(key, error)
             else:
                 interceptor(key, error)
@@ -1169,6 +1734,17 @@ class Container:
 
         if actual_key in self._registrations:
             del self._registrations[actual_key]
+            del self._lookup[actual_key]
+            if actual_key in self._alias_reverse:
+                self._link_aliases(actual_key)
+            self._registry_version += 1
+            if isinstance(actual_key, type):
+                for name in {actual_key.__name__, actual_key.__qualname__.split(".")[-1]}:
+                    candidates = self._type_name_index.get(name)
+                    if candidates is not None:
+                        candidates.remove(actual_key)
+                        if not candidates:
+                            del self._type_name_index[name]
             # 清理该服务的实例
             self._lifetime_manager.remove_instance(actual_key)
             return True
@@ -1188,7 +1764,11 @@ class Container:
             # 清空所有
             self._registrations.clear()
             self._aliases.clear()
+            self._lookup.clear()
+            self._alias_reverse.clear()
+            self._type_name_index.clear()
             self._lifetime_manager.clear()
+            self._registry_version += 1
         else:
             # 清空指定生命周期
             to_remove = [key for key, reg in self._registrations.items() if reg.lifetime == lifetime]
@@ -1255,7 +1835,13 @@ class Container:
         if key not in self._registrations:
             raise ServiceNotFoundError(key, list(self._registrations.keys()))
 
+        previous = self._aliases.get(alias)
+        if previous is not None:
+            self._alias_reverse[previous].remove(alias)
         self._aliases[alias] = key
+        self._alias_reverse.setdefault(key, []).append(alias)
+        self._link_aliases(key)
+        self._registry_version += 1
         return self
 
     def scan(self, package: str | Path) -> Container:
@@ -1267,25 +1853,57 @@ class Container:
         Returns:
             容器实例(支持链式调用)
 
+        路径可以是单个 .py 文件, 也可以是目录(递归加载其中全部 .py 文件,
+        单个文件导入失败时跳过). 目录作为临时包加载, 文件之间可以使用相对导入;
+        收集完可注入对象后, 加载的模块从 sys.modules 中移除.
+
         Examples:
             >>> container.scan("myapp.services")
             >>> container.scan(Path("./services"))
         """
-        import contextlib
-
-        from .decorators import auto_register, is_injectable
+        from .decorators import _module_injectables, auto_register
 
         if isinstance(package, Path):
             # 路径扫描
-            package_str = str(package.absolute())
-            spec = importlib.util.spec_from_file_location("__scan_module__", package_str)
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                for name in dir(module):
-                    obj = getattr(module, name)
-                    if is_injectable(obj):
-                        auto_register(self, obj)
+            path = package.absolute()
+            root = f"__scan_module_{next(_scan_ids)}__"
+            try:
+                if path.is_dir():
+                    init_file = path / "__init__.py"
+                    if init_file.exists():
+                        # 先加载顶层包, 其余文件中的相对导入才能解析
+                        with contextlib.suppress(Exception):
+                            _load_module_from_path(root, init_file)
+                    if root not in sys.modules:
+                        # 没有可用的 __init__.py 时创建命名空间包
+                        namespace = importlib.util.module_from_spec(
+                            importlib.machinery.ModuleSpec(root, None, is_package=True)
+                        )
+                        namespace.__path__ = [str(path)]
+                        sys.modules[root] = namespace
+                    for file in sorted(path.rglob("*.py")):
+                        parts = file.relative_to(path).with_suffix("").parts
+                        if parts[-1] == "__init__":
+                            parts = parts[:-1]
+                        name = ".".join((root, *parts))
+                        try:
+                            # 已被其他文件通过相对导入加载的模块不再重复执行
+                            module = sys.modules.get(name) or _load_module_from_path(name, file)
+                        except Exception:  # noqa: BLE001
+                            # 单个文件导入失败(包括语法错误)时跳过, 不影响其余文件
+                            continue
+                        if module is not None:
+                            for obj in _module_injectables(module):
+                                auto_register(self, obj)
+                else:
+                    module = _load_module_from_path(root, path)
+                    if module is not None:
+                        for obj in _module_injectables(module):
+                            auto_register(self, obj)
+            finally:
+                prefix = f"{root}."
+                for name in [name for name in sys.modules if name == root or name.startswith(prefix)]:
+                    del sys.modules[name]
         else:
             # 包名扫描
             with contextlib.suppress(ImportError):
@@ -1296,11 +1914,133 @@ class Container:
                 ):
                     with contextlib.suppress(ImportError, AttributeError):
                         sub_module = importlib.import_module(name)
-                        for attr_name in dir(sub_module):
-                            obj = getattr(sub_module, attr_name)
-                            if is_injectable(obj):
-                                auto_register(self, obj)
+                        # 性能优化: 直接读取装饰器记录的可注入对象, 不遍历模块全部属性
+                        for obj in _module_injectables(sub_module):
+                            auto_register(self, obj)
+
+        return self
+
+    def freeze(self) -> Container:
+        """冻结依赖图并一次性检测循环依赖.
+
+        对全部注册项的依赖图运行 Tarjan 强连通分量算法(O(V+E)),
+        存在循环依赖时立即抛出异常. 检测通过后, 在注册表再次变化之前,
+        解析服务时不再逐次进行循环检测.
+
+        Lazy[T] 依赖延迟解析, 不会在构造时形成循环, 因此不计入依赖图.
+
+        Returns:
+            容器实例(支持链式调用)
+
+        Raises:
+            CircularDependencyError: 存在循环依赖时
+            ResolutionError: 依赖分析失败时
+
+        Examples:
+            >>> container.register(UserService)
+            >>> container.register(UserRepository)
+            >>> container.freeze()
+        """
+        registrations = self._registrations
+        keys = list(registrations)
+        all_succs, succ_ranges = build_dependency_graph(
+            keys, lambda key: self._construction_dependencies(registrations[key])
+        )
+        for component in cyclic_components(all_succs, succ_ranges):
+            raise CircularDependencyError(keys[component[0]], [keys[i] for i in component])
+
+        self._frozen_version = self._registry_version
+        return self
 
+    def _construction_dependencies(self, registration: ServiceRegistration) -> list[ServiceKey]:
+        """获取创建实例时需要先解析的依赖服务键.
+
+        Lazy[T] 依赖延迟解析, 不计入.
+
+        Args:
+            registration: 服务注册信息
+
+        Returns:
+            依赖服务键列表
+        """
+        if registration._no_deps:
+            return []
+        return [
+            dep_key
+            for _, kind, dep_key, _ in self._get_resolution_plan(registration)
+            if kind == _DEP_SERVICE or kind == _DEP_SINGLETON
+        ]
+
+    def _dependency_levels(self, keys: tuple[ServiceKey, ...]) -> list[list[ServiceKey]]:
+        """按依赖拓扑分层排列服务键.
+
+        第 0 层的服务不依赖其他已注册服务, 第 n 层服务的依赖都位于更低的层.
+        结果包含指定的服务键以及它们传递依赖的全部单例, 同一层内的服务相互独立.
+
+        Args:
+            keys: 服务键
+
+        Returns:
+            按层排列的服务键列表
+        """
+        registrations = self._registrations
+        dependencies: dict[ServiceKey, list[ServiceKey]] = {}
+        levels: dict[ServiceKey, int] = {}
+
+        for root in keys:
+            if root in levels or root not in registrations:
+                continue
+            # 迭代式后序遍历, 避免深依赖链触发递归深度限制; 循环依赖的回边直接忽略
+            visiting = {root}
+            dependencies[root] = self._construction_dependencies(registrations[root])
+            stack = [(root, iter(dependencies[root]))]
+            while stack:
+                key, remaining = stack[-1]
+                for dep_key in remaining:
+                    if dep_key not in levels and dep_key not in visiting:
+                        visiting.add(dep_key)
+                        dependencies[dep_key] = self._construction_dependencies(registrations[dep_key])
+                        stack.append((dep_key, iter(dependencies[dep_key])))
+                        break
+                else:
+                    stack.pop()
+                    visiting.discard(key)
+                    levels[key] = 1 + max((levels[dep] for dep in dependencies[key] if dep in levels), default=-1)
+
+        targets = set(keys)
+        layered: list[list[ServiceKey]] = []
+        for key, level in levels.items():
+            if key not in targets and registrations[key].lifetime is not _SINGLETON:
+                continue
+            while len(layered) <= level:
+                layered.append([])
+            layered[level].append(key)
+        return [layer for layer in layered if layer]
+
+    def compile(self) -> Container:
+        """为全部注册项生成专用的实例创建函数.
+
+        根据每个服务的解析计划生成并编译 Python 源码, 同步解析时直接调用
+        生成的函数创建实例, 不再经过通用的依赖解析循环. 注册表变化后,
+        受影响服务的解析计划重新编译时, 生成的函数随之失效并回退到通用路径,
+        可再次调用本方法重新生成.
+
+        Returns:
+            容器实例(支持链式调用)
+
+        Raises:
+            ResolutionError: 依赖分析失败时
+
+        Examples:
+            >>> container.register(UserService)
+            >>> container.compile()
+        """
+        for registration in self._registrations.values():
+            if registration._no_deps:
+                continue
+            plan = self._get_resolution_plan(registration)
+            if not registration._no_deps:
+                registration._compiled_resolver = _generate_resolver(registration, plan)
         return self
 
     def warmup(self, *keys: ServiceKey) -> None:
@@ -1313,16 +2053,17 @@ class Container:
             >>> container.warmup(DatabaseService, CacheService)
             >>> container.warmup()  # 预热所有单例
         """
-        import contextlib
-
         if not keys:
             # 预热所有单例
-            keys = tuple(key for key, reg in self._registrations.items() if reg.lifetime == Lifetime.SINGLETON)
+            keys = tuple(key for key, reg in self._registrations.items() if reg.lifetime is _SINGLETON)
 
         for key in keys:
             # 预热失败不影响后续服务
-            with contextlib.suppress(ContainerException, ResolutionError):
+            # 性能优化: 使用 try/except 代替 contextlib.suppress, 避免每个服务创建上下文管理器
+            try:  # noqa: SIM105
                 self.resolve(key)
+            except (ContainerException, ResolutionError):
+                pass
 
     async def warmup_async(self, *keys: ServiceKey) -> None:
         """异步预热服务,提前创建单例实例.
@@ -1330,20 +2071,33 @@ class Container:
         Args:
             *keys: 要预热的服务键,不提供则预热所有单例
 
+        依赖图已通过 freeze() 冻结时, 按依赖拓扑分层并发预热: 同一层的服务相互独立,
+        并发创建; 共享的单例依赖位于更低的层, 提前创建且只创建一次.
+
         Examples:
             >>> await container.warmup_async(DatabaseService, CacheService)
             >>> await container.warmup_async()  # 预热所有单例
         """
-        import contextlib
-
         if not keys:
             # 预热所有单例
-            keys = tuple(key for key, reg in self._registrations.items() if reg.lifetime == Lifetime.SINGLETON)
+            keys = tuple(key for key, reg in self._registrations.items() if reg.lifetime is _SINGLETON)
+
+        if len(keys) > 1 and self._frozen_version == self._registry_version:
+            for layer in self._dependency_levels(keys):
+                # 预热失败不影响后续服务, 与逐个预热一致, 只有容器解析错误被忽略
+                for result in await self._gather_dependencies(layer):
+                    if isinstance(result, BaseException) and not isinstance(
+                        result, (ContainerException, ResolutionError)
+                    ):
+                        raise result
+            return
 
         for key in keys:
             # 预热失败不影响后续服务
-            with contextlib.suppress(ContainerException, ResolutionError):
+            try:  # noqa: SIM105
                 await self.resolve_async(key)
+            except (ContainerException, ResolutionError):
+                pass
 
     def __getitem__(self, key: ServiceKey) -> Any:
         """简写语法: container[Service].
@@ -1357,7 +2111,7 @@ class Container:
         Examples:
             >>> service = container[UserService]
         """
-        return self.resolve(key)
+        return self._resolve(key)
 
     def __setitem__(self, key: ServiceKey, value: Any) -> None:
         """简写语法: container["key"] = instance.
@@ -1419,11 +2173,17 @@ class Container:
             ...     return True
             >>> container.add_interceptor("before", log_before)
         """
-        if interceptor_type not in self._interceptors:
+        if interceptor_type not in _INTERCEPTOR_TYPES:
             msg = f"Invalid interceptor type: {interceptor_type}"
             raise ValueError(msg)
 
-        self._interceptors[interceptor_type].append(interceptor)
+        attr = f"_{interceptor_type}_interceptors"
+        entry = (interceptor, inspect.iscoroutinefunction(interceptor))
+        setattr(self, attr, (*getattr(self, attr), entry))
+        if entry[1]:
+            self._async_interceptor_types |= {interceptor_type}
+
+        self._update_singleton_shortcut()
         return self
 
     # ===================== 工具方法 =====================
@@ -1437,7 +2197,7 @@ class Container:
         Returns:
             是否已注册
         """
-        return key in self._registrations or key in self._aliases
+        return key in self._lookup
 
     def get_registration(self, key: ServiceKey) -> ServiceRegistration | None:
         """获取服务注册信息.
@@ -1450,13 +2210,16 @@ class Container:
         """
         return self._registrations.get(key)
 
-    def get_all_registrations(self) -> dict[ServiceKey, ServiceRegistration]:
+    def get_all_registrations(self) -> Mapping[ServiceKey, ServiceRegistration]:
         """获取所有注册信息.
 
+        性能优化: 返回注册表的只读视图, 不复制整个字典. 视图随注册表实时更新,
+        需要快照时请自行调用 dict().
+
         Returns:
-            所有注册信息的字典
+            所有注册信息的只读映射
         """
-        return self._registrations.copy()
+        return MappingProxyType(self._registrations)
 
     def get_performance_stats(self) -> dict[str, Any]:
         """获取性能统计信息.
@@ -1489,7 +2252,16 @@ class Container:
         """
         self._lifetime_manager.dispose_all()
         self._registrations.clear()
-        self._interceptors.clear()
+        self._lookup.clear()
+        self._type_name_index.clear()
+        self._lazy_sync_factories.clear()
+        self._lazy_async_factories.clear()
+        self._registry_version += 1
+        self._before_interceptors = ()
+        self._after_interceptors = ()
+        self._error_interceptors = ()
+        self._async_interceptor_types = frozenset()
+        self._update_singleton_shortcut()
         self._circular_detector.reset()
         self._performance_metrics.reset()
 
@@ -1521,6 +2293,8 @@ class Scope:
         _scope_id: 作用域 ID
     """
 
+    __slots__ = ("_container", "_scope_id")
+
     def __init__(self, container: Container) -> None:
         """初始化作用域.
 
@@ -1528,7 +2302,7 @@ class Scope:
             container: 关联的容器
         """
         self._container = container
-        self._scope_id = str(uuid.uuid4())
+        self._scope_id = f"scope-{next(_scope_ids)}"
 
     def __enter__(self) -> Scope:
         """进入作用域."""
@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 import inspect
+import sys
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from .types import Lifetime
@@ -34,6 +35,8 @@ class ServiceMetadata:
         key: 服务键(可选)
     """
 
+    __slots__ = ("key", "lifetime", "service_type")
+
     def __init__(
         self,
         service_type: type | Callable[..., Any],
@@ -52,6 +55,60 @@ class ServiceMetadata:
         self.key = key
 
 
+def _attach_metadata(obj: Any, lifetime: Lifetime, key: Any) -> None:
+    """为类或函数附加服务元数据.
+
+    性能优化: 重复装饰且配置相同时复用已有的元数据对象, 不再重新分配.
+    只检查对象自身的属性, 不复用从基类继承的元数据.
+
+    Args:
+        obj: 要装饰的类或函数
+        lifetime: 生命周期
+        key: 服务键
+    """
+    existing = vars(obj).get("__symphra_metadata__")
+    if existing is None or existing.lifetime is not lifetime or existing.key != key:
+        obj.__symphra_metadata__ = ServiceMetadata(service_type=obj, lifetime=lifetime, key=key)
+    if existing is None:
+        # 只在首次装饰时记录, 重复装饰的对象已在注册表中, 无需再扫描注册表去重
+        _track_injectable(obj)
+
+
+def _track_injectable(obj: Any) -> None:
+    """记录装饰过的类或函数到其定义模块的注册表.
+
+    注册表保存在模块的 ``__symphra_injectables__`` 属性中,
+    Container.scan 直接读取, 不必遍历模块的全部属性.
+
+    Args:
+        obj: 装饰过的类或函数
+    """
+    # 函数内部定义的类或函数不会绑定在模块级别, 不必记录
+    if "<locals>" in getattr(obj, "__qualname__", ""):
+        return
+    module = sys.modules.get(getattr(obj, "__module__", None) or "")
+    if module is None:
+        return
+    module.__dict__.setdefault("__symphra_injectables__", []).append(obj)
+
+
+def _module_injectables(module: Any) -> list[Any]:
+    """获取模块中定义并在模块级别绑定的可注入对象.
+
+    Args:
+        module: 模块对象
+
+    Returns:
+        按装饰顺序排列的类或函数列表
+    """
+    namespace = vars(module)
+    return [
+        obj
+        for obj in namespace.get("__symphra_injectables__", ())
+        if namespace.get(getattr(obj, "__name__", None)) is obj
+    ]
+
+
 def injectable(
     cls_or_lifetime: type | Lifetime = Lifetime.TRANSIENT,
     *,
@@ -111,13 +168,7 @@ def _apply_injectable_decorator(
     Returns:
         装饰后的类
     """
-    service_key = key or cls
-    metadata = ServiceMetadata(
-        service_type=cls,
-        lifetime=lifetime,
-        key=service_key,
-    )
-    cls.__symphra_metadata__ = metadata  # type: ignore
+    _attach_metadata(cls, lifetime, key or cls)
     return cls
 
 
@@ -197,26 +248,14 @@ def factory(
     # 无参用法: 直接传入函数 `@factory`
     if inspect.isfunction(lifetime_or_func) and not isinstance(lifetime_or_func, Lifetime):
         func = lifetime_or_func  # type: ignore[assignment]
-        service_key = key or func.__name__
-        metadata = ServiceMetadata(
-            service_type=func,
-            lifetime=Lifetime.TRANSIENT,
-            key=service_key,
-        )
-        func.__symphra_metadata__ = metadata  # type: ignore[attr-defined]
+        _attach_metadata(func, Lifetime.TRANSIENT, key or func.__name__)
         return func
 
     # 参数化用法: `@factory(...)`
     lifetime = lifetime_or_func if isinstance(lifetime_or_func, Lifetime) else Lifetime.TRANSIENT
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        service_key = key or func.__name__
-        metadata = ServiceMetadata(
-            service_type=func,
-            lifetime=lifetime,
-            key=service_key,
-        )
-        func.__symphra_metadata__ = metadata  # type: ignore[attr-defined]
+        _attach_metadata(func, lifetime, key or func.__name__)
         return func
 
     return decorator
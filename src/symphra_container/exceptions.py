@@ -14,6 +14,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .types import ServiceKey
 
 
@@ -22,6 +24,10 @@ class ContainerException(Exception):
 
     所有容器相关异常都继承自此基类.
 
+    性能优化: 子类只保存构成消息的原始字段, 消息在首次读取时由 _format_message() 生成.
+    解析路径上被捕获后直接丢弃的异常不再产生任何字符串格式化开销.
+    args 保留构造时传入的原始参数, 异常可以正常序列化.
+
     Attributes:
         message: 异常消息
         service_key: 相关的服务键(如果适用)
@@ -29,24 +35,52 @@ class ContainerException(Exception):
 
     def __init__(
         self,
-        message: str,
+        message: str | None = None,
         service_key: ServiceKey | None = None,
     ) -> None:
         """初始化容器异常.
 
         Args:
-            message: 异常消息
+            message: 异常消息, 为 None 时在首次读取时生成
             service_key: 相关的服务键
         """
-        self.message = message
+        self._message = message
+        self._str: str | None = None
         self.service_key = service_key
-        super().__init__(message)
+
+    @property
+    def message(self) -> str:
+        """异常消息."""
+        message = self._message
+        if message is None:
+            message = self._message = self._format_message()
+        return message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        """替换异常消息, 并使缓存的字符串表示失效."""
+        self._message = value
+        self._str = None
+
+    def _format_message(self) -> str:
+        """生成异常消息.
+
+        Returns:
+            异常消息
+        """
+        return ""
 
     def __str__(self) -> str:
         """返回异常的字符串表示."""
-        if self.service_key:
-            return f"{self.__class__.__name__}: {self.message} (service_key: {self.service_key})"
-        return f"{self.__class__.__name__}: {self.message}"
+        # 性能优化: 日志等场景会多次调用 str(), 首次格式化后缓存结果
+        text = self._str
+        if text is None:
+            if self.service_key:
+                text = f"{self.__class__.__name__}: {self.message} (service_key: {self.service_key})"
+            else:
+                text = f"{self.__class__.__name__}: {self.message}"
+            self._str = text
+        return text
 
 
 class ServiceNotFoundError(ContainerException):
@@ -79,11 +113,15 @@ class ServiceNotFoundError(ContainerException):
             registered_services: 已注册的服务列表
         """
         self.registered_services = registered_services or []
-        message = f"Service '{service_key}' not found in container"
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
+        message = f"Service '{self.service_key}' not found in container"
         if self.registered_services:
             # 建议相似的服务
             message += f". Registered services: {self.registered_services[:5]}"
-        super().__init__(message, service_key)
+        return message
 
 
 class CircularDependencyError(ContainerException):
@@ -115,7 +153,7 @@ class CircularDependencyError(ContainerException):
     def __init__(
         self,
         service_key: ServiceKey,
-        dependency_chain: list[ServiceKey] | None = None,
+        dependency_chain: Sequence[ServiceKey] | None = None,
     ) -> None:
         """初始化循环依赖异常.
 
@@ -124,9 +162,12 @@ class CircularDependencyError(ContainerException):
             dependency_chain: 依赖链
         """
         self.dependency_chain = dependency_chain or []
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
         chain_str = " -> ".join(str(k) for k in self.dependency_chain)
-        message = f"Circular dependency detected: {chain_str} -> {service_key}"
-        super().__init__(message, service_key)
+        return f"Circular dependency detected: {chain_str} -> {self.service_key}"
 
 
 class TypeMismatchError(ContainerException):
@@ -155,10 +196,14 @@ class TypeMismatchError(ContainerException):
         """
         self.expected_type = expected_type
         self.actual_type = actual_type
-        message = (
-            f"Type mismatch for service '{service_key}': expected {expected_type.__name__}, got {actual_type.__name__}"
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
+        return (
+            f"Type mismatch for service '{self.service_key}': "
+            f"expected {self.expected_type.__name__}, got {self.actual_type.__name__}"
         )
-        super().__init__(message, service_key)
 
 
 class RegistrationError(ContainerException):
@@ -184,8 +229,11 @@ class RegistrationError(ContainerException):
             reason: 失败原因
         """
         self.reason = reason
-        message = f"Failed to register service '{service_key}': {reason}"
-        super().__init__(message, service_key)
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
+        return f"Failed to register service '{self.service_key}': {self.reason}"
 
 
 class ResolutionError(ContainerException):
@@ -211,10 +259,14 @@ class ResolutionError(ContainerException):
             original_exception: 原始异常
         """
         self.original_exception = original_exception
-        message = f"Failed to resolve service '{service_key}'"
-        if original_exception:
-            message += f": {original_exception!s}"
-        super().__init__(message, service_key)
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
+        message = f"Failed to resolve service '{self.service_key}'"
+        if self.original_exception:
+            message += f": {self.original_exception!s}"
+        return message
 
 
 class InvalidConfigurationError(ContainerException):
@@ -261,8 +313,12 @@ class OptionalDependencyError(ContainerException):
             service_key: 服务键
             dependency_key: 可选依赖键
         """
-        message = f"Failed to resolve optional dependency '{dependency_key}' for service '{service_key}'"
-        super().__init__(message, service_key)
+        self.dependency_key = dependency_key
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
+        return f"Failed to resolve optional dependency '{self.dependency_key}' for service '{self.service_key}'"
 
 
 class ScopeNotActiveError(ContainerException):
@@ -316,10 +372,14 @@ class InterceptorError(ContainerException):
         """
         self.interceptor_name = interceptor_name
         self.original_exception = original_exception
-        message = f"Interceptor '{interceptor_name}' failed for service '{service_key}'"
-        if original_exception:
-            message += f": {original_exception!s}"
-        super().__init__(message, service_key)
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
+        message = f"Interceptor '{self.interceptor_name}' failed for service '{self.service_key}'"
+        if self.original_exception:
+            message += f": {self.original_exception!s}"
+        return message
 
 
 class FactoryError(ContainerException):
@@ -345,7 +405,11 @@ class FactoryError(ContainerException):
             original_exception: 原始异常
         """
         self.original_exception = original_exception
-        message = f"Factory function for service '{service_key}' raised an exception"
-        if original_exception:
-            message += f": {original_exception!s}"
-        super().__init__(message, service_key)
+        super().__init__(None, service_key)
+
+    def _format_message(self) -> str:
+        """生成异常消息."""
+        message = f"Factory function for service '{self.service_key}' raised an exception"
+        if self.original_exception:
+            message += f": {self.original_exception!s}"
+        return message
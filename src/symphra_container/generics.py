@@ -28,6 +28,8 @@
 
 from __future__ import annotations
 
+import weakref
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypeVar, get_args, get_origin
 
 if TYPE_CHECKING:
@@ -38,6 +40,10 @@ __all__ = ["GenericKey", "register_generic", "resolve_generic"]
 
 T = TypeVar("T")
 
+# 驻留的泛型键: (origin, args) -> GenericKey
+# 只保存弱引用, 容器与解析缓存都不再使用的泛型键可以被回收
+_KEY_CACHE: weakref.WeakValueDictionary[tuple[Any, tuple[Any, ...]], GenericKey] = weakref.WeakValueDictionary()
+
 
 class GenericKey:
     """泛型类型键.
@@ -55,6 +61,8 @@ class GenericKey:
         >>> key1 == GenericKey(Repository, (User,))  # True
     """
 
+    __slots__ = ("__weakref__", "_hash", "_repr", "args", "origin")
+
     def __init__(self, origin: type, args: tuple[type, ...]) -> None:
         """初始化泛型键.
 
@@ -64,21 +72,51 @@ class GenericKey:
         """
         self.origin = origin
         self.args = args
+        # 性能优化: 预先计算哈希值,避免每次字典查找都对参数元组求哈希
+        self._hash = hash((origin, args))
+        # 字符串表示在首次使用时生成(日志、错误信息), 之后直接复用
+        self._repr: str | None = None
+
+    @classmethod
+    def of(cls, origin: type, args: tuple[type, ...]) -> GenericKey:
+        """获取驻留的泛型键.
+
+        相同 (origin, args) 总是返回同一个实例, 使得字典查找可以
+        通过身份比较快速命中.
+
+        Args:
+            origin: 泛型基类
+            args: 类型参数元组
+
+        Returns:
+            驻留的 GenericKey 实例
+        """
+        cache_key = (origin, args)
+        key = _KEY_CACHE.get(cache_key)
+        if key is None:
+            key = cls(origin, args)
+            _KEY_CACHE[cache_key] = key
+        return key
 
     def __eq__(self, other: object) -> bool:
         """判断相等."""
+        if self is other:
+            return True
         if not isinstance(other, GenericKey):
             return False
         return self.origin == other.origin and self.args == other.args
 
     def __hash__(self) -> int:
         """计算哈希值."""
-        return hash((self.origin, self.args))
+        return self._hash
 
     def __repr__(self) -> str:
         """字符串表示."""
-        args_str = ", ".join(arg.__name__ for arg in self.args)
-        return f"{self.origin.__name__}[{args_str}]"
+        text = self._repr
+        if text is None:
+            args_str = ", ".join(arg.__name__ for arg in self.args)
+            text = self._repr = f"{self.origin.__name__}[{args_str}]"
+        return text
 
 
 def _extract_generic_info(generic_type: Any) -> GenericKey | None:
@@ -103,7 +141,25 @@ def _extract_generic_info(generic_type: Any) -> GenericKey | None:
     if not args:
         return None
 
-    return GenericKey(origin, args)
+    return GenericKey.of(origin, args)
+
+
+@lru_cache(maxsize=1024)
+def _cached_generic_key(generic_type: Any) -> GenericKey | None:
+    """按泛型类型缓存 _extract_generic_info 的结果."""
+    return _extract_generic_info(generic_type)
+
+
+def _generic_key_for(generic_type: Any) -> GenericKey | None:
+    """获取泛型类型对应的 GenericKey.
+
+    重复传入的 Repository[User] 等别名会直接命中缓存,
+    无法哈希的类型提示则退回到逐次提取.
+    """
+    try:
+        return _cached_generic_key(generic_type)
+    except TypeError:
+        return _extract_generic_info(generic_type)
 
 
 def register_generic(
@@ -138,7 +194,7 @@ def register_generic(
     """
     from .types import Lifetime as LifetimeEnum
 
-    generic_key = _extract_generic_info(generic_type)
+    generic_key = _generic_key_for(generic_type)
     if generic_key is None:
         msg = f"Not a valid generic type: {generic_type}"
         raise ValueError(msg)
@@ -179,7 +235,7 @@ def resolve_generic(container: Container, generic_type: Any) -> Any:
         >>> user_repo = resolve_generic(container, Repository[User])
         >>> order_repo = resolve_generic(container, Repository[Order])
     """
-    generic_key = _extract_generic_info(generic_type)
+    generic_key = _generic_key_for(generic_type)
     if generic_key is None:
         msg = f"Not a valid generic type: {generic_type}"
         raise ValueError(msg)
@@ -201,4 +257,5 @@ def is_generic_type(type_hint: Any) -> bool:
         >>> is_generic_type(Repository)  # False
         >>> is_generic_type(User)  # False
     """
+    # 只做判断, 不构建 GenericKey: Callable[[int], str] 等参数含列表的类型提示无法哈希
     return get_origin(type_hint) is not None and get_args(type_hint) != ()
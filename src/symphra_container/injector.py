@@ -10,13 +10,18 @@
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import types
 from typing import Any, Union, get_args, get_origin, get_type_hints
 
+from .circular import LazyTypeMarker
 from .exceptions import ResolutionError
 from .types import InjectionMarker, ServiceKey
 
+# 不需要注入的基础数据类型
+_SIMPLE_TYPES: frozenset[type] = frozenset({str, int, bool, float, bytes, list, dict, set, tuple, type(None)})
+
 
 class DependencyInfo:
     """依赖信息.
@@ -30,8 +35,23 @@ class DependencyInfo:
         is_optional: 是否可选
         default_value: 默认值
         is_injected: 是否使用 Injected 标记
+        lazy_inner_name: 字符串形式 Lazy["Name"] 依赖中的内部类型名, 其他依赖为 None
+        lazy_inner_type: Lazy[T] 标记依赖中的内部类型, 其他依赖为 None
+        is_lazy: 是否为 Lazy[T] 依赖(标记或字符串形式)
     """
 
+    __slots__ = (
+        "default_value",
+        "is_injected",
+        "is_lazy",
+        "is_optional",
+        "lazy_inner_name",
+        "lazy_inner_type",
+        "parameter_name",
+        "service_key",
+        "service_type",
+    )
+
     def __init__(
         self,
         parameter_name: str,
@@ -57,6 +77,20 @@ class DependencyInfo:
         self.is_optional = is_optional
         self.default_value = default_value
         self.is_injected = is_injected
+        # 性能优化: 依赖信息只在分析时创建一次, 在此预先解析 Lazy["Name"] 字符串
+        self.lazy_inner_name: str | None = (
+            service_key[5:-1]
+            if isinstance(service_key, str) and service_key.startswith("Lazy[") and service_key.endswith("]")
+            else None
+        )
+        # Lazy[T] 标记与注册表无关, 同样在分析时一次识别
+        if isinstance(service_key, LazyTypeMarker):
+            self.lazy_inner_type: Any = service_key.inner_type
+        elif isinstance(service_type, LazyTypeMarker):
+            self.lazy_inner_type = service_type.inner_type
+        else:
+            self.lazy_inner_type = None
+        self.is_lazy = self.lazy_inner_type is not None or self.lazy_inner_name is not None
 
     def __repr__(self) -> str:
         """返回字符串表示."""
@@ -78,7 +112,10 @@ class ConstructorInjector:
     """
 
     # 类级别的依赖分析缓存 - 大幅提升重复解析性能
-    _dependency_cache: dict[type, list[DependencyInfo]] = {}
+    _dependency_cache: dict[type, tuple[DependencyInfo, ...]] = {}
+
+    # 类型提示缓存: 构造函数 -> 类型提示字典, 继承同一构造函数的子类共享结果
+    _type_hints_cache: dict[Any, dict[str, Any]] = {}
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -87,6 +124,7 @@ class ConstructorInjector:
         在测试或动态加载类时可能需要清空缓存.
         """
         cls._dependency_cache.clear()
+        cls._type_hints_cache.clear()
 
     @staticmethod
     def _get_type_hints_safe(obj: Any) -> dict[str, Any]:
@@ -98,22 +136,61 @@ class ConstructorInjector:
         Returns:
             类型提示字典
         """
+        # 性能优化: get_type_hints 需要求值字符串注解, 同一对象只解析一次
+        cache = ConstructorInjector._type_hints_cache
         try:
-            # 获取对象的模块命名空间用于解析字符串注解
-            globalns = getattr(obj, "__globals__", None)
-            if globalns is None and hasattr(obj, "__module__"):
-                import sys
-                module = sys.modules.get(obj.__module__)
-                if module:
-                    globalns = vars(module)
-
-            # 如果有模块命名空间,传递给 get_type_hints
-            if globalns:
-                return get_type_hints(obj, globalns=globalns)
-            else:
-                return get_type_hints(obj)
-        except Exception:  # noqa: BLE001
-            return getattr(obj, "__annotations__", {})
+            return cache[obj]
+        except (KeyError, TypeError):
+            pass
+
+        # 性能优化: 函数注解全部是普通类(或返回值 None)时无需求值, 直接使用原始注解;
+        # 字符串、前向引用、泛型别名、Annotated 等仍交给 get_type_hints 处理
+        hints = ConstructorInjector._concrete_annotations(obj)
+        if hints is None:
+            try:
+                # 获取对象的模块命名空间用于解析字符串注解
+                globalns = getattr(obj, "__globals__", None)
+                if globalns is None and hasattr(obj, "__module__"):
+                    import sys
+                    module = sys.modules.get(obj.__module__)
+                    if module:
+                        globalns = vars(module)
+
+                # 如果有模块命名空间,传递给 get_type_hints
+                if globalns:
+                    hints = get_type_hints(obj, globalns=globalns)
+                else:
+                    hints = get_type_hints(obj)
+            except Exception:  # noqa: BLE001
+                # 前向引用可能稍后才能解析, 失败结果不缓存
+                return getattr(obj, "__annotations__", {})
+
+        with contextlib.suppress(TypeError):
+            cache[obj] = hints
+        return hints
+
+    @staticmethod
+    def _concrete_annotations(obj: Any) -> dict[str, Any] | None:
+        """在注解全部为具体类时直接返回类型提示.
+
+        Args:
+            obj: 目标对象(类或函数)
+
+        Returns:
+            与 get_type_hints 等价的类型提示字典; 存在需要求值的注解时返回 None
+        """
+        # 类的类型提示需要合并 MRO 上的注解, 只处理普通函数
+        if not isinstance(obj, types.FunctionType):
+            return None
+
+        hints: dict[str, Any] = {}
+        for name, hint in obj.__annotations__.items():
+            if hint is None:
+                hint = type(None)
+            elif not isinstance(hint, type) or isinstance(hint, types.GenericAlias):
+                return None
+            hints[name] = hint
+        return hints
 
     @staticmethod
     def _is_simple_type(param_type: type) -> bool:
@@ -125,8 +202,12 @@ class ConstructorInjector:
         Returns:
             是否为简单类型
         """
-        simple_types = (str, int, bool, float, bytes, list, dict, set, tuple, type(None))
-        return param_type in simple_types
+        # 性能优化: 模块级 frozenset 哈希查找, 不再每次构造元组逐个比较
+        try:
+            return param_type in _SIMPLE_TYPES
+        except TypeError:
+            # 无法哈希的注解对象不可能是基础类型
+            return False
 
     @staticmethod
     def _extract_optional_type(param_type: Any) -> tuple[bool, Any]:
@@ -151,7 +232,7 @@ class ConstructorInjector:
         return False, param_type
 
     @staticmethod
-    def analyze_dependencies(service_class: type) -> list[DependencyInfo]:
+    def analyze_dependencies(service_class: type) -> tuple[DependencyInfo, ...]:
         """分析服务类的构造函数依赖.
 
         通过检查 __init__ 方法的参数,提取所有依赖关系.
@@ -167,7 +248,7 @@ class ConstructorInjector:
             service_class: 服务类
 
         Returns:
-            依赖信息列表
+            依赖信息元组(缓存共享, 不可修改)
 
         Raises:
             ResolutionError: 无法分析依赖时
@@ -180,9 +261,10 @@ class ConstructorInjector:
             >>> assert len(deps) == 1
             >>> assert deps[0].service_key == UserRepository
         """
-        # 性能优化: 检查缓存,避免重复分析
-        if service_class in ConstructorInjector._dependency_cache:
-            return ConstructorInjector._dependency_cache[service_class]
+        # 性能优化: 检查缓存,避免重复分析; 单次字典查找, 空依赖列表同样命中
+        cached = ConstructorInjector._dependency_cache.get(service_class)
+        if cached is not None:
+            return cached
 
         dependencies: list[DependencyInfo] = []
 
@@ -210,12 +292,25 @@ class ConstructorInjector:
                 # 获取参数的实际类型
                 param_type = type_hints.get(param_name, param.annotation)
 
+                # 性能优化: 基础类型过滤与可选类型提取在循环内一次完成,
+                # 与 _is_simple_type / _extract_optional_type 逻辑一致, 省去逐参数的函数调用
                 # 过滤掉基础数据类型(它们不需要注入)
-                if ConstructorInjector._is_simple_type(param_type):
-                    continue
+                try:
+                    if param_type in _SIMPLE_TYPES:
+                        continue
+                except TypeError:
+                    pass
 
                 # 处理可选类型并提取真实类型
-                is_optional, actual_type = ConstructorInjector._extract_optional_type(param_type)
+                is_optional = False
+                actual_type = param_type
+                if get_origin(param_type) is Union or isinstance(param_type, types.UnionType):
+                    args = get_args(param_type)
+                    if type(None) in args:
+                        non_none_types = [arg for arg in args if arg is not type(None)]
+                        if non_none_types:
+                            is_optional = True
+                            actual_type = non_none_types[0]
 
                 # 判断是否应该添加此依赖:
                 # 1. 显式标记了 Injected
@@ -234,9 +329,10 @@ class ConstructorInjector:
                     )
                     dependencies.append(dependency)
 
-            # 性能优化: 缓存分析结果
-            ConstructorInjector._dependency_cache[service_class] = dependencies
-            return dependencies
+            # 性能优化: 缓存分析结果; 以不可变元组共享, 调用方无法修改缓存内容
+            result = tuple(dependencies)
+            ConstructorInjector._dependency_cache[service_class] = result
+            return result
 
         except ResolutionError:
             # 重新抛出已知的解析错误
@@ -265,9 +361,11 @@ class ConstructorInjector:
         Returns:
             是否可以构建
         """
-        dependencies = ConstructorInjector.analyze_dependencies(service_class)
-
-        return all(not (not dep.is_optional and dep.service_key not in available_keys) for dep in dependencies)
+        # 遇到第一个缺失的必需依赖即返回, 不创建生成器
+        for dep in ConstructorInjector.analyze_dependencies(service_class):
+            if not dep.is_optional and dep.service_key not in available_keys:
+                return False
+        return True
 
     @staticmethod
     def get_dependencies(service_class: type) -> dict[str, DependencyInfo]:
@@ -12,27 +12,42 @@
 
 from __future__ import annotations
 
-__all__: list[str] = []
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# 尝试导入各个框架集成（如果已安装）
-try:
+if TYPE_CHECKING:
+    from .django import DjangoContainer
     from .fastapi import inject as fastapi_inject
     from .fastapi import setup_container as setup_fastapi
+    from .flask import FlaskContainer
 
-    __all__.extend(["fastapi_inject", "setup_fastapi"])
-except ImportError:
-    pass
+# 延迟导出: 名称 -> (所在子模块, 子模块中的属性名), 首次访问时才导入(PEP 562)
+# 各集成模块只在 TYPE_CHECKING 下引用框架, 导入本包时不再加载全部集成模块,
+# 也不会为未安装的框架触发导入失败
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "fastapi_inject": (".fastapi", "inject"),
+    "setup_fastapi": (".fastapi", "setup_container"),
+    "FlaskContainer": (".flask", "FlaskContainer"),
+    "DjangoContainer": (".django", "DjangoContainer"),
+}
 
-try:
-    from .flask import FlaskContainer
+__all__ = ["DjangoContainer", "FlaskContainer", "fastapi_inject", "setup_fastapi"]
 
-    __all__.append("FlaskContainer")
-except ImportError:
-    pass
 
-try:
-    from .django import DjangoContainer
+def __getattr__(name: str) -> Any:
+    """按需导入延迟导出的名称(PEP 562)."""
+    export = _LAZY_EXPORTS.get(name)
+    if export is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    module_name, attr = export
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # 缓存到模块命名空间, 之后的访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
 
-    __all__.append("DjangoContainer")
-except ImportError:
-    pass
+def __dir__() -> list[str]:
+    """列出模块属性, 包含尚未导入的延迟导出."""
+    return sorted(set(globals()) | set(__all__))
@@ -37,6 +37,7 @@ from __future__ import annotations
 
 import functools
 import inspect
+import threading
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
@@ -48,6 +49,9 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 F = TypeVar("F", bound=Callable[..., Any])
 
+# 当前线程正在处理的请求, 由 ContainerMiddleware 设置, DjangoContainer.resolve 读取
+_REQUEST_LOCAL = threading.local()
+
 __all__ = ["ContainerMiddleware", "DjangoContainer"]
 
 
@@ -107,20 +111,32 @@ class DjangoContainer:
             >>> container = DjangoContainer.get_container()
         """
         if cls._container is None:
-            # 尝试从 Django settings 获取
-            try:
-                from django.conf import settings
-
-                if hasattr(settings, "CONTAINER"):
-                    cls._container = settings.CONTAINER
-            except Exception:
-                pass
+            # 尝试从 Django settings 获取, 获取成功后缓存在类上, 后续请求不再访问 settings
+            cls._container = cls._container_from_settings()
 
         if cls._container is None:
             raise RuntimeError("Container not initialized. Call DjangoContainer.setup() or set settings.CONTAINER")
 
         return cls._container
 
+    @staticmethod
+    def _container_from_settings() -> Container | None:
+        """从 Django settings.CONTAINER 读取容器.
+
+        Returns:
+            配置的容器, 未安装 Django、settings 未配置或未设置 CONTAINER 时返回 None
+        """
+        try:
+            from django.conf import settings
+        except ImportError:
+            return None
+
+        try:
+            return getattr(settings, "CONTAINER", None)
+        except Exception:  # noqa: BLE001
+            # settings 尚未配置时 Django 抛出 ImproperlyConfigured
+            return None
+
     @classmethod
     def resolve(cls, service_type: type[T]) -> T:
         """解析服务实例.
@@ -140,16 +156,11 @@ class DjangoContainer:
         示例:
             >>> user_service = DjangoContainer.resolve(UserService)
         """
-        # 尝试从当前线程获取请求对象
-        try:
-            import threading
-
-            local = threading.local()
-            request: HttpRequest | None = getattr(local, "request", None)
-            if request and hasattr(request, "container_scope"):
-                return request.container_scope.resolve(service_type)
-        except Exception:
-            pass
+        # 当前线程正在处理请求时, 使用请求作用域解析
+        request: HttpRequest | None = getattr(_REQUEST_LOCAL, "request", None)
+        scope = getattr(request, "container_scope", None)
+        if scope is not None:
+            return scope.resolve(service_type)
 
         # 使用根容器
         container = cls.get_container()
@@ -168,7 +179,8 @@ class DjangoContainer:
             F: 装饰后的函数
 
         Raises:
-            RuntimeError: 如果服务解析失败
+            RuntimeError: 如果容器未初始化
+            ResolutionError: 如果已注册服务解析失败
 
         示例:
             >>> @DjangoContainer.inject
@@ -177,30 +189,36 @@ class DjangoContainer:
         """
         sig = inspect.signature(func)
 
+        # 性能优化: 装饰时预先筛选可注入的参数 (参数名, 位置序号, 类型注解),
+        # 跳过 request、无类型注解、有默认值以及可变参数, 每个请求只需遍历该元组
+        injectable: list[tuple[str, int | None, Any]] = []
+        for index, (param_name, param) in enumerate(sig.parameters.items()):
+            if (
+                param_name == "request"
+                or param.annotation is inspect.Parameter.empty
+                or param.default is not inspect.Parameter.empty
+            ):
+                continue
+            if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                injectable.append((param_name, index, param.annotation))
+            elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+                injectable.append((param_name, None, param.annotation))
+        injectable_params = tuple(injectable)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # 分析需要注入的参数
-            bound_args = sig.bind_partial(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            for param_name, param in sig.parameters.items():
-                # 跳过 request 参数和已提供的参数
-                if param_name == "request" or param_name in bound_args.arguments:
+            container = cls.get_container()
+            for param_name, index, annotation in injectable_params:
+                # 跳过调用方已提供的参数
+                if param_name in kwargs or (index is not None and index < len(args)):
                     continue
 
-                # 检查是否有类型注解
-                if param.annotation == inspect.Parameter.empty:
-                    continue
-
-                # 尝试解析服务
-                try:
-                    service = cls.resolve(param.annotation)
-                    bound_args.arguments[param_name] = service
-                except Exception:
-                    # 无法解析，可能不是容器管理的服务
-                    continue
+                # 性能优化: 先检查是否为容器管理的服务, 未注册的参数不再抛出并捕获异常;
+                # 已注册服务的解析错误直接向上传播
+                if container.has(annotation):
+                    kwargs[param_name] = cls.resolve(annotation)
 
-            return func(*bound_args.args, **bound_args.kwargs)
+            return func(*args, **kwargs)
 
         return cast(F, wrapper)
 
@@ -235,22 +253,15 @@ class ContainerMiddleware:
         Returns:
             HttpResponse: 响应对象
         """
-        # 创建作用域
+        # 创建并激活作用域, 请求结束时清理
         container = DjangoContainer.get_container()
-        scope = container.create_scope()
+        with container.create_scope() as scope:
+            # 将作用域附加到请求对象
+            request.container_scope = scope  # type: ignore
 
-        # 将作用域附加到请求对象
-        request.container_scope = scope  # type: ignore
-
-        # 同时设置到线程本地存储
-        import threading
-
-        local = threading.local()
-        local.request = request
-
-        try:
-            return self.get_response(request)
-        finally:
-            # 清理作用域
-            scope.dispose()
-            local.request = None
+            # 同时设置到线程本地存储
+            _REQUEST_LOCAL.request = request
+            try:
+                return self.get_response(request)
+            finally:
+                _REQUEST_LOCAL.request = None
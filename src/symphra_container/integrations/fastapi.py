@@ -28,6 +28,8 @@
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
@@ -45,6 +47,8 @@ __all__ = ["get_container", "inject", "setup_container"]
 # 全局容器实例
 _container: Container | None = None
 _lifespan_managed = False
+# 导入本模块时确认一次 FastAPI 是否已安装, setup_container() 不再重复检查
+_FASTAPI_AVAILABLE = importlib.util.find_spec("fastapi") is not None
 
 
 def setup_container(app: FastAPI, container: Container) -> None:
@@ -67,12 +71,11 @@ def setup_container(app: FastAPI, container: Container) -> None:
         >>> container = Container()
         >>> setup_container(app, container)
     """
-    try:
-        from fastapi import FastAPI
-    except ImportError as e:
-        raise ImportError("FastAPI is not installed. Install it with: pip install symphra-container[fastapi]") from e
+    if not _FASTAPI_AVAILABLE:
+        raise ImportError("FastAPI is not installed. Install it with: pip install symphra-container[fastapi]")
 
     global _container, _lifespan_managed
+
     _container = container
 
     # 注册生命周期钩子管理 SCOPED 作用域
@@ -114,6 +117,11 @@ def inject(service_type: type[T]) -> Callable[[], T]:
     """创建 FastAPI 依赖注入函数.
 
     用于在 FastAPI 路由中注入服务。返回的函数可以作为 Depends() 的参数。
+    异步服务返回协程函数, 因此需要在调用 inject() 之前完成注册;
+    在 setup_container() 之前调用时返回在首次请求时再判断的协程函数。
+    同一服务类型返回同一个依赖函数, 同一请求内多次 Depends(inject(X)) 只解析一次,
+    因此 TRANSIENT 服务在同一请求内也只创建一个实例; 需要每处注入都得到新实例时
+    使用 Depends(inject(X), use_cache=False)。
 
     Args:
         service_type: 要注入的服务类型
@@ -133,27 +141,73 @@ def inject(service_type: type[T]) -> Callable[[], T]:
         ...     return await user_service.get_all()
     """
 
+    # 性能优化: 在创建依赖时根据注册信息一次确定同步或异步解析,
+    # 请求期间不再查询注册表或检测事件循环; 异步服务返回真正的协程函数, 由 FastAPI 直接 await
+    if _container is None:
+        # 容器尚未绑定, 无法得知服务是否异步, 推迟到首次调用时判断
+        return _deferred_dependency(service_type)
+    registration = _container.get_registration(service_type)
+    return _dependency_for(service_type, registration is not None and registration.is_async)
+
+
+@functools.cache
+def _dependency_for(service_type: type[T], is_async: bool) -> Callable[[], T]:
+    """获取服务类型对应的依赖函数.
+
+    相同的服务类型总是得到同一个依赖函数, FastAPI 据此在同一请求内合并重复的
+    Depends(inject(X)), 只解析一次. 依赖函数在调用时才读取全局容器, 但同步或异步
+    形式在创建时已按当时的注册确定: 重新调用 setup_container() 替换容器时,
+    若服务在新容器中的同步/异步性质不同, 需要重新调用 inject() 获取依赖函数.
+
+    Args:
+        service_type: 要注入的服务类型
+        is_async: 服务是否为异步服务
+
+    Returns:
+        同步依赖函数或协程函数
+    """
+    if is_async:
+
+        async def async_dependency() -> T:
+            return await get_container().resolve_async(service_type)
+
+        return async_dependency  # type: ignore[return-value]
+
     def dependency() -> T:
-        container = get_container()
-        # 检查是否是异步服务
-        registration = container._registrations.get(service_type)
-        if registration and registration.is_async:
-            # 异步服务需要用 resolve_async, 但这里是同步上下文
-            # FastAPI 会自动处理异步依赖，所以这里直接返回 coroutine
-            import asyncio
-
-            coro = container.resolve_async(service_type)
-            # 如果当前已经在 async 上下文中，直接返回 coroutine
-            # FastAPI 会自动 await 它
-            try:
-                asyncio.get_running_loop()
-                # 在 async 上下文中，返回 coroutine 让 FastAPI await
-                return coro  # type: ignore
-            except RuntimeError:
-                # 不在 async 上下文中，尝试同步解析
-                return container.resolve(service_type)
-        else:
-            # 同步服务直接解析
-            return container.resolve(service_type)
+        return get_container().resolve(service_type)
 
     return dependency
+
+
+@functools.cache
+def _deferred_dependency(service_type: type[T]) -> Callable[[], T]:
+    """获取在容器绑定前创建的依赖函数.
+
+    返回协程函数, 首次调用时按注册信息判断同步或异步解析并记住结果;
+    容器被替换后重新判断. 同步服务与 FastAPI 的同步依赖一样在线程池中创建,
+    阻塞的构造函数或工厂不会占用事件循环.
+
+    Args:
+        service_type: 要注入的服务类型
+
+    Returns:
+        协程依赖函数
+    """
+    from starlette.concurrency import run_in_threadpool
+
+    resolved_for: Container | None = None
+    is_async = False
+
+    async def dependency() -> T:
+        nonlocal resolved_for, is_async
+        container = get_container()
+        if container is not resolved_for:
+            registration = container.get_registration(service_type)
+            is_async = registration is not None and registration.is_async
+            resolved_for = container
+        if is_async:
+            return await container.resolve_async(service_type)
+        return await run_in_threadpool(container.resolve, service_type)
+
+    return dependency  # type: ignore[return-value]
+
@@ -49,6 +49,41 @@ F = TypeVar("F", bound=Callable[..., Any])
 __all__ = ["FlaskContainer"]
 
 
+@functools.cache
+def _injectable_parameters(func: Callable[..., Any]) -> tuple[tuple[str, int | None, Any], ...]:
+    """分析视图函数中可注入的参数.
+
+    性能优化: 签名与类型提示只在装饰时解析一次, 同一函数重复装饰时直接复用;
+    每个请求只需遍历返回的元组, 不再绑定签名.
+
+    Args:
+        func: 视图函数
+
+    Returns:
+        (参数名, 位置序号, 类型注解) 元组; 仅包含有类型注解且没有默认值的参数,
+        仅限关键字参数的位置序号为 None
+    """
+    sig = inspect.signature(func)
+
+    # 获取函数的类型提示, 用于解析字符串注解
+    try:
+        type_hints = get_type_hints(func)
+    except (NameError, TypeError):
+        # 如果无法获取类型提示, 使用原始注解
+        type_hints = {}
+
+    injectable: list[tuple[str, int | None, Any]] = []
+    for index, (param_name, param) in enumerate(sig.parameters.items()):
+        if param.annotation is inspect.Parameter.empty or param.default is not inspect.Parameter.empty:
+            continue
+        annotation = type_hints.get(param_name, param.annotation)
+        if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            injectable.append((param_name, index, annotation))
+        elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+            injectable.append((param_name, None, annotation))
+    return tuple(injectable)
+
+
 class FlaskContainer:
     """Flask 应用的容器包装器.
 
@@ -78,7 +113,7 @@ class FlaskContainer:
             ImportError: 如果未安装 Flask
         """
         try:
-            from flask import Flask, g
+            from flask import g
         except ImportError as e:
             raise ImportError("Flask is not installed. Install it with: pip install symphra-container[flask]") from e
 
@@ -112,9 +147,8 @@ class FlaskContainer:
         示例:
             >>> user_service = flask_container.resolve(UserService)
         """
+        g = self._flask_g
         try:
-            from flask import g
-
             # 如果还没有作用域,创建一个
             scope = getattr(g, "container_scope", None)
             if scope is None:
@@ -141,7 +175,7 @@ class FlaskContainer:
             F: 装饰后的函数
 
         Raises:
-            RuntimeError: 如果服务解析失败
+            ResolutionError: 如果已注册服务解析失败
 
         示例:
             >>> @flask_container.inject
@@ -149,50 +183,20 @@ class FlaskContainer:
             ...     # user_service 和 email_service 会自动注入
             ...     return user_service.get_all()
         """
-        sig = inspect.signature(func)
-
-        # 获取函数的类型提示, 用于解析字符串注解
-        try:
-            type_hints = get_type_hints(func)
-        except (NameError, TypeError):
-            # 如果无法获取类型提示, 使用空的字典
-            type_hints = {}
+        injectable_params = _injectable_parameters(func)
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # 获取所有参数的绑定
-            bound = sig.bind_partial(*args, **kwargs)
-            bound.apply_defaults()
-
-            # 收集需要注入的参数
-            for param_name, param in sig.parameters.items():
-                # 跳过已提供的参数
-                if param_name in bound.arguments:
+            container = self.container
+            for param_name, index, annotation in injectable_params:
+                # 跳过调用方已提供的参数
+                if param_name in kwargs or (index is not None and index < len(args)):
                     continue
 
-                # 检查是否有类型注解
-                if param.annotation == inspect.Parameter.empty:
-                    continue
-
-                # 解析注解类型
-                annotation = type_hints.get(param_name, param.annotation)
-                if annotation == inspect.Parameter.empty:
-                    continue
+                # 只注入容器管理的服务; 已注册服务的解析错误直接向上传播
+                if container.has(annotation):
+                    kwargs[param_name] = self.resolve(annotation)
 
-                # 尝试解析服务
-                try:
-                    service = self.resolve(annotation)
-                    bound.arguments[param_name] = service
-                except Exception as e:
-                    # 无法解析, 可能不是容器管理的服务
-                    # 注意: 如果这是容器管理的服务但解析失败, 应该抛出异常
-                    if hasattr(e, '__class__') and "ServiceNotFoundError" in e.__class__.__name__:
-                        # 服务未找到, 可能确实不是容器管理的
-                        continue
-                    # 其他异常应该重新抛出
-                    raise
-
-            # 调用函数, 使用完整的参数字典
-            return func(**bound.arguments)
+            return func(*args, **kwargs)
 
         return cast("F", wrapper)
@@ -12,15 +12,34 @@
 from __future__ import annotations
 
 import contextlib
+from contextvars import ContextVar, Token
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from .types import Lifetime, ServiceKey
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
 T = TypeVar("T")
 
+# 缓存未命中标记, 用于区分"未缓存"与"缓存了 None"
+_MISSING: Any = object()
+
+# 作用域存储对象池的容量上限, 突发并发结束后多余的存储对象直接丢弃
+_SCOPE_POOL_MAX_SIZE = 64
+
+# 各生命周期管理器在当前上下文中活跃的作用域: 管理器 -> (存储对象, 进入时的 epoch)
+# 所有管理器共用一个 ContextVar, 创建管理器不会新增上下文变量; 映射只读, 变化时整体替换
+_CURRENT_SCOPES: ContextVar[Mapping[LifetimeManager, tuple[ScopedStore, int]]] = ContextVar(
+    "symphra_current_scopes", default=MappingProxyType({})
+)
+
+
+def _return_none(*_args: Any) -> None:
+    """不缓存实例的生命周期(TRANSIENT/FACTORY)使用的处理函数."""
+    return None
+
 
 class SingletonStore:
     """单例存储.
@@ -30,23 +49,25 @@ class SingletonStore:
 
     Attributes:
         _instances: 单例实例字典
-        _locks: 双重检查锁定字典
     """
 
+    __slots__ = ("_instances",)
+
     def __init__(self) -> None:
         """初始化单例存储."""
         self._instances: dict[ServiceKey, Any] = {}
 
-    def get(self, key: ServiceKey) -> Any | None:
+    def get(self, key: ServiceKey, default: Any = None) -> Any | None:
         """获取单例实例.
 
         Args:
             key: 服务键
+            default: 实例不存在时的返回值
 
         Returns:
-            服务实例或 None
+            服务实例或 default
         """
-        return self._instances.get(key)
+        return self._instances.get(key, default)
 
     def set(self, key: ServiceKey, instance: Any) -> None:
         """设置单例实例.
@@ -77,9 +98,11 @@ class SingletonStore:
 
         如果实例实现了 Disposable 接口,则调用其 dispose 方法.
         """
+        # 性能优化: 单次 getattr 代替 hasattr + 属性读取 + callable 的重复查找
         for instance in self._instances.values():
-            if hasattr(instance, "dispose") and callable(instance.dispose):
-                instance.dispose()
+            dispose = getattr(instance, "dispose", None)
+            if callable(dispose):
+                dispose()
         self._instances.clear()
 
 
@@ -92,8 +115,12 @@ class ScopedStore:
     Attributes:
         _instances: 作用域内的实例字典
         _scope_id: 作用域 ID
+        _epoch: 离开作用域的次数, 用于识别对象池复用前残留的上下文引用
+        _context: 进入作用域时的 (上下文变量令牌, 设置的映射), 离开时据此恢复外层作用域
     """
 
+    __slots__ = ("_context", "_epoch", "_instances", "_scope_id")
+
     def __init__(self, scope_id: str) -> None:
         """初始化作用域存储.
 
@@ -102,22 +129,25 @@ class ScopedStore:
         """
         self._instances: dict[ServiceKey, Any] = {}
         self._scope_id = scope_id
+        self._epoch = 0
+        self._context: tuple[Token[Any], Mapping[Any, Any]] | None = None
 
     @property
     def scope_id(self) -> str:
         """获取作用域 ID."""
         return self._scope_id
 
-    def get(self, key: ServiceKey) -> Any | None:
+    def get(self, key: ServiceKey, default: Any = None) -> Any | None:
         """获取作用域内的实例.
 
         Args:
             key: 服务键
+            default: 实例不存在时的返回值
 
         Returns:
-            服务实例或 None
+            服务实例或 default
         """
-        return self._instances.get(key)
+        return self._instances.get(key, default)
 
     def set(self, key: ServiceKey, instance: Any) -> None:
         """设置作用域内的实例.
@@ -144,9 +174,11 @@ class ScopedStore:
 
         如果实例实现了 Disposable 接口,则调用其 dispose 方法.
         """
+        # 性能优化: 单次 getattr 代替 hasattr + 属性读取 + callable 的重复查找
         for instance in self._instances.values():
-            if hasattr(instance, "dispose") and callable(instance.dispose):
-                instance.dispose()
+            dispose = getattr(instance, "dispose", None)
+            if callable(dispose):
+                dispose()
         self._instances.clear()
 
 
@@ -162,14 +194,38 @@ class LifetimeManager:
     Attributes:
         _singleton_store: 单例存储
         _scoped_stores: 作用域存储字典
-        _current_scope: 当前活跃的作用域
     """
 
+    __slots__ = (
+        "_get_handlers",
+        "_scope_pool",
+        "_scoped_stores",
+        "_set_handlers",
+        "_singleton_store",
+        "_singletons",
+    )
+
     def __init__(self) -> None:
         """初始化生命周期管理器."""
         self._singleton_store = SingletonStore()
+        # 单例实例字典只会被原地清空, 不会被替换, 可直接持有引用
+        self._singletons = self._singleton_store._instances
         self._scoped_stores: dict[str, ScopedStore] = {}
-        self._current_scope: ScopedStore | None = None
+        # 性能优化: 已离开作用域的存储对象池, 每个请求进入作用域时复用, 不再重新分配
+        self._scope_pool: list[ScopedStore] = []
+        # 性能优化: 按生命周期分派的处理函数表, 一次字典查找代替逐个比较枚举值
+        self._get_handlers: dict[Lifetime, Callable[[ServiceKey, Callable[[], Any] | None], Any]] = {
+            Lifetime.SINGLETON: self._get_singleton,
+            Lifetime.TRANSIENT: _return_none,
+            Lifetime.SCOPED: self._get_scoped,
+            Lifetime.FACTORY: _return_none,
+        }
+        self._set_handlers: dict[Lifetime, Callable[[ServiceKey, Any], None]] = {
+            Lifetime.SINGLETON: self._singletons.__setitem__,
+            Lifetime.TRANSIENT: _return_none,
+            Lifetime.SCOPED: self._set_scoped,
+            Lifetime.FACTORY: _return_none,
+        }
 
     def get_instance(
         self,
@@ -193,34 +249,35 @@ class LifetimeManager:
         Returns:
             服务实例或 None
         """
-        if lifetime == Lifetime.SINGLETON:
-            # 单例:检查是否已存在,否则创建
-            if self._singleton_store.has(key):
-                return self._singleton_store.get(key)
-            if factory:
-                instance = factory()
-                self._singleton_store.set(key, instance)
-                return instance
-            return None
-
-        if lifetime == Lifetime.TRANSIENT:
-            # 瞬时:总是返回 None,由调用者创建新实例
+        handler = self._get_handlers.get(lifetime)
+        if handler is None:
             return None
-
-        if lifetime == Lifetime.SCOPED:
-            # 作用域:从当前作用域获取
-            if self._current_scope:
-                if not self._current_scope.has(key) and factory:
-                    instance = factory()
-                    self._current_scope.set(key, instance)
-                return self._current_scope.get(key)
-            return None
-
-        if lifetime == Lifetime.FACTORY:
-            # 工厂:由调用者调用工厂函数创建
+        return handler(key, factory)
+
+    def _get_singleton(self, key: ServiceKey, factory: Callable[[], T] | None) -> T | None:
+        """单例: 检查是否已存在, 否则创建."""
+        # 性能优化: 直接对实例字典做一次 get, 代替 has() + get() 两次方法调用
+        instance = self._singletons.get(key, _MISSING)
+        if instance is _MISSING:
+            if not factory:
+                return None
+            instance = factory()
+            self._singletons[key] = instance
+        return instance
+
+    def _get_scoped(self, key: ServiceKey, factory: Callable[[], T] | None) -> T | None:
+        """作用域: 从当前作用域获取, 不存在时创建."""
+        scope = self._active_scope()
+        if scope is None:
             return None
-
-        return None
+        instances = scope._instances
+        instance = instances.get(key, _MISSING)
+        if instance is _MISSING:
+            if not factory:
+                return None
+            instance = factory()
+            instances[key] = instance
+        return instance
 
     def set_instance(
         self,
@@ -241,23 +298,39 @@ class LifetimeManager:
             instance: 服务实例
             lifetime: 生命周期类型
         """
-        if lifetime == Lifetime.SINGLETON:
-            self._singleton_store.set(key, instance)
-        elif lifetime == Lifetime.SCOPED and self._current_scope:
-            self._current_scope.set(key, instance)
+        handler = self._set_handlers.get(lifetime)
+        if handler is not None:
+            handler(key, instance)
+
+    def _set_scoped(self, key: ServiceKey, instance: Any) -> None:
+        """作用域: 存储到当前作用域, 没有活跃作用域时不存储."""
+        scope = self._active_scope()
+        if scope is not None:
+            scope._instances[key] = instance
 
     def enter_scope(self, scope_id: str) -> ScopedStore:
         """进入新的作用域.
 
+        离开作用域后存储对象会被放回对象池供后续作用域复用,
+        调用方不应在离开作用域后继续持有返回的存储对象.
+
         Args:
             scope_id: 作用域 ID
 
         Returns:
             作用域存储对象
         """
-        scope = ScopedStore(scope_id)
+        pool = self._scope_pool
+        if pool:
+            # 离开作用域时实例字典已被清空, 只需更新作用域 ID
+            scope = pool.pop()
+            scope._scope_id = scope_id
+        else:
+            scope = ScopedStore(scope_id)
         self._scoped_stores[scope_id] = scope
-        self._current_scope = scope
+        # 当前作用域按上下文隔离: 同一事件循环上并发的请求(任务)与不同线程互不干扰
+        scopes = MappingProxyType({**_CURRENT_SCOPES.get(), self: (scope, scope._epoch)})
+        scope._context = (_CURRENT_SCOPES.set(scopes), scopes)
         return scope
 
     def exit_scope(self, scope_id: str) -> None:
@@ -272,18 +345,61 @@ class LifetimeManager:
             scope = self._scoped_stores[scope_id]
             scope.dispose()
             del self._scoped_stores[scope_id]
-            # 如果当前作用域是要离开的作用域,则重置
-            if self._current_scope is scope:
-                self._current_scope = None
+            # 如果当前作用域是要离开的作用域,则恢复进入前的外层作用域
+            context = scope._context
+            scope._context = None
+            if context is not None and self._active_scope() is scope:
+                self._restore_outer_scope(*context)
+            # 其他上下文(例如作用域内创建的任务)可能仍引用该存储, 递增 epoch 使这些引用失效
+            scope._epoch += 1
+            if len(self._scope_pool) < _SCOPE_POOL_MAX_SIZE:
+                self._scope_pool.append(scope)
+
+    def _restore_outer_scope(
+        self,
+        token: Token[Mapping[LifetimeManager, tuple[ScopedStore, int]]],
+        scopes: Mapping[LifetimeManager, tuple[ScopedStore, int]],
+    ) -> None:
+        """离开当前上下文中活跃的作用域, 恢复进入前的外层作用域.
+
+        Args:
+            token: 进入作用域时设置上下文变量得到的令牌
+            scopes: 进入作用域时设置的映射
+        """
+        if _CURRENT_SCOPES.get() is scopes:
+            try:
+                _CURRENT_SCOPES.reset(token)
+            except ValueError:
+                # 令牌属于其他上下文(例如在作用域内创建的任务中离开作用域)
+                pass
+            else:
+                return
+        # 之后其他管理器又进入了作用域, 或无法使用令牌: 只恢复本管理器的条目
+        previous = token.old_value
+        outer = None if previous is Token.MISSING else previous.get(self)
+        current = dict(_CURRENT_SCOPES.get())
+        if outer is None:
+            current.pop(self, None)
+        else:
+            current[self] = outer
+        _CURRENT_SCOPES.set(MappingProxyType(current))
+
+    def _active_scope(self) -> ScopedStore | None:
+        """获取当前上下文中仍然有效的作用域存储."""
+        entry = _CURRENT_SCOPES.get().get(self)
+        if entry is None:
+            return None
+        scope, epoch = entry
+        return scope if scope._epoch == epoch else None
 
     @property
     def current_scope(self) -> ScopedStore | None:
         """获取当前活跃的作用域."""
-        return self._current_scope
+        return self._active_scope()
 
     def has_active_scope(self) -> bool:
         """检查是否有活跃的作用域."""
-        return self._current_scope is not None
+        return self._active_scope() is not None
 
     def dispose_all(self) -> None:
         """释放所有资源.
@@ -300,7 +416,11 @@ class LifetimeManager:
     def clear(self) -> None:
         """清空所有存储."""
         self.dispose_all()
-        self._current_scope = None
+        scopes = _CURRENT_SCOPES.get()
+        if self in scopes:
+            remaining = dict(scopes)
+            del remaining[self]
+            _CURRENT_SCOPES.set(MappingProxyType(remaining))
 
     def remove_instance(self, key: ServiceKey) -> None:
         """移除指定服务的实例.
@@ -308,22 +428,12 @@ class LifetimeManager:
         Args:
             key: 服务键
         """
-        # 从单例存储中移除
-        if self._singleton_store.has(key):
-            instance = self._singleton_store.get(key)
-            if instance and hasattr(instance, "dispose"):
+        # 从单例存储和所有作用域中移除, 释放失败不影响移除
+        for instances in (self._singletons, *(scope._instances for scope in self._scoped_stores.values())):
+            instance = instances.pop(key, _MISSING)
+            if instance is _MISSING:
+                continue
+            dispose = getattr(instance, "dispose", None)
+            if callable(dispose):
                 with contextlib.suppress(Exception):
-                    instance.dispose()
-            # 直接访问私有属性进行删除
-            if hasattr(self._singleton_store, "_instances"):
-                self._singleton_store._instances.pop(key, None)
-
-        # 从所有作用域中移除
-        for scope_store in self._scoped_stores.values():
-            if scope_store.has(key):
-                instance = scope_store.get(key)
-                if instance and hasattr(instance, "dispose"):
-                    with contextlib.suppress(Exception):
-                        instance.dispose()
-                if hasattr(scope_store, "_instances"):
-                    scope_store._instances.pop(key, None)
+                    dispose()
@@ -8,10 +8,18 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from time import perf_counter
+import sys
+import threading
+from collections import Counter, deque
+from time import perf_counter_ns
 from typing import Any
 
+# 保留的最近解析耗时数量上限, 长时间运行的服务不会无限占用内存
+_MAX_RECORDED_TIMES = 10_000
+
+# 按键计数的缓冲条数, 达到后批量合并到计数器
+_KEY_FLUSH_THRESHOLD = 256
+
 
 class PerformanceMetrics:
     """性能指标收集器.
@@ -22,16 +30,33 @@ class PerformanceMetrics:
         resolution_count: 解析次数
         cache_hits: 缓存命中次数
         cache_misses: 缓存未命中次数
-        resolution_times: 解析耗时列表
+        resolution_times: 最近的解析耗时(最多保留 10000 条)
+        resolution_by_key: 按服务键统计的解析次数
     """
 
+    __slots__ = (
+        "_flush_lock",
+        "_pending_keys",
+        "_resolution_by_key",
+        "_total_time",
+        "cache_hits",
+        "cache_misses",
+        "resolution_count",
+        "resolution_times",
+    )
+
     def __init__(self) -> None:
         """初始化性能指标."""
         self.resolution_count = 0
         self.cache_hits = 0
         self.cache_misses = 0
-        self.resolution_times: list[float] = []
-        self.resolution_by_key: dict[Any, int] = defaultdict(int)
+        # 性能优化: 有界队列只保留最近的耗时, 总耗时单独累加, 统计时无需遍历求和
+        self.resolution_times: deque[float] = deque(maxlen=_MAX_RECORDED_TIMES)
+        self._total_time = 0.0
+        # 性能优化: 每次解析只追加服务键, 攒够一批后由 Counter.update 在 C 层合并计数
+        self._resolution_by_key: Counter[Any] = Counter()
+        self._pending_keys: list[Any] = []
+        self._flush_lock = threading.Lock()
 
     def record_resolution(
         self,
@@ -48,7 +73,11 @@ class PerformanceMetrics:
         """
         self.resolution_count += 1
         self.resolution_times.append(elapsed_time)
-        self.resolution_by_key[key] += 1
+        self._total_time += elapsed_time
+        pending = self._pending_keys
+        pending.append(key)
+        if len(pending) >= _KEY_FLUSH_THRESHOLD:
+            self._flush_keys()
 
         if cache_hit:
             self.cache_hits += 1
@@ -61,19 +90,36 @@ class PerformanceMetrics:
         self.cache_hits = 0
         self.cache_misses = 0
         self.resolution_times.clear()
-        self.resolution_by_key.clear()
+        self._total_time = 0.0
+        with self._flush_lock:
+            self._pending_keys = []
+            self._resolution_by_key.clear()
+
+    def _flush_keys(self) -> None:
+        """把缓冲的服务键合并到按键计数器."""
+        with self._flush_lock:
+            # 在锁内换上新缓冲区再合并旧缓冲区, 合并期间其他线程追加的键进入新缓冲区, 不会被清空丢失
+            pending, self._pending_keys = self._pending_keys, []
+            if pending:
+                self._resolution_by_key.update(pending)
+
+    @property
+    def resolution_by_key(self) -> Counter[Any]:
+        """获取按服务键统计的解析次数."""
+        self._flush_keys()
+        return self._resolution_by_key
 
     @property
     def average_resolution_time(self) -> float:
         """获取平均解析耗时(秒)."""
-        if not self.resolution_times:
+        if self.resolution_count == 0:
             return 0.0
-        return sum(self.resolution_times) / len(self.resolution_times)
+        return self._total_time / self.resolution_count
 
     @property
     def total_resolution_time(self) -> float:
         """获取总解析耗时(秒)."""
-        return sum(self.resolution_times)
+        return self._total_time
 
     @property
     def cache_hit_rate(self) -> float:
@@ -114,13 +160,47 @@ class ServiceKeyIndex:
 
     用于快速查找注册的服务.
 
+    注册阶段结束后可调用 freeze() 得到只读的紧凑索引.
+
     Attributes:
         _index: 键到注册信息的映射
+        _frozen: 是否已冻结
     """
 
+    __slots__ = ("_frozen", "_index")
+
     def __init__(self) -> None:
         """初始化索引."""
         self._index: dict[Any, Any] = {}
+        self._frozen = False
+
+    @property
+    def frozen(self) -> bool:
+        """索引是否已冻结."""
+        return self._frozen
+
+    def freeze(self) -> ServiceKeyIndex:
+        """冻结索引, 之后不再允许修改.
+
+        性能优化: 按当前内容重建字典, 去除删除操作留下的空槽;
+        字符串键驻留后, 使用字面量键的查找可以直接通过身份比较命中.
+
+        Returns:
+            索引自身(支持链式调用)
+        """
+        self._index = {sys.intern(key) if type(key) is str else key: value for key, value in self._index.items()}
+        self._frozen = True
+        return self
+
+    def _check_mutable(self) -> None:
+        """检查索引是否允许修改.
+
+        Raises:
+            RuntimeError: 索引已冻结时
+        """
+        if self._frozen:
+            msg = "ServiceKeyIndex is frozen"
+            raise RuntimeError(msg)
 
     def add(self, key: Any, registration: Any) -> None:
         """添加键到索引.
@@ -128,7 +208,11 @@ class ServiceKeyIndex:
         Args:
             key: 服务键
             registration: 注册信息
+
+        Raises:
+            RuntimeError: 索引已冻结时
         """
+        self._check_mutable()
         self._index[key] = registration
 
     def get(self, key: Any) -> Any | None:
@@ -147,7 +231,11 @@ class ServiceKeyIndex:
 
         Args:
             key: 服务键
+
+        Raises:
+            RuntimeError: 索引已冻结时
         """
+        self._check_mutable()
         self._index.pop(key, None)
 
     def contains(self, key: Any) -> bool:
@@ -162,7 +250,12 @@ class ServiceKeyIndex:
         return key in self._index
 
     def clear(self) -> None:
-        """清空索引."""
+        """清空索引.
+
+        Raises:
+            RuntimeError: 索引已冻结时
+        """
+        self._check_mutable()
         self._index.clear()
 
     def keys(self) -> list[Any]:
@@ -187,26 +280,34 @@ class ResolutionTimer:
         >>> print(f"耗时: {timer.elapsed_time * 1000:.3f}ms")
     """
 
+    __slots__ = ("end_time", "start_time")
+
     def __init__(self) -> None:
-        """初始化计时器."""
-        self.start_time: float | None = None
-        self.end_time: float | None = None
+        """初始化计时器.
+
+        start_time / end_time 为 perf_counter_ns() 的整数纳秒读数, 未计时时为 None.
+        """
+        self.start_time: int | None = None
+        self.end_time: int | None = None
 
     def __enter__(self) -> ResolutionTimer:
         """进入上下文,开始计时."""
-        self.start_time = perf_counter()
+        # 性能优化: 整数纳秒计时, 读取与相减都不涉及浮点运算
+        self.start_time = perf_counter_ns()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """离开上下文,停止计时."""
-        self.end_time = perf_counter()
+        self.end_time = perf_counter_ns()
 
     @property
     def elapsed_time(self) -> float:
         """获取经过的时间(秒)."""
-        if self.start_time is None or self.end_time is None:
+        # end_time 只会在 start_time 之后设置, 检查一次即可
+        end_time = self.end_time
+        if end_time is None:
             return 0.0
-        return self.end_time - self.start_time
+        return (end_time - self.start_time) / 1e9  # type: ignore[operator]
 
     def __repr__(self) -> str:
         """返回字符串表示."""
@@ -33,8 +33,10 @@ import inspect
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from ._scc import build_dependency_graph, cyclic_components
+
 if TYPE_CHECKING:
-    from symphra_container.container import Container
+    from symphra_container.container import Container, ServiceRegistration
 
 __all__ = [
     "ContainerDiagnostic",
@@ -54,7 +56,7 @@ class ContainerDiagnostic:
         singleton_count: 单例服务数
         transient_count: 瞬态服务数
         scoped_count: 作用域服务数
-        circular_dependencies: 循环依赖列表
+        circular_dependencies: 循环依赖列表(每项为一个强连通分量中的服务键)
         unresolvable_services: 无法解析的服务列表
         warnings: 警告信息列表
         health_score: 健康评分 (0-100)
@@ -64,7 +66,7 @@ class ContainerDiagnostic:
     singleton_count: int
     transient_count: int
     scoped_count: int
-    circular_dependencies: list[tuple[Any, Any]]
+    circular_dependencies: list[tuple[Any, ...]]
     unresolvable_services: list[Any]
     warnings: list[str]
     health_score: float
@@ -119,11 +121,9 @@ def _generate_dot(container: Container) -> str:
         lines.append(f'  "{key_name}" [style=filled, fillcolor={color}];')
 
         # 分析依赖
-        if registration.factory:
-            dependencies = _extract_dependencies(registration.factory)
-            for dep in dependencies:
-                dep_name = _format_key(dep)
-                lines.append(f'  "{key_name}" -> "{dep_name}";')
+        for dep in _registration_dependencies(registration):
+            dep_name = _format_key(dep)
+            lines.append(f'  "{key_name}" -> "{dep_name}";')
 
     lines.append("}")
     return "\n".join(lines)
@@ -150,11 +150,9 @@ def _generate_mermaid(container: Container) -> str:
         lines.append(f"  {key_name}{style}")
 
         # 分析依赖
-        if registration.factory:
-            dependencies = _extract_dependencies(registration.factory)
-            for dep in dependencies:
-                dep_name = _format_key(dep)
-                lines.append(f"  {key_name} --> {dep_name}")
+        for dep in _registration_dependencies(registration):
+            dep_name = _format_key(dep)
+            lines.append(f"  {key_name} --> {dep_name}")
 
     # 添加样式定义
     lines.extend(
@@ -206,7 +204,7 @@ def print_dependency_graph(container: Container, key: Any = None, indent: int =
     print(f"{'  ' * indent}{key_name} ({lifetime})")
 
     if registration.factory:
-        dependencies = _extract_dependencies(registration.factory)
+        dependencies = _registration_dependencies(registration)
         for i, dep in enumerate(dependencies):
             is_last = i == len(dependencies) - 1
             prefix = "└─" if is_last else "├─"
@@ -247,7 +245,7 @@ def debug_resolution(container: Container, key: Any) -> None:
     print(f"✅ Registration found: {_format_key(key)} ({lifetime})")
 
     if registration.factory:
-        dependencies = _extract_dependencies(registration.factory)
+        dependencies = _registration_dependencies(registration)
         if dependencies:
             print("📦 Dependencies:")
             for dep in dependencies:
@@ -345,6 +343,11 @@ def diagnose_container(container: Container) -> ContainerDiagnostic:
     )
 
 
+# 依赖解析结果缓存: 注册版本号 -> 依赖元组
+_DEPENDENCY_CACHE: dict[int, tuple[Any, ...]] = {}
+_DEPENDENCY_CACHE_MAX_SIZE = 4096
+
+
 def _format_key(key: Any) -> str:
     """格式化服务键为字符串."""
     if isinstance(key, type):
@@ -352,6 +355,29 @@ def _format_key(key: Any) -> str:
     return str(key).replace(" ", "_").replace("[", "_").replace("]", "_")
 
 
+def _registration_dependencies(registration: ServiceRegistration) -> tuple[Any, ...]:
+    """获取注册项工厂的依赖(按注册版本缓存).
+
+    注册项创建后不会被修改, 重新注册总会生成新的版本号,
+    因此同一版本只需反射一次, 之后的可视化/诊断调用直接复用结果.
+
+    Args:
+        registration: 服务注册信息
+
+    Returns:
+        依赖的服务键元组
+    """
+    version = registration.version
+    dependencies = _DEPENDENCY_CACHE.get(version)
+    if dependencies is None:
+        factory = registration.factory
+        dependencies = tuple(_extract_dependencies(factory)) if factory else ()
+        if len(_DEPENDENCY_CACHE) >= _DEPENDENCY_CACHE_MAX_SIZE:
+            _DEPENDENCY_CACHE.clear()
+        _DEPENDENCY_CACHE[version] = dependencies
+    return dependencies
+
+
 def _extract_dependencies(factory: Any) -> list[Any]:
     """从工厂函数提取依赖."""
     if not callable(factory):
@@ -380,35 +406,21 @@ def _resolve_order(container: Container, key: Any, visited: set | None = None) -
     order = []
 
     registration = container._registrations.get(key)
-    if registration and registration.factory:
-        dependencies = _extract_dependencies(registration.factory)
-        for dep in dependencies:
+    if registration:
+        for dep in _registration_dependencies(registration):
             order.extend(_resolve_order(container, dep, visited))
 
     order.append(key)
     return order
 
 
-def _detect_circular_dependencies(container: Container) -> list[tuple[Any, Any]]:
-    """检测循环依赖."""
-    circular = []
-
-    def visit(key: Any, path: list[Any]) -> None:
-        if key in path:
-            # 找到循环
-            cycle_start = path.index(key)
-            circular.append((path[cycle_start], key))
-            return
-
-        registration = container._registrations.get(key)
-        if not registration or not registration.factory:
-            return
+def _detect_circular_dependencies(container: Container) -> list[tuple[Any, ...]]:
+    """检测循环依赖.
 
-        dependencies = _extract_dependencies(registration.factory)
-        for dep in dependencies:
-            visit(dep, [*path, key])
-
-    for key in container._registrations:
-        visit(key, [])
-
-    return circular
+    对依赖图执行一次 Tarjan 强连通分量遍历, 每个包含循环的分量
+    (两个及以上节点, 或存在自依赖的单个节点)作为一个元组返回.
+    """
+    registrations = container._registrations
+    keys = list(registrations)
+    all_succs, succ_ranges = build_dependency_graph(keys, lambda key: _registration_dependencies(registrations[key]))
+    return [tuple(keys[i] for i in component) for component in cyclic_components(all_succs, succ_ranges)]
@@ -0,0 +1,117 @@
+"""Django 集成测试.
+
+这些测试只在安装了 Django 时运行。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+# 尝试导入 Django
+try:
+    import django  # noqa: F401
+
+    DJANGO_AVAILABLE = True
+except ImportError:
+    DJANGO_AVAILABLE = False
+
+# 如果没有安装 Django, 跳过所有测试
+pytestmark = pytest.mark.skipif(
+    not DJANGO_AVAILABLE,
+    reason="Django not installed. Install with: pip install symphra-container[django]",
+)
+
+if DJANGO_AVAILABLE:
+    from symphra_container import Container, Lifetime
+    from symphra_container.integrations.django import _REQUEST_LOCAL, ContainerMiddleware, DjangoContainer
+
+
+class FakeRequest:
+    """测试用的最小请求对象."""
+
+
+class RequestService:
+    """请求作用域服务."""
+
+
+@pytest.fixture
+def container() -> Iterator[Container]:
+    """创建并安装测试容器."""
+    container = Container()
+    container.register(RequestService, lifetime=Lifetime.SCOPED)
+    DjangoContainer.setup(container)
+    yield container
+    DjangoContainer._container = None
+
+
+def test_middleware_shares_scope_with_resolve(container: Container) -> None:
+    """测试中间件创建的请求作用域可以被 DjangoContainer.resolve 使用."""
+    seen = []
+
+    def view(request: FakeRequest) -> str:
+        seen.append((DjangoContainer.resolve(RequestService), DjangoContainer.resolve(RequestService)))
+        return "ok"
+
+    middleware = ContainerMiddleware(view)  # type: ignore[arg-type]
+
+    assert middleware(FakeRequest()) == "ok"  # type: ignore[arg-type]
+    assert middleware(FakeRequest()) == "ok"  # type: ignore[arg-type]
+
+    (first_a, first_b), (second_a, _) = seen
+    assert first_a is first_b
+    assert first_a is not second_a
+    assert getattr(_REQUEST_LOCAL, "request", None) is None
+
+
+def test_resolve_outside_request_uses_root_container(container: Container) -> None:
+    """测试请求之外解析时使用根容器."""
+    container.register_instance("config", {"debug": True})
+
+    assert DjangoContainer.resolve("config") == {"debug": True}  # type: ignore[arg-type]
+
+
+def test_inject_resolves_missing_annotated_parameters(container: Container) -> None:
+    """测试 inject 只为调用方未提供的带注解参数注入服务."""
+    # 本模块启用了延迟注解, 参数注解是字符串 "RequestService"
+    container.alias(RequestService, "RequestService")
+    provided = RequestService()
+
+    @DjangoContainer.inject
+    def view(request: FakeRequest, service: RequestService, *, other: RequestService, page: int = 1):
+        return service, other, page
+
+    with container.create_scope():
+        service, other, page = view(FakeRequest(), provided)  # type: ignore[arg-type,call-arg]
+        injected_service, _, _ = view(FakeRequest())  # type: ignore[arg-type,call-arg]
+
+    assert service is provided
+    assert isinstance(other, RequestService)
+    assert other is not provided
+    assert page == 1
+    assert isinstance(injected_service, RequestService)
+
+
+def test_inject_skips_unregistered_and_propagates_resolution_errors(container: Container) -> None:
+    """测试 inject 跳过未注册的注解参数, 已注册服务的解析错误直接抛出."""
+    from symphra_container import ResolutionError
+
+    def broken_factory() -> RequestService:
+        raise ValueError("boom")
+
+    container.register_factory("Broken", broken_factory)
+
+    @DjangoContainer.inject
+    def view(request: FakeRequest, name: str) -> str:
+        return name
+
+    @DjangoContainer.inject
+    def broken_view(request: FakeRequest, service: Broken) -> RequestService:  # type: ignore[name-defined]  # noqa: F821
+        return service
+
+    assert view(FakeRequest(), "alice") == "alice"  # type: ignore[arg-type,call-arg]
+    with pytest.raises(TypeError):
+        view(FakeRequest())  # type: ignore[arg-type,call-arg]
+    with pytest.raises(ResolutionError):
+        broken_view(FakeRequest())  # type: ignore[arg-type,call-arg]
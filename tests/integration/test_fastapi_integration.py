@@ -208,3 +208,109 @@ def test_service_not_registered_error(app: FastAPI, container: Container) -> Non
     client = TestClient(app)
     with pytest.raises(ServiceNotFoundError):
         client.get("/unregistered")
+
+
+def test_inject_async_service(app: FastAPI, container: Container) -> None:
+    """测试异步服务的依赖函数是协程函数, 由 FastAPI 直接 await."""
+    import inspect
+
+    async def create_user_service() -> UserService:
+        return UserService()
+
+    container.register_factory(UserService, create_user_service, lifetime=Lifetime.SINGLETON)
+    dependency = inject(UserService)
+
+    @app.get("/async-users/{user_id}")
+    async def get_user(user_id: int, user_service: UserService = Depends(dependency)):
+        return user_service.get_user(user_id)
+
+    client = TestClient(app)
+    response = client.get("/async-users/5")
+
+    assert inspect.iscoroutinefunction(dependency)
+    assert not inspect.iscoroutinefunction(inject(EmailService))
+    assert response.status_code == 200
+    assert response.json() == {"id": 5, "name": "User 5"}
+
+
+def test_inject_returns_same_dependency_per_service(app: FastAPI, container: Container) -> None:
+    """测试同一服务类型得到同一个依赖函数, 同一请求内只解析一次."""
+    container.register(UserService, lifetime=Lifetime.TRANSIENT)
+
+    @app.get("/pair")
+    def get_pair(
+        first: UserService = Depends(inject(UserService)),
+        second: UserService = Depends(inject(UserService)),
+    ):
+        return {"same": first is second}
+
+    client = TestClient(app)
+    response = client.get("/pair")
+
+    assert inject(UserService) is inject(UserService)
+    assert response.json() == {"same": True}
+
+
+def test_inject_before_setup_defers_async_detection() -> None:
+    """测试容器绑定前创建的依赖在首次请求时判断异步服务."""
+    from symphra_container.integrations import fastapi as fastapi_module
+
+    class LateService:
+        pass
+
+    async def create_late_service() -> LateService:
+        return LateService()
+
+    fastapi_module._container = None
+    dependency = inject(LateService)
+
+    app = FastAPI()
+
+    @app.get("/late")
+    async def get_late(service: LateService = Depends(dependency)):
+        return {"type": type(service).__name__}
+
+    container = Container()
+    container.register_factory(LateService, create_late_service)
+    setup_container(app, container)
+
+    client = TestClient(app)
+    response = client.get("/late")
+
+    assert response.json() == {"type": "LateService"}
+
+
+def test_inject_before_setup_builds_sync_service_in_threadpool() -> None:
+    """测试容器绑定前创建的依赖与同步依赖一样在线程池中创建同步服务."""
+    import threading
+
+    from symphra_container.integrations import fastapi as fastapi_module
+
+    built_on: list[threading.Thread] = []
+    loop_threads: list[threading.Thread] = []
+
+    class BlockingService:
+        def __init__(self) -> None:
+            built_on.append(threading.current_thread())
+
+    fastapi_module._container = None
+    dependency = inject(BlockingService)
+
+    app = FastAPI()
+
+    @app.get("/early")
+    async def get_early(service: BlockingService = Depends(dependency)):
+        # 异步路由在事件循环线程上执行
+        loop_threads.append(threading.current_thread())
+        return {"ok": True}
+
+    container = Container()
+    container.register(BlockingService)
+    setup_container(app, container)
+
+    client = TestClient(app)
+    response = client.get("/early")
+
+    assert response.status_code == 200
+    assert len(built_on) == 1
+    assert built_on[0] is not loop_threads[0]
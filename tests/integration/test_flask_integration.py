@@ -228,3 +228,27 @@ def test_request_scope_cleanup(app: Flask, container: Container, flask_container
 
     # 每个请求应该有不同的实例
     assert len(set(instances)) == 3
+
+
+def test_inject_decorator_positional_and_unregistered_args(
+    app: Flask, container: Container, flask_container: FlaskContainer
+) -> None:
+    """测试 @inject 装饰器保留位置参数并跳过未注册的注解参数."""
+    # 注册服务
+    container.register(UserService, lifetime=Lifetime.SINGLETON)
+    provided = UserService()
+
+    @flask_container.inject
+    def view(user_service: UserService, user_id: int, page: int = 1):
+        return user_service, user_id, page
+
+    # 直接调用视图
+    with app.app_context():
+        service, user_id, page = view(provided, 7)
+        injected, _, _ = view(user_id=8)
+
+    assert service is provided
+    assert user_id == 7
+    assert page == 1
+    assert isinstance(injected, UserService)
+    assert injected is not provided
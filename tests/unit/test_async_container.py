@@ -15,6 +15,7 @@ import pytest
 from symphra_container import (
     AsyncContainer,
     Lifetime,
+    ResolutionError,
     ServiceNotFoundError,
 )
 
@@ -258,6 +259,307 @@ class TestAsyncDependencies:
         assert isinstance(l1.l2.l3, Level3)
 
 
+    @pytest.mark.asyncio
+    async def test_frozen_container_resolves_dependencies_concurrently(self) -> None:
+        """测试冻结后相互独立的异步依赖并发解析."""
+
+        # 准备
+        class Cache:
+            pass
+
+        class Database:
+            pass
+
+        class Service:
+            def __init__(self, cache: Cache, db: Database) -> None:
+                self.cache = cache
+                self.db = db
+
+        db_started = asyncio.Event()
+
+        async def create_cache():
+            # 顺序解析时 Database 尚未开始创建, 这里会超时
+            await asyncio.wait_for(db_started.wait(), timeout=1)
+            return Cache()
+
+        async def create_db():
+            db_started.set()
+            await asyncio.sleep(0)
+            return Database()
+
+        container = AsyncContainer()
+        container.register_async_factory(Cache, create_cache)
+        container.register_async_factory(Database, create_db)
+        container.register(Service)
+        container.freeze()
+
+        # 执行
+        service = await container.resolve_async(Service)
+
+        # 断言
+        assert isinstance(service.cache, Cache)
+        assert isinstance(service.db, Database)
+
+    @pytest.mark.parametrize("lifetime", [Lifetime.SINGLETON, Lifetime.SCOPED])
+    @pytest.mark.asyncio
+    async def test_frozen_container_creates_shared_dependency_once(self, lifetime: Lifetime) -> None:
+        """测试冻结后并发解析的兄弟依赖共享同一个单例/作用域依赖时只创建一次."""
+
+        # 准备
+        created = []
+
+        class Database:
+            pass
+
+        class Cache:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+        class Repository:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+        class Service:
+            def __init__(self, cache: Cache, repo: Repository) -> None:
+                self.cache = cache
+                self.repo = repo
+
+        async def create_db():
+            created.append("db")
+            # 让出事件循环, 使另一个分支在实例缓存前也请求 Database
+            await asyncio.sleep(0)
+            return Database()
+
+        container = AsyncContainer()
+        container.register_async_factory(Database, create_db, lifetime=lifetime)
+        container.register(Cache)
+        container.register(Repository)
+        container.register(Service)
+        container.freeze()
+
+        # 执行
+        with container.create_scope():
+            service = await container.resolve_async(Service)
+
+        # 断言
+        assert service.cache.db is service.repo.db
+        assert created == ["db"]
+
+    @pytest.mark.asyncio
+    async def test_frozen_container_shares_failed_creation(self) -> None:
+        """测试并发等待同一单例创建时, 创建失败会传给所有等待方且不缓存."""
+
+        # 准备
+        attempts = []
+
+        class Database:
+            pass
+
+        class Cache:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+        class Repository:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+        async def create_db():
+            attempts.append("db")
+            await asyncio.sleep(0)
+            if len(attempts) == 1:
+                raise RuntimeError("connection refused")
+            return Database()
+
+        container = AsyncContainer()
+        container.register_async_factory(Database, create_db, lifetime=Lifetime.SINGLETON)
+        container.register(Cache)
+        container.register(Repository)
+        container.freeze()
+
+        # 执行
+        results = await asyncio.gather(
+            container.resolve_async(Cache),
+            container.resolve_async(Repository),
+            return_exceptions=True,
+        )
+
+        # 断言
+        assert all(isinstance(result, ResolutionError) for result in results)
+        assert attempts == ["db"]
+        cache = await container.resolve_async(Cache)
+        assert isinstance(cache.db, Database)
+        assert attempts == ["db", "db"]
+
+    @pytest.mark.asyncio
+    async def test_unfrozen_container_resolves_dependencies_sequentially(self) -> None:
+        """测试未冻结时异步依赖按参数顺序逐个解析."""
+
+        # 准备
+        order = []
+
+        class Cache:
+            pass
+
+        class Database:
+            pass
+
+        class Service:
+            def __init__(self, cache: Cache, db: Database) -> None:
+                self.cache = cache
+                self.db = db
+
+        async def create_cache():
+            order.append("cache:start")
+            await asyncio.sleep(0)
+            order.append("cache:end")
+            return Cache()
+
+        async def create_db():
+            order.append("db:start")
+            await asyncio.sleep(0)
+            order.append("db:end")
+            return Database()
+
+        container = AsyncContainer()
+        container.register_async_factory(Cache, create_cache)
+        container.register_async_factory(Database, create_db)
+        container.register(Service)
+
+        # 执行
+        await container.resolve_async(Service)
+
+        # 断言
+        assert order == ["cache:start", "cache:end", "db:start", "db:end"]
+
+    @pytest.mark.asyncio
+    async def test_frozen_warmup_creates_independent_singletons_concurrently(self) -> None:
+        """测试冻结后预热按依赖分层, 同层单例并发创建且共享依赖只创建一次."""
+
+        # 准备
+        created = []
+
+        class Cache:
+            pass
+
+        class Database:
+            pass
+
+        class Service:
+            def __init__(self, cache: Cache, db: Database) -> None:
+                self.cache = cache
+                self.db = db
+
+        db_started = asyncio.Event()
+
+        async def create_cache():
+            # 顺序预热时 Database 尚未开始创建, 这里会超时
+            await asyncio.wait_for(db_started.wait(), timeout=1)
+            created.append("cache")
+            return Cache()
+
+        async def create_db():
+            db_started.set()
+            await asyncio.sleep(0)
+            created.append("db")
+            return Database()
+
+        container = AsyncContainer()
+        container.register_factory(Cache, create_cache, lifetime=Lifetime.SINGLETON)
+        container.register_factory(Database, create_db, lifetime=Lifetime.SINGLETON)
+        container.register(Service, lifetime=Lifetime.SINGLETON)
+        container.freeze()
+
+        # 执行
+        await container.warmup_async(Service, Cache)
+
+        # 断言
+        assert sorted(created) == ["cache", "db"]
+        service = await container.resolve_async(Service)
+        assert service.cache is await container.resolve_async(Cache)
+        assert service.db is await container.resolve_async(Database)
+        assert len(created) == 2
+
+    @pytest.mark.asyncio
+    async def test_frozen_warmup_reports_failures_like_sequential_warmup(self) -> None:
+        """测试冻结后预热与逐个预热一致: 忽略解析错误, 传播其他异常."""
+
+        # 准备
+        class Aborted(BaseException):
+            pass
+
+        async def create_broken():
+            raise RuntimeError("broken")
+
+        async def create_aborted():
+            raise Aborted
+
+        created = []
+
+        def create_ok():
+            created.append("ok")
+            return object()
+
+        containers = []
+        for frozen in (False, True):
+            container = AsyncContainer()
+            container.register_factory("broken", create_broken, lifetime=Lifetime.SINGLETON)
+            container.register_factory("aborted", create_aborted, lifetime=Lifetime.SINGLETON)
+            container.register_factory("ok", create_ok, lifetime=Lifetime.SINGLETON)
+            if frozen:
+                container.freeze()
+            containers.append(container)
+
+        for container in containers:
+            # 执行 & 断言
+            created.clear()
+            await container.warmup_async("broken", "ok")
+            assert created == ["ok"]
+
+            with pytest.raises(Aborted):
+                await container.warmup_async("aborted", "ok")
+
+
+    @pytest.mark.asyncio
+    async def test_cached_singleton_dependency_skips_resolve_async(self) -> None:
+        """测试已缓存的单例依赖不再经过 resolve_async 协程."""
+
+        # 准备
+        class Config:
+            pass
+
+        class Logger:
+            pass
+
+        class Service:
+            def __init__(self, config: Config, logger: Logger | None = None) -> None:
+                self.config = config
+                self.logger = logger
+
+        container = AsyncContainer()
+        container.register(Config, lifetime=Lifetime.SINGLETON)
+        container.register(Logger, lifetime=Lifetime.SINGLETON)
+        container.register(Service)
+        config = await container.resolve_async(Config)
+        logger = await container.resolve_async(Logger)
+
+        original = container.resolve_async
+        calls = []
+
+        async def counting_resolve_async(key):
+            calls.append(key)
+            return await original(key)
+
+        container.resolve_async = counting_resolve_async
+
+        # 执行
+        service = await container.resolve_async(Service)
+
+        # 断言
+        assert service.config is config
+        assert service.logger is logger
+        assert calls == [Service]
+
+
 class TestAsyncInstanceRegistration:
     """异步容器实例注册测试."""
 
@@ -145,6 +145,68 @@ class TestCircularDependencyDetection:
         with pytest.raises(CircularDependencyError):
             detector.enter_resolution("ServiceA")
 
+    def test_freeze_detects_cycle(self, container) -> None:
+        """测试 freeze 通过依赖图一次性检测循环依赖."""
+        # 准备
+        container.register(ServiceA_Three)
+        container.register(ServiceB_Three)
+        container.register(ServiceC_Three)
+
+        # 执行 & 断言
+        with pytest.raises(CircularDependencyError) as exc_info:
+            container.freeze()
+
+        assert set(exc_info.value.dependency_chain) == {ServiceA_Three, ServiceB_Three, ServiceC_Three}
+
+    def test_freeze_detects_self_reference(self, container) -> None:
+        """测试 freeze 检测自引用服务."""
+        # 准备
+        container.register(ServiceSelfRef)
+
+        # 执行 & 断言
+        with pytest.raises(CircularDependencyError):
+            container.freeze()
+
+    def test_freeze_does_not_load_visualization(self, container, monkeypatch) -> None:
+        """测试 freeze 不会加载可视化诊断模块."""
+        import sys
+
+        # 准备
+        monkeypatch.delitem(sys.modules, "symphra_container.visualization", raising=False)
+        container.register(ServiceSelfRef)
+
+        # 执行
+        with pytest.raises(CircularDependencyError):
+            container.freeze()
+
+        # 断言
+        assert "symphra_container.visualization" not in sys.modules
+
+    def test_frozen_container_skips_detector(self, container) -> None:
+        """测试冻结后解析不再逐次进入循环检测栈, 注册变化后恢复检测."""
+
+        # 准备
+        class Config:
+            pass
+
+        depths = []
+
+        def factory(config: Config) -> object:
+            depths.append(container._circular_detector.current_depth)
+            return object()
+
+        container.register(Config)
+        container.register_factory("service", factory)
+
+        # 执行
+        assert container.freeze() is container
+        container.resolve("service")
+        container.register_instance("other", object())
+        container.resolve("service")
+
+        # 断言
+        assert depths == [0, 1]
+
 
 class TestLazyProxyBasics:
     """Lazy Proxy 基础测试."""
@@ -284,6 +346,86 @@ class TestLazyProxyBasics:
         # 断言
         assert "LazyProxy" in str_repr
 
+    def test_lazy_proxy_repr_is_stable(self) -> None:
+        """测试 Lazy Proxy 的 ID 在首次 repr 时生成且保持不变."""
+        proxy = LazyProxy(lambda: "test")
+
+        assert repr(proxy) == repr(proxy)
+        assert repr(proxy) != repr(LazyProxy(lambda: "test"))
+
+    def test_lazy_proxy_switches_class_after_resolution(self) -> None:
+        """测试 Lazy Proxy 首次解析后切换为已解析代理类."""
+
+        class Service:
+            def __init__(self) -> None:
+                self.value = 1
+
+        proxy = LazyProxy(Service)
+        assert type(proxy) is LazyProxy
+
+        proxy.value = 2
+        assert type(proxy) is not LazyProxy
+        assert isinstance(proxy, LazyProxy)
+        assert proxy.value == 2
+        assert proxy() is proxy()
+
+    def test_resolved_lazy_proxy_delegates_protocols(self) -> None:
+        """测试已解析代理将真值,迭代和删除等协议转发给真实对象."""
+
+        class Service:
+            pass
+
+        service_proxy = LazyProxy(Service)
+        service_proxy()
+        assert bool(service_proxy) is True
+
+        dict_proxy = LazyProxy(lambda: {"a": 1, "b": 2})
+        dict_proxy()
+        assert list(dict_proxy) == ["a", "b"]
+        del dict_proxy["a"]
+        assert len(dict_proxy) == 1
+
+        empty_proxy = LazyProxy(list)
+        empty_proxy()
+        assert not empty_proxy
+
+    def test_unresolved_lazy_proxy_delegates_protocols(self) -> None:
+        """测试未解析的代理在首次真值测试, 迭代和删除时解析并转发给真实对象."""
+
+        class Service:
+            pass
+
+        # 执行 & 断言
+        assert bool(LazyProxy(Service)) is True
+        assert not LazyProxy(list)
+        assert list(LazyProxy(lambda: {"a": 1, "b": 2})) == ["a", "b"]
+
+        dict_proxy = LazyProxy(lambda: {"a": 1, "b": 2})
+        del dict_proxy["a"]
+        assert len(dict_proxy) == 1
+
+    def test_resolved_proxy_class_cache_releases_collected_types(self) -> None:
+        """测试真实类型被回收后, 已解析代理类缓存不再持有它."""
+        import gc
+        import weakref
+
+        from symphra_container.circular import _RESOLVED_PROXY_CLASSES
+
+        # 准备
+        service_type = type("TransientService", (), {})
+        proxy = LazyProxy(service_type)
+        proxy()
+        assert service_type in _RESOLVED_PROXY_CLASSES
+        type_ref = weakref.ref(service_type)
+
+        # 执行
+        del proxy, service_type
+        gc.collect()
+
+        # 断言
+        assert type_ref() is None
+        assert all(key.__name__ != "TransientService" for key in _RESOLVED_PROXY_CLASSES)
+
     def test_lazy_proxy_with_dict(self) -> None:
         """测试 Lazy Proxy 与字典的交互."""
 
@@ -335,6 +477,100 @@ class TestLazyTypeAlias:
         """测试 Lazy 就是 LazyProxy."""
         assert Lazy is LazyProxy
 
+    def test_string_lazy_annotation(self, container) -> None:
+        """测试字符串形式的 Lazy["Name"] 依赖注入 LazyProxy."""
+
+        # 准备
+        class ServiceB:
+            pass
+
+        class ServiceA:
+            def __init__(self, b: "Lazy[ServiceB]") -> None:
+                self.b = b
+
+        container.register(ServiceA)
+        container.register(ServiceB)
+
+        # 执行
+        a = container.resolve(ServiceA)
+
+        # 断言
+        assert isinstance(a.b, LazyProxy)
+        assert isinstance(a.b(), ServiceB)
+
+    def test_string_lazy_annotation_for_string_key(self, container) -> None:
+        """测试字符串形式的 Lazy["Name"] 可以指向字符串服务键和别名."""
+
+        # 准备
+        class ServiceA:
+            def __init__(self, config: "Lazy[config]", settings: "Lazy[settings]") -> None:  # noqa: F821
+                self.config = config
+                self.settings = settings
+
+        container.register_factory("config", lambda: {"debug": True})
+        container.alias("config", "settings")
+        container.register(ServiceA)
+
+        # 执行
+        a = container.resolve(ServiceA)
+
+        # 断言
+        assert isinstance(a.config, LazyProxy)
+        assert a.config() == {"debug": True}
+        assert a.settings() == {"debug": True}
+
+    def test_lazy_factory_reused_across_resolutions(self, container) -> None:
+        """测试 Lazy[T] 依赖的解析工厂按服务键复用."""
+
+        # 准备
+        class ServiceB:
+            pass
+
+        class ServiceA:
+            def __init__(self, b: Lazy[ServiceB]) -> None:
+                self.b = b
+
+        container.register(ServiceA)
+        container.register(ServiceB)
+
+        # 执行
+        first = container.resolve(ServiceA)
+        second = container.resolve(ServiceA)
+
+        # 断言
+        assert first.b is not second.b
+        assert first.b._factory is second.b._factory
+        assert first.b._factory is container._lazy_factory(ServiceB, False)
+        assert isinstance(second.b(), ServiceB)
+
+    def test_lazy_type_marker_repr(self) -> None:
+        """测试 Lazy[T] 标记的字符串表示."""
+
+        class Service:
+            pass
+
+        assert repr(Lazy[Service]) == "Lazy[Service]"
+        assert repr(Lazy["Service"]) == "Lazy['Service']"
+
+    def test_lazy_dependency_recognized_at_analysis(self) -> None:
+        """测试 Lazy[T] 依赖在依赖分析时即被识别."""
+        from symphra_container.injector import DependencyInfo
+
+        class Service:
+            pass
+
+        marker = Lazy[Service]
+        by_marker = DependencyInfo("service", marker, marker)
+        by_name = DependencyInfo("service", "Lazy[Service]", object)
+        regular = DependencyInfo("service", Service, Service)
+
+        assert by_marker.is_lazy
+        assert by_marker.lazy_inner_type is Service
+        assert by_name.is_lazy
+        assert by_name.lazy_inner_type is None
+        assert by_name.lazy_inner_name == "Service"
+        assert not regular.is_lazy
+
 
 class TestCircularDependencyDetectorClass:
     """CircularDependencyDetector 类的直接测试."""
@@ -348,7 +584,7 @@ class TestCircularDependencyDetectorClass:
 
         # 断言
         assert detector.current_depth == 0
-        assert detector.chain == []
+        assert detector.chain == ()
 
     def test_detector_enter_exit_resolution(self) -> None:
         """测试进入和离开解析."""
@@ -364,7 +600,7 @@ class TestCircularDependencyDetectorClass:
 
         detector.exit_resolution("ServiceA")
         assert detector.current_depth == 0
-        assert detector.chain == []
+        assert detector.chain == ()
 
     def test_detector_detects_circular(self) -> None:
         """测试检测循环."""
@@ -412,7 +648,7 @@ class TestCircularDependencyDetectorClass:
 
         # 断言
         assert detector.current_depth == 0
-        assert detector.chain == []
+        assert detector.chain == ()
 
     def test_detector_chain_property(self) -> None:
         """测试依赖链属性."""
@@ -428,11 +664,71 @@ class TestCircularDependencyDetectorClass:
         chain = detector.chain
 
         # 断言
-        assert chain == ["ServiceA", "ServiceB", "ServiceC"]
-        assert isinstance(chain, list)
-        # 修改返回的 chain 不应该影响内部状态
-        chain.append("ServiceD")
-        assert len(detector.chain) == 3
+        assert chain == ("ServiceA", "ServiceB", "ServiceC")
+        assert isinstance(chain, tuple)
+        # 栈未变化时复用同一快照
+        assert detector.chain is chain
+        # 栈变化后生成新的快照,旧快照保持不变
+        detector.enter_resolution("ServiceD")
+        assert len(chain) == 3
+        assert detector.chain == ("ServiceA", "ServiceB", "ServiceC", "ServiceD")
+
+    def test_leaf_service_skips_detector(self, container) -> None:
+        """测试已知无依赖的叶子服务不再进入循环检测栈."""
+        # 准备
+        depths = []
+
+        def factory() -> object:
+            depths.append(container._circular_detector.current_depth)
+            return object()
+
+        container.register_factory("leaf", factory)
+
+        # 执行
+        container.resolve("leaf")
+        container.resolve("leaf")
+
+        # 断言: 首次解析时尚未分析依赖, 之后跳过检测器
+        assert depths == [1, 0]
+
+    def test_detector_bitmap_mode(self) -> None:
+        """测试位图模式下使用整数 ID 跟踪解析栈."""
+        from symphra_container.circular import CircularDependencyDetector
+        from symphra_container.exceptions import CircularDependencyError
+
+        # 准备
+        detector = CircularDependencyDetector(use_bitmap=True, capacity=8)
+
+        # 执行 & 断言
+        detector.push(3)
+        detector.push(5)
+        assert detector.chain == (3, 5)
+
+        with pytest.raises(CircularDependencyError):
+            detector.push(3)
+
+        detector.pop()
+        detector.push(5)
+        assert detector.current_depth == 2
+
+        detector.clear()
+        assert detector.chain == ()
+        detector.push(3)
+        assert detector.chain == (3,)
+
+    @pytest.mark.parametrize("key", [-1, 8, "A"])
+    def test_detector_bitmap_mode_rejects_out_of_range_key(self, key: object) -> None:
+        """测试位图模式拒绝超出容量范围的键, 且不修改解析状态."""
+        from symphra_container.circular import CircularDependencyDetector
+
+        # 准备
+        detector = CircularDependencyDetector(use_bitmap=True, capacity=8)
+        detector.push(7)
+
+        # 执行 & 断言
+        with pytest.raises(ValueError, match="Bitmap mode"):
+            detector.push(key)
+        assert detector.chain == (7,)
 
     def test_detector_multiple_cycles(self) -> None:
         """测试检测器处理多个循环."""
@@ -458,6 +754,20 @@ class TestCircularDependencyDetectorClass:
         # 断言
         assert detector.current_depth == 0
 
+    def test_detector_allows_reentry_after_exit(self) -> None:
+        """测试退出解析后同一服务可以再次进入."""
+        from symphra_container.circular import CircularDependencyDetector
+
+        detector = CircularDependencyDetector()
+
+        detector.enter_resolution("ServiceA")
+        detector.enter_resolution("ServiceB")
+        detector.exit_resolution("ServiceB")
+
+        # ServiceB 已离开解析栈,再次进入不应被视为循环
+        detector.enter_resolution("ServiceB")
+        assert detector.chain == ("ServiceA", "ServiceB")
+
 
 class TestComplexScenarios:
     """复杂场景测试."""
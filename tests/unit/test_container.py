@@ -215,6 +215,15 @@ class TestErrorHandling:
         with pytest.raises(RegistrationError):
             container.register(Service)
 
+    def test_register_non_callable_factory_raises(self, container) -> None:
+        """测试注册不可调用的工厂时立即抛出异常."""
+
+        # 执行 & 断言
+        with pytest.raises(RegistrationError):
+            container.register_factory("config", {"debug": True})  # type: ignore[arg-type]
+
+        assert not container.is_registered("config")
+
     def test_register_duplicate_with_override(self, container) -> None:
         """测试使用 override=True 覆盖已注册的服务."""
 
@@ -332,6 +341,23 @@ class TestInspection:
         assert ServiceA in all_registrations
         assert ServiceB in all_registrations
 
+    def test_get_all_registrations_is_read_only_view(self, container) -> None:
+        """测试 get_all_registrations 返回只读视图, 不复制注册表."""
+
+        # 准备
+        class ServiceA:
+            pass
+
+        all_registrations = container.get_all_registrations()
+
+        # 执行
+        container.register(ServiceA)
+
+        # 断言
+        assert ServiceA in all_registrations
+        with pytest.raises(TypeError):
+            all_registrations["other"] = all_registrations[ServiceA]  # type: ignore[index]
+
 
 class TestContextManager:
     """上下文管理器测试."""
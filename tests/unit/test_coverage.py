@@ -133,6 +133,28 @@ class TestContainerErrors:
         with pytest.raises(ValueError):
             container.add_interceptor("invalid_type", dummy_interceptor)
 
+    def test_after_interceptors_run_in_order(self, container) -> None:
+        """测试后置拦截器按添加顺序依次执行."""
+        container.register_factory("value", lambda: 1)
+        container.add_interceptor("after", lambda key, instance: instance + 1)
+        container.add_interceptor("after", lambda key, instance: instance * 10)
+
+        assert container.resolve("value") == 20
+        assert isinstance(container._after_interceptors, tuple)
+
+    def test_singleton_shortcut_follows_before_interceptors(self, container) -> None:
+        """测试前置拦截器的添加与清除同步更新单例快捷读取开关."""
+        assert container._singleton_shortcut is container._lifetime_manager._singleton_store
+
+        container.add_interceptor("after", lambda key, instance: instance)
+        assert container._singleton_shortcut is not None
+
+        container.add_interceptor("before", lambda key, registration: True)
+        assert container._singleton_shortcut is None
+
+        container.dispose()
+        assert container._singleton_shortcut is container._lifetime_manager._singleton_store
+
     def test_container_initialization_with_config(self) -> None:
         """测试容器初始化配置."""
         container = Container(enable_auto_wiring=False, strict_mode=False)
@@ -270,5 +292,7 @@ class TestContainerDisposal:
 
         # 所有状态应该被清空
         assert len(container._registrations) == 0
-        assert len(container._interceptors) == 0
+        assert not container._before_interceptors
+        assert not container._after_interceptors
+        assert not container._error_interceptors
         assert container._circular_detector.current_depth == 0
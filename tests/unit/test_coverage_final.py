@@ -37,6 +37,14 @@ class TestRegistrationInfo:
         assert reg.lifetime == Lifetime.SINGLETON
         assert reg.override is True
 
+    def test_registration_uses_slots(self) -> None:
+        """测试注册信息使用 __slots__, 不创建实例字典."""
+        reg = ServiceRegistration(key="test_key", service_type=object)
+
+        assert not hasattr(reg, "__dict__")
+        with pytest.raises(AttributeError):
+            reg.unknown = 1  # type: ignore[attr-defined]
+
 
 class TestContainerAPICompleteness:
     """容器 API 完整性测试."""
@@ -85,7 +93,7 @@ class TestContainerAPICompleteness:
         assert container.is_registered("myservice")
 
     def test_get_registration_returns_copy(self, container) -> None:
-        """测试 get_all_registrations 返回副本."""
+        """测试 get_all_registrations 每次返回新的视图对象."""
 
         class Service:
             pass
@@ -94,7 +102,7 @@ class TestContainerAPICompleteness:
         registrations1 = container.get_all_registrations()
         registrations2 = container.get_all_registrations()
 
-        # 应该是不同的对象(副本)
+        # 应该是不同的对象
         assert registrations1 is not registrations2
         # 但内容应该相同
         assert registrations1.keys() == registrations2.keys()
@@ -331,6 +339,14 @@ class TestScopeManagement:
         assert counters[0].id == 1
         assert counters[1].id == 2
 
+    def test_scope_ids_unique_and_slotted(self, container) -> None:
+        """测试作用域 ID 唯一且作用域对象不创建实例字典."""
+        scope1 = container.create_scope()
+        scope2 = container.create_scope()
+
+        assert scope1._scope_id != scope2._scope_id
+        assert not hasattr(scope1, "__dict__")
+
 
 class TestContainerContextManager:
     """容器上下文管理器的测试."""
@@ -361,3 +377,40 @@ class TestContainerContextManager:
             container.register(Service)
             service = container.resolve(Service)
             assert isinstance(service, Service)
+
+
+class TestPackageLazyExports:
+    """包级延迟导出测试."""
+
+    def test_all_exports_resolvable(self) -> None:
+        """测试 __all__ 中的所有名称都可以访问."""
+        import symphra_container
+
+        for name in symphra_container.__all__:
+            assert getattr(symphra_container, name) is not None
+
+    def test_lazy_export_matches_submodule(self) -> None:
+        """测试延迟导出与子模块中的对象一致."""
+        import symphra_container
+        from symphra_container.visualization import diagnose_container
+
+        assert symphra_container.diagnose_container is diagnose_container
+        assert symphra_container.visualization.diagnose_container is diagnose_container
+
+    def test_unknown_attribute_raises(self) -> None:
+        """测试访问不存在的属性时抛出 AttributeError."""
+        import symphra_container
+
+        with pytest.raises(AttributeError):
+            symphra_container.does_not_exist  # noqa: B018
+
+    def test_integration_exports_resolvable(self) -> None:
+        """测试集成包按需导出各框架集成, 无需安装对应框架."""
+        import symphra_container.integrations as integrations
+        from symphra_container.integrations.fastapi import inject, setup_container
+
+        for name in integrations.__all__:
+            assert getattr(integrations, name) is not None
+        assert integrations.fastapi_inject is inject
+        assert integrations.setup_fastapi is setup_container
+        assert "DjangoContainer" in dir(integrations)
@@ -7,6 +7,9 @@
 - 自动注册功能
 """
 
+import sys
+import textwrap
+
 from symphra_container import Lifetime
 from symphra_container.decorators import (
     ServiceMetadata,
@@ -417,6 +420,46 @@ class TestGetServiceMetadata:
         assert metadata is not None
         assert isinstance(metadata, ServiceMetadata)
 
+    def test_redecoration_with_new_config_replaces_metadata(self) -> None:
+        """测试配置变化的重复装饰替换元数据, 子类不复用基类的元数据."""
+
+        # 准备
+        @injectable
+        class Service:
+            pass
+
+        metadata = get_service_metadata(Service)
+
+        # 执行
+        transient(Service)
+        singleton(Service)
+
+        @injectable
+        class SubService(Service):
+            pass
+
+        # 断言
+        assert not hasattr(metadata, "__dict__")
+        assert get_service_metadata(Service) is not metadata
+        assert get_service_metadata(Service).lifetime == Lifetime.SINGLETON
+        assert get_service_metadata(SubService).service_type is SubService
+
+    def test_redecoration_with_same_config_keeps_metadata(self) -> None:
+        """测试相同配置的重复装饰保留同一元数据对象."""
+
+        # 准备
+        @injectable
+        class Service:
+            pass
+
+        metadata = get_service_metadata(Service)
+
+        # 执行
+        transient(Service)
+
+        # 断言
+        assert get_service_metadata(Service) is metadata
+
     def test_get_metadata_returns_none_for_non_injectable(self) -> None:
         """测试非 injectable 返回 None."""
 
@@ -527,3 +570,146 @@ class TestComplexDecoratorScenarios:
 
         assert d1 is d2  # 装饰的是单例
         assert m1 is not m2  # 手动注册默认是瞬时
+
+
+class TestPackageScan:
+    """包扫描测试."""
+
+    def test_scan_registers_module_level_injectables(self, container, tmp_path, monkeypatch) -> None:
+        """测试扫描包时按装饰器记录注册模块级别的服务, 重复装饰只记录一次."""
+        # 准备
+        package = tmp_path / "scan_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "services.py").write_text(
+            textwrap.dedent(
+                """
+                from symphra_container import factory, injectable, singleton
+
+                @singleton
+                @singleton
+                class Database:
+                    pass
+
+                @injectable
+                class _Hidden:
+                    pass
+
+                del _Hidden
+
+                @factory(key="answer")
+                def create_answer() -> int:
+                    return 42
+
+                class Plain:
+                    pass
+                """
+            )
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # 执行
+        try:
+            container.scan("scan_pkg")
+            services = sys.modules["scan_pkg.services"]
+        finally:
+            sys.modules.pop("scan_pkg.services", None)
+            sys.modules.pop("scan_pkg", None)
+
+        # 断言
+        assert [obj.__name__ for obj in services.__symphra_injectables__] == ["Database", "_Hidden", "create_answer"]
+        assert container.is_registered(services.Database)
+        assert container.resolve("answer") == 42
+        assert not container.is_registered(services.Plain)
+        assert len(container.get_all_registrations()) == 2
+
+    def test_scan_directory_path_loads_nested_files(self, container, tmp_path) -> None:
+        """测试扫描目录路径时递归加载全部文件, 导入失败的文件被跳过."""
+        # 准备
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "cache.py").write_text(
+            textwrap.dedent(
+                """
+                from symphra_container import singleton
+
+                @singleton
+                class Cache:
+                    pass
+                """
+            )
+        )
+        (tmp_path / "nested" / "repository.py").write_text(
+            textwrap.dedent(
+                """
+                from symphra_container import injectable
+
+                @injectable(key="repository")
+                class Repository:
+                    pass
+                """
+            )
+        )
+        (tmp_path / "broken.py").write_text("import does_not_exist_module\n")
+        (tmp_path / "invalid.py").write_text("def broken(:\n")
+        (tmp_path / "failing.py").write_text("raise RuntimeError('boom')\n")
+
+        # 执行
+        container.scan(tmp_path)
+
+        # 断言
+        registered = {getattr(key, "__name__", key) for key in container.get_all_registrations()}
+        assert registered == {"Cache", "repository"}
+        assert container.resolve("repository").__class__.__name__ == "Repository"
+        assert not [name for name in sys.modules if name.startswith("__scan_module")]
+
+    def test_scan_directory_supports_relative_imports(self, container, tmp_path) -> None:
+        """测试扫描目录时文件之间的相对导入可以解析, 被导入的文件只执行一次."""
+        # 准备
+        (tmp_path / "database.py").write_text(
+            textwrap.dedent(
+                """
+                from symphra_container import singleton
+
+                LOADS = []
+                LOADS.append(1)
+
+                @singleton
+                class Database:
+                    pass
+                """
+            )
+        )
+        (tmp_path / "a_service.py").write_text(
+            textwrap.dedent(
+                """
+                from symphra_container import injectable
+
+                from .database import LOADS, Database
+
+                @injectable(key="service")
+                class Service:
+                    def __init__(self, db: Database) -> None:
+                        self.db = db
+                        self.loads = len(LOADS)
+                """
+            )
+        )
+
+        # 执行
+        container.scan(tmp_path)
+        service = container.resolve("service")
+
+        # 断言
+        assert service.db is container.resolve(type(service.db))
+        assert service.loads == 1
+        assert len(container.get_all_registrations()) == 2
+
+    def test_local_injectables_not_tracked(self) -> None:
+        """测试函数内部定义的服务不记录到模块注册表."""
+
+        @injectable
+        class LocalService:
+            pass
+
+        tracked = vars(sys.modules[__name__]).get("__symphra_injectables__", [])
+        assert LocalService not in tracked
@@ -31,6 +31,36 @@ class TestContainerException:
         exc = ContainerException("Test error", "MyService")
         assert "MyService" in str(exc)
 
+    def test_message_formatted_on_first_access(self) -> None:
+        """测试异常消息在首次读取时生成并缓存."""
+        exc = ResolutionError("MyService", ValueError("boom"))
+
+        assert exc._message is None
+        assert exc.message == "Failed to resolve service 'MyService': boom"
+        assert exc.message is exc.message
+        assert str(exc) is str(exc)
+
+    def test_message_can_be_rewritten(self) -> None:
+        """测试可以改写异常消息, 字符串表示随之更新."""
+        exc = ResolutionError("MyService", ValueError("boom"))
+        assert "boom" in str(exc)
+
+        exc.message = "rewritten"
+
+        assert exc.message == "rewritten"
+        assert str(exc) == "ResolutionError: rewritten (service_key: MyService)"
+
+    def test_pickle_round_trip(self) -> None:
+        """测试异常保留原始参数, 可以序列化后还原."""
+        import pickle
+
+        exc = ServiceNotFoundError("UserService", ["ServiceA"])
+
+        restored = pickle.loads(pickle.dumps(exc))  # noqa: S301
+
+        assert restored.args == ("UserService", ["ServiceA"])
+        assert str(restored) == str(exc)
+
 
 class TestServiceNotFoundError:
     """ServiceNotFoundError 测试."""
@@ -63,10 +63,80 @@ def test_generic_key_equality():
     assert hash(key1) != hash(key3)
 
 
+def test_generic_key_of_returns_interned_instance():
+    """测试 GenericKey.of 对相同参数返回同一实例."""
+    key1 = GenericKey.of(Repository, (User,))
+    key2 = GenericKey.of(Repository, (User,))
+
+    assert key1 is key2
+    assert key1 == GenericKey(Repository, (User,))
+    assert key1 is not GenericKey.of(Repository, (Order,))
+
+
+
+def test_generic_key_cache_holds_weak_references():
+    """测试驻留缓存只弱引用泛型键, 不再使用的键可以被回收."""
+    import gc
+
+    from symphra_container.generics import _KEY_CACHE
+
+    class Temporary:
+        pass
+
+    key = GenericKey.of(Repository, (Temporary,))
+    assert not hasattr(key, "__dict__")
+    assert _KEY_CACHE[(Repository, (Temporary,))] is key
+
+    del key
+    gc.collect()
+
+    assert (Repository, (Temporary,)) not in _KEY_CACHE
+
+
+def test_resolve_generic_reuses_cached_key():
+    """测试重复解析同一泛型类型会复用缓存的键."""
+    from symphra_container.generics import _generic_key_for
+
+    container = Container()
+    register_generic(container, Repository[User], UserRepository)
+
+    assert _generic_key_for(Repository[User]) is _generic_key_for(Repository[User])
+    assert isinstance(resolve_generic(container, Repository[User]), UserRepository)
+    assert isinstance(resolve_generic(container, Repository[User]), UserRepository)
+
+
+def test_clear_all_caches_resets_generic_and_injector_caches():
+    """测试 clear_all_caches 同时清空泛型键, 依赖分析与已解析代理类缓存."""
+    from symphra_container import LazyProxy, clear_all_caches
+    from symphra_container.circular import _RESOLVED_PROXY_CLASSES
+    from symphra_container.generics import _KEY_CACHE, _cached_generic_key
+    from symphra_container.injector import ConstructorInjector
+
+    class Service:
+        def __init__(self, repo: UserRepository) -> None:
+            self.repo = repo
+
+    key = _cached_generic_key(Repository[User])
+    ConstructorInjector.analyze_dependencies(Service)
+    LazyProxy(User)()
+    assert _cached_generic_key.cache_info().currsize > 0
+    assert User in _RESOLVED_PROXY_CLASSES
+
+    clear_all_caches()
+
+    assert _cached_generic_key.cache_info().currsize == 0
+    assert len(_KEY_CACHE) == 0
+    assert Service not in ConstructorInjector._dependency_cache
+    assert not ConstructorInjector._type_hints_cache
+    assert len(_RESOLVED_PROXY_CLASSES) == 0
+    assert GenericKey.of(Repository, (User,)) is not key
+
+
 def test_generic_key_repr():
     """测试泛型键的字符串表示."""
     key = GenericKey(Repository, (User,))
     assert "Repository[User]" in repr(key)
+    assert repr(key) is repr(key)
 
 
 def test_register_generic_with_implementation():
@@ -162,6 +232,16 @@ def test_is_generic_type():
     assert is_generic_type(int) is False
 
 
+
+def test_is_generic_type_with_unhashable_args():
+    """测试参数含列表的类型提示不会因无法哈希而抛出 TypeError."""
+    from collections.abc import Callable
+
+    assert is_generic_type(Callable[[int], str]) is True
+    assert is_generic_type(Callable[..., str]) is True
+    assert not is_generic_type([int])
+
+
 def test_multiple_type_parameters():
     """测试多个类型参数的泛型."""
     T1 = TypeVar("T1")
@@ -362,3 +362,436 @@ class TestDependencyAnalysis:
         # 断言
         assert len(dependencies) == 1
         assert dependencies[0].is_optional is True
+
+    def test_can_construct_requires_only_mandatory_dependencies(self) -> None:
+        """测试 can_construct 只要求必需依赖可用, 可选依赖可以缺失."""
+        from symphra_container.injector import ConstructorInjector
+
+        class Database:
+            pass
+
+        class Logger:
+            pass
+
+        class UserService:
+            def __init__(self, db: Database, logger: Logger | None = None) -> None:
+                self.db = db
+                self.logger = logger
+
+        assert ConstructorInjector.can_construct(UserService, {Database})
+        assert not ConstructorInjector.can_construct(UserService, {Logger})
+
+    def test_analysis_result_cached_including_empty(self) -> None:
+        """测试依赖分析结果按类缓存, 没有依赖的类同样命中缓存."""
+        from symphra_container.injector import ConstructorInjector
+
+        class Leaf:
+            pass
+
+        first = ConstructorInjector.analyze_dependencies(Leaf)
+
+        assert first == ()
+        assert ConstructorInjector.analyze_dependencies(Leaf) is first
+
+    def test_simple_type_check(self) -> None:
+        """测试基础类型判断, 无法哈希的注解不视为基础类型."""
+        from symphra_container.injector import ConstructorInjector
+
+        assert ConstructorInjector._is_simple_type(str)
+        assert ConstructorInjector._is_simple_type(type(None))
+        assert not ConstructorInjector._is_simple_type(object)
+        assert not ConstructorInjector._is_simple_type(["not", "hashable"])  # type: ignore[arg-type]
+
+    def test_dependency_info_uses_slots(self) -> None:
+        """测试依赖信息使用 __slots__, 不创建实例字典."""
+        # 准备
+        from symphra_container.injector import ConstructorInjector
+
+        class Database:
+            pass
+
+        class UserService:
+            def __init__(self, db: Database) -> None:
+                self.db = db
+
+        # 执行
+        dependency = ConstructorInjector.analyze_dependencies(UserService)[0]
+
+        # 断言
+        assert not hasattr(dependency, "__dict__")
+        with pytest.raises(AttributeError):
+            dependency.unknown = 1  # type: ignore[attr-defined]
+
+    def test_type_hints_shared_by_inherited_constructor(self, monkeypatch) -> None:
+        """测试继承同一构造函数的子类复用已解析的类型提示."""
+        # 准备
+        from symphra_container import injector
+        from symphra_container.injector import ConstructorInjector
+
+        class Database:
+            pass
+
+        class BaseService:
+            # 联合类型注解需要 get_type_hints 求值, 不走具体类快速路径
+            def __init__(self, db: Database | None) -> None:
+                self.db = db
+
+        class ChildService(BaseService):
+            pass
+
+        calls = []
+        original = injector.get_type_hints
+
+        def counting_get_type_hints(obj, *args, **kwargs):
+            calls.append(obj)
+            return original(obj, *args, **kwargs)
+
+        monkeypatch.setattr(injector, "get_type_hints", counting_get_type_hints)
+
+        # 执行
+        base_dependencies = ConstructorInjector.analyze_dependencies(BaseService)
+        child_dependencies = ConstructorInjector.analyze_dependencies(ChildService)
+
+        # 断言
+        assert calls == [BaseService.__init__]
+        assert child_dependencies[0].service_type is base_dependencies[0].service_type is Database
+        ConstructorInjector.clear_cache()
+        assert BaseService.__init__ not in ConstructorInjector._type_hints_cache
+
+    def test_analysis_inlines_type_filters(self, monkeypatch) -> None:
+        """测试依赖分析在循环内完成基础类型过滤与可选类型提取."""
+        # 准备
+        from symphra_container.injector import ConstructorInjector
+
+        class Database:
+            pass
+
+        class Cache:
+            pass
+
+        class Service:
+            def __init__(self, db: Database, cache: Cache | None, name: str, value: int | str) -> None:
+                pass
+
+        def fail(*args, **kwargs):
+            raise AssertionError("helper should not be called")
+
+        monkeypatch.setattr(ConstructorInjector, "_is_simple_type", staticmethod(fail))
+        monkeypatch.setattr(ConstructorInjector, "_extract_optional_type", staticmethod(fail))
+
+        # 执行
+        dependencies = ConstructorInjector.analyze_dependencies(Service)
+
+        # 断言
+        assert [(dep.parameter_name, dep.service_key, dep.is_optional) for dep in dependencies] == [
+            ("db", Database, False),
+            ("cache", Cache, True),
+            ("value", int | str, False),
+        ]
+
+    def test_concrete_annotations_skip_get_type_hints(self, monkeypatch) -> None:
+        """测试注解全部为具体类时不调用 get_type_hints."""
+        # 准备
+        from symphra_container import injector
+        from symphra_container.injector import ConstructorInjector
+
+        class Database:
+            pass
+
+        class ConcreteService:
+            def __init__(self, db: Database, name: str = "x") -> None:
+                self.db = db
+
+        class OptionalService:
+            def __init__(self, db: Database | None) -> None:
+                self.db = db
+
+        calls = []
+        original = injector.get_type_hints
+
+        def counting_get_type_hints(obj, *args, **kwargs):
+            calls.append(obj)
+            return original(obj, *args, **kwargs)
+
+        monkeypatch.setattr(injector, "get_type_hints", counting_get_type_hints)
+
+        # 执行
+        concrete = ConstructorInjector.analyze_dependencies(ConcreteService)
+        optional = ConstructorInjector.analyze_dependencies(OptionalService)
+
+        # 断言
+        assert calls == [OptionalService.__init__]
+        assert ConstructorInjector._type_hints_cache[ConcreteService.__init__]["return"] is type(None)
+        assert [dep.service_key for dep in concrete] == [Database]
+        assert optional[0].is_optional
+        assert optional[0].service_key is Database
+
+
+class TestResolutionPlan:
+    """预编译解析计划测试."""
+
+    def test_plan_compiled_once(self, container, monkeypatch) -> None:
+        """测试解析计划只在首次创建实例时编译."""
+
+        # 准备
+        class Logger:
+            pass
+
+        class Service:
+            def __init__(self, logger: Logger) -> None:
+                self.logger = logger
+
+        container.register(Logger)
+        container.register(Service)
+        calls = []
+        original = container._analyze_service_dependencies
+
+        def counting_analyze(registration):
+            calls.append(registration.key)
+            return original(registration)
+
+        monkeypatch.setattr(container, "_analyze_service_dependencies", counting_analyze)
+
+        # 执行
+        for _ in range(3):
+            assert isinstance(container.resolve(Service).logger, Logger)
+
+        # 断言
+        assert calls.count(Service) == 1
+
+    def test_no_dependency_factory_skips_analysis(self, container, monkeypatch) -> None:
+        """测试无依赖的工厂在注册表变化后也不再重新分析."""
+        # 准备
+        container.register_factory("value", lambda: object())
+        container.resolve("value")
+        calls = []
+        monkeypatch.setattr(container, "_analyze_service_dependencies", calls.append)
+
+        # 执行
+        container.register_instance("other", 1)
+        first = container.resolve("value")
+        second = container.resolve("value")
+
+        # 断言
+        assert first is not second
+        assert calls == []
+
+    def test_plan_invalidated_by_registration(self, container) -> None:
+        """测试注册表变化后解析计划重新编译."""
+
+        # 准备
+        class OptionalService:
+            pass
+
+        class Service:
+            def __init__(self, opt: OptionalService | None = None) -> None:
+                self.opt = opt
+
+        container.register(Service)
+        assert container.resolve(Service).opt is None
+
+        # 执行
+        container.register(OptionalService)
+
+        # 断言
+        assert isinstance(container.resolve(Service).opt, OptionalService)
+
+    def test_factory_analysis_cached_across_containers(self) -> None:
+        """测试工厂依赖分析结果按工厂缓存, 不同容器共享."""
+        # 准备
+        from symphra_container import Container
+
+        class Logger:
+            pass
+
+        def create_service(logger: Logger) -> object:
+            return object()
+
+        # 执行
+        first = Container()._analyze_function_dependencies(create_service)
+        second = Container()._analyze_function_dependencies(create_service)
+
+        # 断言
+        assert first is second
+        assert [dep.service_key for dep in first] == [Logger]
+
+    def test_positional_dependencies(self, container) -> None:
+        """测试必需的位置依赖按位置传参, 关键字依赖仍按名称传参."""
+
+        # 准备
+        class Logger:
+            pass
+
+        class Config:
+            pass
+
+        class Service:
+            def __init__(self, logger: Logger, config: Config) -> None:
+                self.logger = logger
+                self.config = config
+
+        def create_service(*, logger: Logger) -> Service:
+            return Service(logger, Config())
+
+        container.register(Logger)
+        container.register(Config)
+        container.register(Service)
+        container.register_factory("keyword", create_service)
+
+        # 执行
+        service = container.resolve(Service)
+        keyword_service = container.resolve("keyword")
+
+        # 断言
+        assert isinstance(service.logger, Logger)
+        assert isinstance(service.config, Config)
+        assert container.get_registration(Service)._positional_deps == (Logger, Config)
+        assert isinstance(keyword_service.logger, Logger)
+        assert container.get_registration("keyword")._positional_deps is None
+
+    def test_compiled_resolver(self, container, monkeypatch) -> None:
+        """测试 compile() 生成的专用创建函数绕过通用解析循环."""
+
+        # 准备
+        class Logger:
+            pass
+
+        def create_service(*, logger: Logger) -> dict:
+            return {"logger": logger}
+
+        container.register(Logger)
+        container.register_factory("service", create_service)
+        container.compile()
+        monkeypatch.setattr(container, "_resolve_plan", None)
+
+        # 执行
+        service = container.resolve("service")
+
+        # 断言
+        assert isinstance(service["logger"], Logger)
+        assert container.get_registration("service")._compiled_resolver is not None
+
+    def test_compiled_resolver_wraps_errors_and_invalidates(self, container) -> None:
+        """测试生成的创建函数包装工厂异常, 且在注册表变化后失效."""
+        from symphra_container import ResolutionError
+
+        # 准备
+        class Logger:
+            pass
+
+        def failing_factory(logger: Logger) -> object:
+            msg = "boom"
+            raise ValueError(msg)
+
+        container.register(Logger)
+        container.register_factory("service", failing_factory)
+        container.compile()
+
+        # 执行 & 断言
+        with pytest.raises(ResolutionError):
+            container.resolve("service")
+
+        container.register_instance("other", 1)
+        with pytest.raises(ResolutionError):
+            container.resolve("service")
+        assert container.get_registration("service")._compiled_resolver is None
+
+
+    def test_cached_singleton_dependency_read_from_store(self, container) -> None:
+        """测试已缓存的单例依赖直接读取单例存储, 存在前置拦截器时仍经过 resolve."""
+
+        # 准备
+        class Logger:
+            pass
+
+        class Service:
+            def __init__(self, logger: Logger) -> None:
+                self.logger = logger
+
+        container.register(Logger, lifetime=Lifetime.SINGLETON)
+        container.register(Service)
+        logger = container.resolve(Logger)
+        original = container.resolve
+        calls = []
+
+        def counting_resolve(key):
+            calls.append(key)
+            return original(key)
+
+        container.resolve = counting_resolve
+        seen = []
+
+        # 执行
+        first = container.resolve(Service)
+        container.add_interceptor("before", lambda key, registration: seen.append(key) or True)
+        second = container.resolve(Service)
+
+        # 断言
+        assert first.logger is logger
+        assert second.logger is logger
+        assert calls == [Service, Service, Logger]
+        assert seen == [Service, Logger]
+
+
+class TestTypeNameIndex:
+    """类型名索引测试."""
+
+    def test_string_dependency_resolved_by_name(self, container) -> None:
+        """测试字符串形式的依赖通过类名索引解析."""
+
+        # 准备
+        class Logger:
+            pass
+
+        def create_service(logger: "Logger") -> object:
+            return logger
+
+        container.register(Logger)
+        container.register_factory("service", create_service)
+
+        # 执行 & 断言
+        assert isinstance(container.resolve("service"), Logger)
+
+    def test_string_dependency_normalized_once(self, container, monkeypatch) -> None:
+        """测试字符串依赖只在编译解析计划时规范化一次."""
+
+        # 准备
+        class Logger:
+            pass
+
+        def create_service(logger: "Logger") -> object:
+            return logger
+
+        container.register(Logger)
+        container.register_factory("service", create_service)
+        container.resolve("service")
+
+        def fail_lookup(name):
+            msg = "lookup should not run again"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(container, "_lookup_type_by_name", fail_lookup)
+
+        # 执行
+        result = container.resolve("service")
+
+        # 断言
+        assert isinstance(result, Logger)
+        plan = container.get_registration("service")._resolution_plan
+        assert [service_key for _, _, service_key, _ in plan] == [Logger]
+
+    def test_unregister_removes_name_from_index(self, container) -> None:
+        """测试注销服务后类型名索引同步更新."""
+
+        # 准备
+        class Logger:
+            pass
+
+        container.register(Logger)
+        assert container._lookup_type_by_name("Logger") is Logger
+
+        # 执行
+        container.unregister(Logger)
+
+        # 断言
+        assert container._lookup_type_by_name("Logger") is None
@@ -3,6 +3,8 @@
 测试 LifetimeManager,SingletonStore 和 ScopedStore.
 """
 
+import pytest
+
 from symphra_container.lifetime_manager import LifetimeManager, ScopedStore, SingletonStore
 from symphra_container.types import Lifetime
 
@@ -165,6 +167,189 @@ class TestLifetimeManager:
 
         manager.exit_scope("scope_1")
 
+    def test_cached_none_instance_not_recreated(self) -> None:
+        """测试缓存的 None 实例被直接返回, 不会再次调用工厂."""
+        manager = LifetimeManager()
+        manager.enter_scope("scope_1")
+        calls = []
+
+        def factory() -> None:
+            calls.append(1)
+
+        for lifetime in (Lifetime.SINGLETON, Lifetime.SCOPED):
+            manager.set_instance("key1", None, lifetime)
+            assert manager.get_instance("key1", lifetime, factory) is None
+        assert calls == []
+
+        manager.exit_scope("scope_1")
+
+    def test_scoped_instance_without_scope(self) -> None:
+        """测试没有活跃作用域时作用域实例既不创建也不存储."""
+        manager = LifetimeManager()
+        calls = []
+
+        manager.set_instance("key1", "value1", Lifetime.SCOPED)
+        result = manager.get_instance("key1", Lifetime.SCOPED, lambda: calls.append(1))
+
+        assert result is None
+        assert calls == []
+
+    def test_uncached_lifetimes_not_stored(self) -> None:
+        """测试 TRANSIENT 和 FACTORY 实例不会被存储或复用."""
+        manager = LifetimeManager()
+
+        for lifetime in (Lifetime.TRANSIENT, Lifetime.FACTORY):
+            manager.set_instance("key1", "value1", lifetime)
+            assert manager.get_instance("key1", lifetime, lambda: "new") is None
+        assert not manager._singleton_store.has("key1")
+
+    def test_stores_use_slots(self) -> None:
+        """测试管理器与存储对象使用 __slots__, 不创建实例字典."""
+        for obj in (LifetimeManager(), SingletonStore(), ScopedStore("scope_1")):
+            assert not hasattr(obj, "__dict__")
+
+    def test_scope_store_reused_after_exit(self) -> None:
+        """测试离开作用域后存储对象被清空并复用."""
+        manager = LifetimeManager()
+        first = manager.enter_scope("scope_1")
+        manager.set_instance("key1", "value1", Lifetime.SCOPED)
+        manager.exit_scope("scope_1")
+
+        second = manager.enter_scope("scope_2")
+
+        assert second is first
+        assert second.scope_id == "scope_2"
+        assert manager.get_instance("key1", Lifetime.SCOPED) is None
+        manager.exit_scope("scope_2")
+
+    def test_remove_instance_disposes_everywhere(self) -> None:
+        """测试移除实例时从单例与作用域中删除, 并忽略释放失败与不可调用的 dispose 属性."""
+        manager = LifetimeManager()
+        disposed = []
+
+        class Resource:
+            def __init__(self, fail: bool) -> None:
+                self.fail = fail
+
+            def dispose(self) -> None:
+                disposed.append(self)
+                if self.fail:
+                    raise RuntimeError("dispose failed")
+
+        class Plain:
+            dispose = None
+
+        singleton = Resource(fail=True)
+        scoped = Resource(fail=False)
+        manager.set_instance("key1", singleton, Lifetime.SINGLETON)
+        manager.enter_scope("scope_1")
+        manager.set_instance("key1", scoped, Lifetime.SCOPED)
+        manager.set_instance("key2", Plain(), Lifetime.SCOPED)
+
+        manager.remove_instance("key1")
+        manager.remove_instance("key2")
+
+        assert disposed == [singleton, scoped]
+        assert manager.get_instance("key1", Lifetime.SINGLETON) is None
+        assert manager.get_instance("key1", Lifetime.SCOPED) is None
+        assert manager.get_instance("key2", Lifetime.SCOPED) is None
+        manager.exit_scope("scope_1")
+
+    def test_current_scope_isolated_per_task(self) -> None:
+        """测试并发任务各自拥有独立的当前作用域."""
+        import asyncio
+
+        manager = LifetimeManager()
+
+        async def handle(scope_id: str) -> object:
+            manager.enter_scope(scope_id)
+            manager.set_instance("key1", scope_id, Lifetime.SCOPED)
+            await asyncio.sleep(0)
+            value = manager.get_instance("key1", Lifetime.SCOPED)
+            manager.exit_scope(scope_id)
+            return value
+
+        async def main() -> list[object]:
+            return await asyncio.gather(handle("scope_1"), handle("scope_2"))
+
+        assert asyncio.run(main()) == ["scope_1", "scope_2"]
+        assert not manager.has_active_scope()
+
+    def test_stale_context_does_not_see_reused_store(self) -> None:
+        """测试作用域内复制的上下文在离开作用域后不会看到被复用的存储."""
+        import contextvars
+
+        manager = LifetimeManager()
+        manager.enter_scope("scope_1")
+        stale_context = contextvars.copy_context()
+        manager.exit_scope("scope_1")
+
+        manager.enter_scope("scope_2")
+        manager.set_instance("key1", "value2", Lifetime.SCOPED)
+
+        assert stale_context.run(manager.has_active_scope) is False
+        assert stale_context.run(manager.get_instance, "key1", Lifetime.SCOPED) is None
+        manager.exit_scope("scope_2")
+
+    def test_exit_nested_scope_restores_outer_scope(self) -> None:
+        """测试离开嵌套作用域后恢复外层作用域, 而不是清空当前作用域."""
+        manager = LifetimeManager()
+        outer = manager.enter_scope("outer")
+        inner = manager.enter_scope("inner")
+        assert manager.current_scope is inner
+
+        manager.exit_scope("inner")
+        assert manager.current_scope is outer
+
+        manager.exit_scope("outer")
+        assert not manager.has_active_scope()
+
+    def test_interleaved_scopes_of_different_managers(self) -> None:
+        """测试不同管理器交错离开作用域时互不影响."""
+        first = LifetimeManager()
+        second = LifetimeManager()
+        first_scope = first.enter_scope("first")
+        second_scope = second.enter_scope("second")
+
+        first.exit_scope("first")
+        assert not first.has_active_scope()
+        assert second.current_scope is second_scope
+
+        second.exit_scope("second")
+        assert not second.has_active_scope()
+        assert first_scope is not second_scope
+
+    def test_managers_share_one_context_variable(self) -> None:
+        """测试所有管理器共用模块级上下文变量, 离开作用域后不再保留条目."""
+        from symphra_container.lifetime_manager import _CURRENT_SCOPES
+
+        managers = [LifetimeManager() for _ in range(3)]
+        for index, manager in enumerate(managers):
+            manager.enter_scope(f"scope_{index}")
+
+        assert all(manager in _CURRENT_SCOPES.get() for manager in managers)
+
+        for index, manager in reversed(list(enumerate(managers))):
+            manager.exit_scope(f"scope_{index}")
+
+        assert not any(manager in _CURRENT_SCOPES.get() for manager in managers)
+
+    def test_current_scopes_mapping_is_read_only(self) -> None:
+        """测试上下文变量中的作用域映射只读, 原地写入不会泄漏到其他上下文."""
+        import contextvars
+
+        from symphra_container.lifetime_manager import _CURRENT_SCOPES
+
+        manager = LifetimeManager()
+        default = contextvars.Context().run(_CURRENT_SCOPES.get)
+        manager.enter_scope("scope_1")
+
+        with pytest.raises(TypeError):
+            default[manager] = None  # type: ignore[index]
+        with pytest.raises(TypeError):
+            _CURRENT_SCOPES.get()[manager] = None  # type: ignore[index]
+        manager.exit_scope("scope_1")
+
     def test_clear_all(self) -> None:
         """测试清空所有."""
         manager = LifetimeManager()
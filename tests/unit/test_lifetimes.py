@@ -70,6 +70,44 @@ class TestSingletonLifetime:
         assert b1 is b2
         assert a1 is not b1
 
+    def test_singleton_cache_hit_still_runs_before_interceptors(self, container) -> None:
+        """测试单例缓存命中时前置拦截器仍然执行."""
+
+        # 准备
+        class Service:
+            pass
+
+        seen = []
+        container.register(Service, lifetime=Lifetime.SINGLETON)
+        first = container.resolve(Service)
+        container.add_interceptor("before", lambda key, registration: seen.append(key) or True)
+
+        # 执行
+        second = container.resolve(Service)
+
+        # 断言
+        assert first is second
+        assert seen == [Service]
+
+    def test_singleton_none_instance_cached(self, container) -> None:
+        """测试值为 None 的单例也会被缓存."""
+        # 准备
+        calls = []
+
+        def factory() -> None:
+            calls.append(1)
+
+        container.register_factory("nothing", factory, lifetime=Lifetime.SINGLETON)
+
+        # 执行
+        first = container.resolve("nothing")
+        second = container.resolve("nothing")
+
+        # 断言
+        assert first is None
+        assert second is None
+        assert len(calls) == 1
+
 
 class TestTransientLifetime:
     """瞬时生命周期测试."""
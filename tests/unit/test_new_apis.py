@@ -204,6 +204,59 @@ class TestAlias:
         # 应该是同一个实例
         assert service1 is service2
 
+    @pytest.mark.asyncio
+    async def test_resolve_async_by_alias(self) -> None:
+        """测试通过别名异步解析."""
+        container = Container()
+        container.register(SimpleService, lifetime=Lifetime.SINGLETON)
+        container.alias(SimpleService, "my_service")
+
+        service1 = await container.resolve_async("my_service")
+        service2 = await container.resolve_async(SimpleService)
+
+        assert service1 is service2
+
+    def test_alias_follows_reregistration(self) -> None:
+        """测试别名随服务的注销和重新注册同步更新."""
+        container = Container()
+        container.register(SimpleService)
+        container.alias(SimpleService, "my_service")
+
+        container.unregister(SimpleService)
+        assert not container.is_registered("my_service")
+        with pytest.raises(ServiceNotFoundError):
+            container.resolve("my_service")
+
+        container.register(DatabaseService, key=SimpleService)
+        assert container.is_registered("my_service")
+        assert isinstance(container.resolve("my_service"), DatabaseService)
+
+    def test_alias_repointed_to_another_service(self) -> None:
+        """测试别名重新指向其他服务."""
+        container = Container()
+        container.register(SimpleService)
+        container.register(DatabaseService)
+        container.alias(SimpleService, "service")
+        container.alias(DatabaseService, "service")
+
+        container.unregister(SimpleService)
+
+        assert isinstance(container.resolve("service"), DatabaseService)
+
+    def test_alias_takes_precedence_over_same_named_key(self) -> None:
+        """测试别名与直接注册的字符串键同名时, 解析优先使用别名."""
+        container = Container()
+        container.register(SimpleService)
+
+        # 先注册同名键再创建别名
+        container.register(DatabaseService, key="service")
+        container.alias(SimpleService, "service")
+        assert isinstance(container.resolve("service"), SimpleService)
+
+        # 先创建别名再注册同名键
+        container.register(DatabaseService, key="service", override=True)
+        assert isinstance(container.resolve("service"), SimpleService)
+
     def test_alias_nonexistent_service_raises(self) -> None:
         """测试为不存在的服务创建别名抛出异常."""
         container = Container()
@@ -273,6 +326,16 @@ class TestShorthandSyntax:
         service = container[SimpleService]
         assert isinstance(service, SimpleService)
 
+    def test_getitem_uses_traced_resolve(self) -> None:
+        """测试启用性能追踪时 __getitem__ 同样计入解析统计."""
+        container = Container(enable_performance_tracking=True)
+        container.register(SimpleService)
+
+        container[SimpleService]
+        container[SimpleService]
+
+        assert container.get_performance_stats()["total_resolutions"] == 2
+
     def test_setitem_register(self) -> None:
         """测试 __setitem__ 注册服务."""
         container = Container()
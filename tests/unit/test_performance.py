@@ -3,6 +3,10 @@
 测试性能指标收集,服务键索引和分辨率计时器的功能.
 """
 
+from collections import Counter
+
+import pytest
+
 from symphra_container import (
     Container,
     Lifetime,
@@ -115,6 +119,67 @@ class TestPerformanceMetrics:
         expected_total = 0.001 + 0.002 + 0.003
         assert abs(metrics.total_resolution_time - expected_total) < 1e-6
 
+    def test_recorded_times_bounded(self, monkeypatch) -> None:
+        """测试只保留最近的解析耗时, 总耗时与平均值仍覆盖全部记录."""
+        # 准备
+        from symphra_container import performance
+
+        monkeypatch.setattr(performance, "_MAX_RECORDED_TIMES", 2)
+        metrics = PerformanceMetrics()
+
+        # 执行
+        for elapsed in (0.001, 0.002, 0.003):
+            metrics.record_resolution("ServiceA", elapsed)
+
+        # 断言
+        assert list(metrics.resolution_times) == [0.002, 0.003]
+        assert abs(metrics.total_resolution_time - 0.006) < 1e-9
+        assert abs(metrics.average_resolution_time - 0.002) < 1e-9
+
+    def test_resolution_keys_counted_in_batches(self, monkeypatch) -> None:
+        """测试服务键先缓冲再批量计数, 读取统计时合并剩余缓冲."""
+        # 准备
+        from symphra_container import performance
+
+        monkeypatch.setattr(performance, "_KEY_FLUSH_THRESHOLD", 2)
+        metrics = PerformanceMetrics()
+
+        # 执行
+        for key in ("ServiceA", "ServiceB", "ServiceA"):
+            metrics.record_resolution(key, 0.001)
+
+        # 断言
+        assert metrics._resolution_by_key == {"ServiceA": 1, "ServiceB": 1}
+        assert metrics._pending_keys == ["ServiceA"]
+        assert metrics.get_stats()["resolutions_by_key"] == {"ServiceA": 2, "ServiceB": 1}
+        assert metrics._pending_keys == []
+
+    def test_flush_detaches_buffer_before_merging(self) -> None:
+        """测试合并计数前先换上新缓冲区, 合并期间追加到旧缓冲区之外的键不会丢失."""
+        # 准备
+        metrics = PerformanceMetrics()
+        metrics.record_resolution("ServiceA", 0.001)
+        detached = metrics._pending_keys
+        concurrent_keys: list[str] = []
+
+        class AppendingCounter(Counter):
+            def update(self, *args: object, **kwargs: object) -> None:
+                # 模拟另一个线程在合并期间记录解析
+                while concurrent_keys:
+                    metrics.record_resolution(concurrent_keys.pop(), 0.001)
+                super().update(*args, **kwargs)
+
+        metrics._resolution_by_key = AppendingCounter()
+        concurrent_keys.append("ServiceB")
+
+        # 执行
+        metrics._flush_keys()
+
+        # 断言
+        assert detached == ["ServiceA"]
+        assert metrics._pending_keys == ["ServiceB"]
+        assert metrics.resolution_by_key == {"ServiceA": 1, "ServiceB": 1}
+
     def test_resolution_by_key_tracking(self) -> None:
         """测试按键追踪解析次数."""
         # 准备
@@ -322,6 +387,42 @@ class TestServiceKeyIndex:
         assert keys == ["ServiceA"]
 
 
+    def test_freeze(self) -> None:
+        """测试冻结后的索引保留内容且拒绝修改."""
+        # 准备
+        index = ServiceKeyIndex()
+        index.add("ServiceA", {"id": 1})
+        index.add("ServiceB", {"id": 2})
+        index.remove("ServiceB")
+
+        # 执行
+        result = index.freeze()
+
+        # 断言
+        assert result is index
+        assert index.frozen
+        assert index.get("ServiceA") == {"id": 1}
+        assert index.keys() == ["ServiceA"]
+        for mutate in (lambda: index.add("ServiceC", {}), lambda: index.remove("ServiceA"), index.clear):
+            with pytest.raises(RuntimeError, match="frozen"):
+                mutate()
+
+
+class TestSlots:
+    """性能相关对象的槽位测试."""
+
+    @pytest.mark.parametrize("cls", [PerformanceMetrics, ServiceKeyIndex, ResolutionTimer])
+    def test_no_instance_dict(self, cls) -> None:
+        """测试对象使用 __slots__, 不创建实例字典."""
+        # 执行
+        obj = cls()
+
+        # 断言
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unknown = 1
+
+
 class TestResolutionTimer:
     """解析计时器测试."""
 
@@ -343,6 +444,7 @@ class TestResolutionTimer:
 
         # 断言
         assert timer.end_time is not None
+        assert isinstance(timer.end_time, int)
         assert timer.elapsed_time > 0.0
 
     def test_elapsed_time_measurement(self) -> None:
@@ -387,6 +489,28 @@ class TestContainerPerformanceIntegration:
 
         # 断言
         assert stats["total_resolutions"] == 0
+        # 未启用追踪时不安装追踪包装
+        assert "resolve" not in vars(container)
+
+    @pytest.mark.asyncio
+    async def test_performance_tracking_async(self) -> None:
+        """测试异步解析的性能跟踪."""
+        # 准备
+        container = Container(enable_performance_tracking=True)
+
+        class Service:
+            pass
+
+        container.register(Service, lifetime=Lifetime.SINGLETON)
+
+        # 执行
+        await container.resolve_async(Service)
+        await container.resolve_async(Service)
+        stats = container.get_performance_stats()
+
+        # 断言
+        assert stats["total_resolutions"] == 2
+        assert stats["cache_hits"] == 1
 
     def test_performance_tracking_enabled(self) -> None:
         """测试启用性能跟踪."""
@@ -193,5 +193,51 @@ class TestUnifiedContainer:
         assert "AsyncService" in repr_str
 
 
+    @pytest.mark.asyncio
+    async def test_mixed_interceptors_in_async_resolution(self) -> None:
+        """测试异步解析时同步与异步拦截器混合执行."""
+        container = Container()
+        container.register_factory("value", lambda: 1)
+        seen = []
+
+        async def async_after(key, instance):
+            await asyncio.sleep(0)
+            return instance + 1
+
+        container.add_interceptor("before", lambda key, registration: seen.append(key) or True)
+        container.add_interceptor("after", async_after)
+        container.add_interceptor("after", lambda key, instance: instance * 10)
+
+        assert await container.resolve_async("value") == 20
+        assert seen == ["value"]
+        assert [is_coroutine for _, is_coroutine in container._after_interceptors] == [True, False]
+        assert container._async_interceptor_types == {"after"}
+
+    @pytest.mark.asyncio
+    async def test_sync_interceptors_inlined_in_async_resolution(self) -> None:
+        """测试全部为同步拦截器时异步解析直接内联执行, 语义与异步执行器一致."""
+        container = Container()
+        container.register_factory("value", lambda: 1)
+        container.register_factory("broken", lambda: -1)
+        seen = []
+        errors = []
+
+        def reject_negative(key, instance):
+            if instance < 0:
+                raise ValueError(key)
+
+        container.add_interceptor("before", lambda key, registration: seen.append(key))
+        container.add_interceptor("after", lambda key, instance: instance + 1)
+        container.add_interceptor("after", reject_negative)
+        container.add_interceptor("error", lambda key, error: errors.append(type(error)))
+
+        assert await container.resolve_async("value") == 2
+        with pytest.raises(ResolutionError):
+            await container.resolve_async("broken")
+        assert seen == ["value", "broken"]
+        assert errors == [ValueError]
+        assert not container._async_interceptor_types
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
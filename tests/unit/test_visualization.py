@@ -272,3 +272,89 @@ def test_diagnose_container_lifecycle_distribution():
     assert report.transient_count == 3
     assert report.scoped_count == 2
     assert report.total_services == 10
+
+
+def test_diagnose_container_detects_cycles_once_per_component():
+    """测试诊断将每个循环依赖分量只报告一次."""
+
+    class CycleA:
+        pass
+
+    class CycleB:
+        pass
+
+    class SelfRef:
+        pass
+
+    def make_a(b: CycleB) -> CycleA:
+        return CycleA()
+
+    def make_b(a: CycleA) -> CycleB:
+        return CycleB()
+
+    def make_self(s: SelfRef) -> SelfRef:
+        return SelfRef()
+
+    container = Container()
+    container.register(Logger, lifetime=Lifetime.SINGLETON)
+    container.register_factory(CycleA, make_a)
+    container.register_factory(CycleB, make_b)
+    container.register_factory(SelfRef, make_self)
+
+    report = diagnose_container(container)
+
+    assert len(report.circular_dependencies) == 2
+    assert (CycleA, CycleB) in report.circular_dependencies
+    assert (SelfRef,) in report.circular_dependencies
+    assert report.health_score < 100.0
+
+
+def test_tarjan_scc_numba_kernel_matches_python():
+    """测试 numba 内核与纯 Python 实现得到相同的强连通分量."""
+    pytest.importorskip("numba")
+    import random
+
+    from symphra_container import _scc
+
+    rng = random.Random(42)
+    node_count = 300
+    all_succs: list[int] = []
+    succ_ranges: list[range] = []
+    for _ in range(node_count):
+        start = len(all_succs)
+        all_succs.extend(rng.randrange(node_count) for _ in range(rng.randrange(3)))
+        succ_ranges.append(range(start, len(all_succs)))
+
+    expected = _scc.tarjan_scc(all_succs, succ_ranges)
+
+    kernel = _scc.load_numba_scc_kernel()
+    assert kernel is not None
+    assert _scc.tarjan_scc_numba(kernel, all_succs, succ_ranges) == expected
+
+
+def test_registration_dependencies_cached_per_version(monkeypatch):
+    """测试依赖反射结果按注册版本缓存, 重新注册后失效."""
+    from symphra_container import visualization
+
+    container = Container()
+    container.register(Logger)
+    container.register(Database)
+
+    calls = []
+    original = visualization._extract_dependencies
+
+    def counting_extract(factory):
+        calls.append(factory)
+        return original(factory)
+
+    monkeypatch.setattr(visualization, "_extract_dependencies", counting_extract)
+
+    visualize_container(container)
+    diagnose_container(container)
+    visualize_container(container, format="mermaid")
+    assert len(calls) == 2
+
+    # 覆盖注册生成新版本, 需要重新反射
+    container.register(Database, override=True)
+    assert visualization._registration_dependencies(container._registrations[Database]) == (Logger,)
+    assert len(calls) == 3